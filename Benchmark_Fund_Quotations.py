@@ -0,0 +1,439 @@
+"""
+.SYNOPSIS
+    Program to benchmark quotation to investment wallet pipeline offline.
+
+.DESCRIPTION
+    Program generates synthetic funds' quotations and synthetic investments (the same structure as Investments.json),
+    injects them into AnalizyFund / ListOfFunds instances without any web request and measures each stage
+    of the pipeline, which is invoked by Main_Fund_Quotations.py:
+        - Indexing <- synthetic quotation set for each fund and indexed by date
+        - Lookup <- random exact date and nearest price lookups
+        - DayByDay <- InvestmentWallet created, each investment calculates DayByDay results
+            (including first calculation of investment results)
+        - RefundAnalysis <- refund analysis of each investment
+        - Results <- investment results calculated again for each investment
+        - Serialization <- DayByDay CSV files, quotations in CSV and JSON format and daily report saved
+            to temporary directory, each output is measured separately
+        - TableRendering <- investment results, refund analysis and funds' stats rendered as tables
+
+    Benchmark is invoked for each combination of provided funds count and quotation years.
+    Each stage is measured with elapsed time and CPU time. Peak memory allocated during each stage
+    is measured in the second run of the same scenario, as memory tracing slows down the program.
+    Generated data is the same for the same seed, so results of different runs can be compared.
+
+.INPUTS
+        --Funds <- list of synthetic funds count to benchmark (1 - 10000)
+
+        --Years <- list of quotation history lengths in years to benchmark (1 - 25)
+
+        --Investments <- number of synthetic investments
+
+        --Funds_Per_Investment <- number of funds bought in each investment
+
+        --Orders_Per_Fund <- number of orders of each fund in investment
+
+        --Lookups <- number of random price lookups
+
+        --Seed <- seed of random generator for synthetic data
+
+        --DayByDay_Engine {NumPy,Python,Batch} <- engine used to calculate DayByDay results
+
+        --DayByDay_Processes <- number of processes calculating DayByDay results with "Batch" engine
+
+        --Skip_Memory <- peak memory is not measured, each scenario is invoked only once
+
+        --Output_Directory <- path to the folder where benchmark results will be saved
+
+        --Compare <- path to the results file of previous benchmark, to display time ratio for each stage
+
+.OUTPUTS
+    JSON file "<yyyy-MM-dd_HH-mm-ss>_Benchmark.json" in Output_Directory with environment details,
+    provided params and measurements of each stage for each scenario.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+
+import io
+import os
+import gc
+import json
+import argparse
+import datetime
+import platform
+import tempfile
+import contextlib
+import numpy as np
+from tabulate import tabulate
+from Dependencies.Class_ListOfFund import ListOfFunds
+from Dependencies.Class_InvestmentWallet import InvestmentWallet
+from Dependencies.Class_AnalizyFund import AnalizyFund
+from Dependencies.Class_Investment import Investment
+from Dependencies.Class_StageTimer import StageTimer
+from Dependencies.Function_SyntheticData import *
+
+programSynopsis = """
+Program to benchmark quotation to investment wallet pipeline offline.
+Synthetic funds' quotations and investments are generated and each stage of the pipeline is measured.
+"""
+
+benchmarkFileSuffix = "Benchmark"
+maxFundsCount = 10000
+maxYears = 25
+
+parser = argparse.ArgumentParser(description=programSynopsis)
+parser.add_argument(
+    "--Funds",
+    type=int,
+    nargs="+",
+    default=[1, 10, 100],
+    help=f"List of synthetic funds count to benchmark (1 - {maxFundsCount}).",
+)
+parser.add_argument(
+    "--Years",
+    type=int,
+    nargs="+",
+    default=[1, 10, 25],
+    help=f"List of quotation history lengths in years to benchmark (1 - {maxYears}).",
+)
+parser.add_argument(
+    "--Investments",
+    type=int,
+    default=10,
+    help="Number of synthetic investments.",
+)
+parser.add_argument(
+    "--Funds_Per_Investment",
+    type=int,
+    default=4,
+    help="Number of funds bought in each investment.",
+)
+parser.add_argument(
+    "--Orders_Per_Fund",
+    type=int,
+    default=3,
+    help="Number of orders of each fund in investment.",
+)
+parser.add_argument(
+    "--Lookups",
+    type=int,
+    default=100000,
+    help="Number of random price lookups.",
+)
+parser.add_argument(
+    "--Seed",
+    type=int,
+    default=0,
+    help="Seed of random generator for synthetic data.",
+)
+parser.add_argument(
+    "--DayByDay_Engine",
+    choices=[Investment.EngineNumPy, Investment.EnginePython, Investment.EngineBatch],
+    default=Investment.EngineNumPy,
+    help="Engine used to calculate DayByDay results.",
+)
+parser.add_argument(
+    "--DayByDay_Processes",
+    type=int,
+    default=1,
+    help="Number of processes calculating DayByDay results with Batch engine.",
+)
+parser.add_argument(
+    "--Skip_Memory",
+    action="store_true",
+    help="Do not measure peak memory, each scenario is invoked only once.",
+)
+parser.add_argument(
+    "--Output_Directory",
+    default="Output_Benchmark",
+    help="Path to the folder where benchmark results will be saved.",
+)
+parser.add_argument(
+    "--Compare",
+    help="Path to the results file of previous benchmark, to display time ratio for each stage.",
+)
+
+
+def main(options):
+
+    setCorrectPath()
+
+    validateOptions(options)
+
+    # Invoke benchmark for each combination of funds count and quotation years
+    scenarios = []
+    for fundsCount in options.Funds:
+        for years in options.Years:
+            scenarios.append(runScenario(fundsCount, years, options))
+
+    destinationFilePath = saveBenchmarkResults(scenarios, options)
+
+    printBenchmarkResults(scenarios, options)
+
+    print(f"Benchmark results saved to {destinationFilePath}")
+
+    exit(0)
+
+
+def setCorrectPath() -> None:
+
+    file_path = os.path.realpath(__file__)
+    file_path = "/".join(file_path.split("/")[:-1])
+    os.chdir(file_path)
+
+    return None
+
+
+def validateOptions(options: argparse.Namespace) -> None:
+
+    # Check if funds count and years are within supported range
+    if [item for item in options.Funds if not 1 <= item <= maxFundsCount]:
+        parser.error(f"--Funds values must be between 1 and {maxFundsCount}")
+
+    if [item for item in options.Years if not 1 <= item <= maxYears]:
+        parser.error(f"--Years values must be between 1 and {maxYears}")
+
+    return None
+
+
+def runScenario(fundsCount: int, years: int, options: argparse.Namespace) -> dict[str, any]:
+
+    # Generate synthetic quotation for each fund and investments which are using them
+    quotations = {
+        fundID: generateSyntheticQuotation(fundID, years, options.Seed)
+        for fundID in [f"SYN{i:05d}" for i in range(1, fundsCount + 1)]
+    }
+    investments = generateSyntheticInvestments(
+        quotations,
+        options.Investments,
+        options.Funds_Per_Investment,
+        options.Orders_Per_Fund,
+        options.Seed
+    )
+    lookups = generateSyntheticLookups(quotations, options.Lookups, options.Seed)
+
+    # Measure time of each stage without memory tracing
+    stages = runPipeline(quotations, investments, lookups, options, traceMemory=False)
+
+    # Measure peak memory of each stage in separate run, stages are invoked in the same order
+    if not options.Skip_Memory:
+        for stage, memoryStage in zip(
+            stages,
+            runPipeline(quotations, investments, lookups, options, traceMemory=True)
+        ):
+            stage["PeakMemoryBytes"] = memoryStage["PeakMemoryBytes"]
+
+    # return scenario details with measured stages
+    return {
+        "Funds": fundsCount,
+        "Years": years,
+        "Quotations": sum(len(item["Price"]) for item in quotations.values()),
+        "Investments": len(investments),
+        "Stages": stages
+    }
+
+
+def runPipeline(
+    quotations: dict[str, dict[str, str | list[dict[str, str | float]]]],
+    investments: dict[str, dict],
+    lookups: list[tuple[str, datetime.date]],
+    options: argparse.Namespace,
+    traceMemory: bool
+) -> list[dict[str, str | float | int | None]]:
+
+    # Collect objects left by previous run, so they are not included in measurements
+    gc.collect()
+    timer = StageTimer(TraceMemory=traceMemory)
+
+    # All outputs are saved to temporary directory, which is removed after the run,
+    # DayByDay files are resumed and written only there, not in directory from config file
+    with tempfile.TemporaryDirectory() as outputDirectory:
+
+        # Save synthetic investments in the same structure as Investments.json
+        investmentsFilePath = f"{outputDirectory}/Investments.json"
+        with open(investmentsFilePath, "w") as investmentsFile:
+            investmentsFile.write(json.dumps(investments, indent=4))
+
+        # Create list of funds without downloading any data,
+        # latest details are calculated from quotation, so fund page is not required
+        Funds = ListOfFunds(
+            [generateSyntheticFundURL(fundID) for fundID in quotations],
+            LatestDetailsSource=AnalizyFund.LatestDetailsFromQuotation
+        )
+
+        with timer.measure("Indexing"):
+            for fundID in quotations:
+                Funds.getFundByID(fundID).setHistoricalQuotation(quotations[fundID])
+
+        with timer.measure("Lookup"):
+            for fundID, date in lookups:
+                fund = Funds.getFundByID(fundID)
+                fund.getFundPriceOnDate(date.strftime("%Y-%m-%d"))
+                fund.getNearestFundPrice(date)
+
+        with timer.measure("DayByDay"):
+            wallet = InvestmentWallet(
+                InvestmentsFilePath=investmentsFilePath,
+                FundsList=Funds,
+                DayByDayEngine=options.DayByDay_Engine,
+                MaxWorkerProcesses=options.DayByDay_Processes,
+                DayByDayDirectory=outputDirectory
+            )
+
+        with timer.measure("RefundAnalysis"):
+            for investment in wallet.Wallets.values():
+                investment.getRefundAnalysis()
+
+        with timer.measure("Results"):
+            wallet.calcWalletResults()
+
+        with timer.measure("Serialization", Output="DayByDayCSV"):
+            wallet.saveInvestmentHistoryDayByDay(outputDirectory)
+
+        with timer.measure("Serialization", Output="QuotationCSV"):
+            Funds.saveQuotationCSV(outputDirectory)
+
+        with timer.measure("Serialization", Output="QuotationJSON"):
+            Funds.saveQuotationJSON(outputDirectory)
+
+        with timer.measure("Serialization", Output="DailyReport"):
+            Funds.saveTodaysResults(outputDirectory)
+
+        # Tables are rendered to memory buffer, so console output is not measured
+        with timer.measure("TableRendering"), contextlib.redirect_stdout(io.StringIO()):
+            wallet.printInvestmentResults()
+            wallet.printRefundAnalysis()
+            Funds.printFundInfo()
+
+    timer.stop()
+
+    return timer.getStages()
+
+
+def saveBenchmarkResults(scenarios: list[dict[str, any]], options: argparse.Namespace) -> str:
+
+    # Create output directory if it does not exist
+    if not os.path.exists(options.Output_Directory):
+        os.makedirs(options.Output_Directory)
+
+    destinationFilePath = (
+        f"{options.Output_Directory}/"
+        f"{datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}_{benchmarkFileSuffix}.json"
+    )
+
+    # Open destination file and write environment details, params and scenarios dumped to JSON structure
+    with open(destinationFilePath, "w") as benchmarkJSON:
+        benchmarkJSON.write(
+            json.dumps(
+                {
+                    "Date": datetime.datetime.now().isoformat(timespec="seconds"),
+                    "Python": platform.python_version(),
+                    "NumPy": np.__version__,
+                    "Platform": platform.platform(),
+                    "Processor": platform.processor(),
+                    "CPUCount": os.cpu_count(),
+                    "Options": {
+                        key: value for key, value in vars(options).items()
+                        if key not in ["Output_Directory", "Compare"]
+                    },
+                    "Scenarios": scenarios
+                },
+                indent=4
+            )
+        )
+
+    return destinationFilePath
+
+
+def getStageKey(scenario: dict[str, any], stage: dict[str, any]) -> tuple:
+
+    # Stage is identified by scenario size, stage name and output name
+    return (scenario["Funds"], scenario["Years"], stage["Stage"], stage.get("Output", ""))
+
+
+def loadComparedStages(filePath: str | None) -> dict[tuple, dict[str, any]]:
+
+    # Nothing to compare if file was not provided
+    if not filePath:
+        return {}
+
+    # Open file with previous results and parse JSON content
+    with open(filePath, "r") as benchmarkJSON:
+        previous = json.loads(benchmarkJSON.read())
+
+    # return stages of previous benchmark by their key
+    return {
+        getStageKey(scenario, stage): stage
+        for scenario in previous["Scenarios"]
+        for stage in scenario["Stages"]
+    }
+
+
+def printBenchmarkResults(scenarios: list[dict[str, any]], options: argparse.Namespace) -> None:
+
+    # Init local variables for dataset and headers
+    comparedStages = loadComparedStages(options.Compare)
+    dataHeaders = ["Funds", "Years", "Stage", "Output", "Wall [s]", "CPU [s]", "Peak memory [MiB]"]
+    if comparedStages:
+        dataHeaders += ["Previous wall [s]", "Ratio"]
+    dataList = []
+
+    # Loop through each stage of each scenario
+    for scenario in scenarios:
+        for stage in scenario["Stages"]:
+
+            row = [
+                scenario["Funds"],
+                scenario["Years"],
+                stage["Stage"],
+                stage.get("Output", ""),
+                "{:.4f}".format(stage["WallSeconds"]),
+                "{:.4f}".format(stage["CPUSeconds"]),
+                (
+                    "{:.2f}".format(stage["PeakMemoryBytes"] / 2**20)
+                    if stage["PeakMemoryBytes"] != None else ""
+                )
+            ]
+
+            # Add time of the same stage from previous benchmark and ratio between them
+            if comparedStages:
+                previous = comparedStages.get(getStageKey(scenario, stage))
+                if previous != None:
+                    row += [
+                        "{:.4f}".format(previous["WallSeconds"]),
+                        "{:.2f}".format(stage["WallSeconds"] / previous["WallSeconds"])
+                        if previous["WallSeconds"] else ""
+                    ]
+                else:
+                    row += ["", ""]
+
+            dataList.append(row)
+
+    # Print collected dataset as table using tabulate Library
+    print("\n")
+    print(
+        tabulate(
+            tabular_data=dataList,
+            tablefmt="github",
+            headers=dataHeaders
+        )
+    )
+    print("\n")
+
+    return None
+
+
+# Run only if this file is called
+if __name__ == "__main__":
+
+    # invoke main function with parser args
+    main(parser.parse_args())
@@ -0,0 +1,338 @@
+"""
+.SYNOPSIS
+    Program to benchmark web requests of funds' download against local stand-in server.
+
+.DESCRIPTION
+    Program generates synthetic funds' quotations and serves them with LocalQuotationServer
+    (fund page and quotation API with ETag validator, gzip compression and simulated network latency).
+    Then it measures download of all funds in following modes:
+        - BareRequests <- each fund page and quotation downloaded with separate requests.get call,
+            the same as before HTTPTransport was introduced, without connection pool and validators
+        - PooledFirstRun <- ListOfFunds with HTTPTransport and empty local quotation store,
+            all responses are downloaded and stored, validators are saved at the end of the run
+        - PooledRevalidatedRun <- ListOfFunds with the same local quotation store as the first run,
+            conditional requests receive status 304 and data is read out from the store
+
+    Each mode is invoked provided number of times, each run starts with new ListOfFunds instance.
+    Number of responses of each status returned by the server is collected for each run,
+    so it can be checked that revalidated run did not download any content.
+
+.INPUTS
+        --Funds <- number of synthetic funds (1 - 10000)
+
+        --Years <- quotation history length in years (1 - 25)
+
+        --Latency_ms <- simulated network latency of each request in milliseconds
+
+        --Concurrency <- number of funds downloaded at the same time
+
+        --Runs <- number of runs of each mode
+
+        --Seed <- seed of random generator for synthetic data
+
+        --Output_Directory <- path to the folder where benchmark results will be saved
+
+.OUTPUTS
+    JSON file "<yyyy-MM-dd_HH-mm-ss>_TransportBenchmark.json" in Output_Directory with environment details,
+    provided params and measurements of each run.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+
+import os
+import json
+import time
+import argparse
+import datetime
+import platform
+import tempfile
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from tabulate import tabulate
+from Dependencies.Class_ListOfFund import ListOfFunds
+from Dependencies.Class_AnalizyFund import AnalizyFund
+from Dependencies.Class_LocalQuotationServer import LocalQuotationServer
+from Dependencies.Function_SyntheticData import generateSyntheticQuotation
+
+programSynopsis = """
+Program to benchmark web requests of funds' download against local stand-in server.
+Synthetic funds' quotations are served locally and download with and without HTTPTransport is measured.
+"""
+
+benchmarkFileSuffix = "TransportBenchmark"
+maxFundsCount = 10000
+maxYears = 25
+
+parser = argparse.ArgumentParser(description=programSynopsis)
+parser.add_argument(
+    "--Funds",
+    type=int,
+    default=40,
+    help=f"Number of synthetic funds (1 - {maxFundsCount}).",
+)
+parser.add_argument(
+    "--Years",
+    type=int,
+    default=15,
+    help=f"Quotation history length in years (1 - {maxYears}).",
+)
+parser.add_argument(
+    "--Latency_ms",
+    type=float,
+    default=10,
+    help="Simulated network latency of each request in milliseconds.",
+)
+parser.add_argument(
+    "--Concurrency",
+    type=int,
+    default=8,
+    help="Number of funds downloaded at the same time.",
+)
+parser.add_argument(
+    "--Runs",
+    type=int,
+    default=3,
+    help="Number of runs of each mode.",
+)
+parser.add_argument(
+    "--Seed",
+    type=int,
+    default=0,
+    help="Seed of random generator for synthetic data.",
+)
+parser.add_argument(
+    "--Output_Directory",
+    default="Output_Benchmark",
+    help="Path to the folder where benchmark results will be saved.",
+)
+
+
+def main(options):
+
+    setCorrectPath()
+
+    validateOptions(options)
+
+    # Generate synthetic quotation for each fund
+    quotations = {
+        fundID: generateSyntheticQuotation(fundID, options.Years, options.Seed)
+        for fundID in [f"SYN{i:05d}" for i in range(1, options.Funds + 1)]
+    }
+
+    # Serve quotations locally, API address is restored when benchmark is finished
+    quotationsAPI = AnalizyFund.QuotationsAPI
+    with LocalQuotationServer(quotations, Latency=options.Latency_ms / 1000) as server:
+        try:
+            AnalizyFund.QuotationsAPI = server.getQuotationAPI()
+            runs = runModes(server, list(quotations), options)
+        finally:
+            AnalizyFund.QuotationsAPI = quotationsAPI
+
+    destinationFilePath = saveBenchmarkResults(runs, options)
+
+    printBenchmarkResults(runs)
+
+    print(f"Benchmark results saved to {destinationFilePath}")
+
+    exit(0)
+
+
+def setCorrectPath() -> None:
+
+    file_path = os.path.realpath(__file__)
+    file_path = "/".join(file_path.split("/")[:-1])
+    os.chdir(file_path)
+
+    return None
+
+
+def validateOptions(options: argparse.Namespace) -> None:
+
+    # Check if funds count and years are within supported range
+    if not 1 <= options.Funds <= maxFundsCount:
+        parser.error(f"--Funds value must be between 1 and {maxFundsCount}")
+
+    if not 1 <= options.Years <= maxYears:
+        parser.error(f"--Years value must be between 1 and {maxYears}")
+
+    return None
+
+
+def runModes(
+    server: LocalQuotationServer,
+    fundIDs: list[str],
+    options: argparse.Namespace
+) -> list[dict[str, str | float | int]]:
+
+    # Init local variable to return
+    runs = []
+    fundURLs = [server.getFundURL(fundID) for fundID in fundIDs]
+
+    # Measure downloads without shared transport
+    for run in range(options.Runs):
+        runs.append(
+            measureRun(server, "BareRequests", run, lambda: downloadWithRequests(fundURLs, options))
+        )
+
+    # Measure first and revalidated run of shared transport, each pair of runs uses new local store
+    for run in range(options.Runs):
+        with tempfile.TemporaryDirectory() as storeDirectory:
+            runs.append(
+                measureRun(
+                    server, "PooledFirstRun", run,
+                    lambda: downloadWithTransport(fundURLs, storeDirectory, options)
+                )
+            )
+            runs.append(
+                measureRun(
+                    server, "PooledRevalidatedRun", run,
+                    lambda: downloadWithTransport(fundURLs, storeDirectory, options)
+                )
+            )
+
+    return runs
+
+
+def measureRun(
+    server: LocalQuotationServer,
+    mode: str,
+    run: int,
+    download
+) -> dict[str, str | float | int]:
+
+    # Count only responses of measured run
+    server.resetStatuses()
+
+    startTime = time.perf_counter()
+    failedFunds = download()
+    elapsedTime = time.perf_counter() - startTime
+
+    # return measurement with number of responses of each status
+    statuses = server.getStatuses()
+    return {
+        "Mode": mode,
+        "Run": run + 1,
+        "WallSeconds": elapsedTime,
+        "Responses200": statuses.get(200, 0),
+        "Responses304": statuses.get(304, 0),
+        "FailedFunds": failedFunds
+    }
+
+
+def downloadWithRequests(fundURLs: list[str], options: argparse.Namespace) -> int:
+
+    # Download fund page and quotation of single fund with separate requests, without connection pool
+    def downloadFund(fund: AnalizyFund) -> None:
+        requests.get(fund.URL, timeout=fund.RequestTimeout).raise_for_status()
+        response = requests.get(
+            f"{AnalizyFund.QuotationsAPI}/{fund.CategoryShortCut}/{fund.ID}",
+            timeout=fund.RequestTimeout
+        )
+        response.raise_for_status()
+        response.json()
+        return None
+
+    # Download funds concurrently and count the ones which failed
+    with ThreadPoolExecutor(max_workers=options.Concurrency) as executor:
+        downloads = [
+            executor.submit(downloadFund, AnalizyFund(URL=url))
+            for url in fundURLs
+        ]
+
+    return len([download for download in downloads if download.exception() != None])
+
+
+def downloadWithTransport(fundURLs: list[str], storeDirectory: str, options: argparse.Namespace) -> int:
+
+    # Download all funds with shared transport and local store, the same as the program does
+    Funds = ListOfFunds(
+        fundURLs,
+        MaxConcurrentDownloads=options.Concurrency,
+        QuotationStoreDirectory=storeDirectory,
+        LatestDetailsSource=AnalizyFund.LatestDetailsFromPage
+    )
+    Funds.prefetch()
+    Funds.close()
+
+    return len(Funds.getFailedFunds())
+
+
+def saveBenchmarkResults(runs: list[dict[str, str | float | int]], options: argparse.Namespace) -> str:
+
+    # Create output directory if it does not exist
+    if not os.path.exists(options.Output_Directory):
+        os.makedirs(options.Output_Directory)
+
+    destinationFilePath = (
+        f"{options.Output_Directory}/"
+        f"{datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}_{benchmarkFileSuffix}.json"
+    )
+
+    # Open destination file and write environment details, params and runs dumped to JSON structure
+    with open(destinationFilePath, "w") as benchmarkJSON:
+        benchmarkJSON.write(
+            json.dumps(
+                {
+                    "Date": datetime.datetime.now().isoformat(timespec="seconds"),
+                    "Python": platform.python_version(),
+                    "Requests": requests.__version__,
+                    "Platform": platform.platform(),
+                    "CPUCount": os.cpu_count(),
+                    "Options": {
+                        key: value for key, value in vars(options).items()
+                        if key != "Output_Directory"
+                    },
+                    "Runs": runs
+                },
+                indent=4
+            )
+        )
+
+    return destinationFilePath
+
+
+def printBenchmarkResults(runs: list[dict[str, str | float | int]]) -> None:
+
+    # Init local variables for dataset and headers
+    dataHeaders = ["Mode", "Run", "Wall [s]", "Responses 200", "Responses 304", "Failed funds"]
+    dataList = [
+        [
+            run["Mode"],
+            run["Run"],
+            "{:.4f}".format(run["WallSeconds"]),
+            run["Responses200"],
+            run["Responses304"],
+            run["FailedFunds"]
+        ]
+        for run in runs
+    ]
+
+    # Print collected dataset as table using tabulate Library
+    print("\n")
+    print(
+        tabulate(
+            tabular_data=dataList,
+            tablefmt="github",
+            headers=dataHeaders
+        )
+    )
+    print("\n")
+
+    return None
+
+
+# Run only if this file is called
+if __name__ == "__main__":
+
+    # invoke main function with parser args
+    main(parser.parse_args())
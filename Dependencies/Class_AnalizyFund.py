@@ -7,10 +7,12 @@
     
 .INITIALIZATION
     By default class was meant to be a attribute of ListOfFund class
+    Constructor does not invoke any web request, fund details and historical quotation
+    are downloaded on first access or explicitly with .load()
 
 .NOTES
 
-    Version:            1.1
+    Version:            1.2
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
@@ -24,37 +26,100 @@
     2024-03-12      Stanisław Horna         getSyntheticRefundData -> getRefundAnalysis
                                             method calcs refund analysis, based on 
                                             the payments, timing and invested money
+    2026-10-17      Stanisław Horna         Quotation prices indexed by date once after download,
+                                            getFundPriceOnDate reads from the index instead of scanning the list.
+                                            getNearestFundPrice uses QuotationIndex as-of lookup (single array read out),
+                                            getNearestFundPrices batch variant added.
+                                            Web requests are invoked with configurable timeout.
+                                            Downloaded quotation merged with local QuotationStore if it is provided.
+                                            Web requests invoked by shared HTTPTransport (connection pool, compression),
+                                            not modified responses read out from local QuotationStore.
+                                            Latest details can be calculated from quotation (LatestDetailsSource),
+                                            fund page is downloaded only as a fallback.
+                                            Data is loaded lazily on first access instead of in constructor.
+                                            setHistoricalQuotation to provide quotation without web request.
+                                            Price lookups and parsed quotation rows counted in metrics registry.
+                                            Quotation can be saved to and loaded from binary QuotationArchive.
+                                            JSON and CSV quotation files streamed by OutputWriter (atomic replace),
+                                            content can be written to any file-like object with writeQuotationJSON/CSV
+                                            Raw API price list is not kept, prices are stored only in compact
+                                            QuotationIndex arrays, class uses __slots__ (all attributes declared).
+                                            JSON and CSV quotation are regenerated from the arrays on demand,
+                                            getQuotationJSON returns quotation in the same structure as the API.
+                                            Quotation response streamed and parsed incrementally (QuotationStreamParser),
+                                            entries are indexed while the response is downloaded.
+                                            Rolling performance statistics (FundStatistics) refreshed from the index,
+                                            exported in daily report and available with getStatisticsInfo.
+                                            Price calculated from quotation keeps precision of the quotation.
+                                            Quotation files can be written with shared OutputWriter,
+                                            which saves its manifest once for all files.
+                                            Local store is continued with index arrays,
+                                            quotation is not converted to the API structure for it.
+                                            Quotation archive indexed from mapped arrays without converting them to lists.
+                                            getRefundAnalysis calculated by RefundAnalysis engine.
 
 """
 
 # Official and 3-rd party imports
-import requests
 import json
 import csv
+import threading
 from lxml.html import fromstring
 from dataclasses import dataclass, field
 import datetime
+from decimal import Decimal
 from dateutil.parser import parse
 
 # Custom created variables modules
 from Dependencies.Variables_API import *
 from Dependencies.Variable_Xpath_Filter import *
+from Dependencies.Variables_Metrics import *
 
+# Custom created class modules
+from Dependencies.Class_QuotationIndex import QuotationIndex
+from Dependencies.Class_FundStatistics import FundStatistics
+from Dependencies.Class_QuotationStore import QuotationStore
+from Dependencies.Class_QuotationStreamParser import QuotationStreamParser
+from Dependencies.Class_QuotationArchive import QuotationArchive
+from Dependencies.Class_RefundAnalysis import RefundAnalysis
+from Dependencies.Class_OutputWriter import OutputWriter
+from Dependencies.Class_HTTPTransport import HTTPTransport
+from Dependencies.Class_MetricsRegistry import metrics
 
-@dataclass
+
+@dataclass(slots=True)
 class AnalizyFund:
 
     # Initialization Variables
     URL: str
+    RequestTimeout: float = analizyplRequestTimeout
+    LocalQuotationStore: QuotationStore | None = None
+    Transport: HTTPTransport = field(default_factory=HTTPTransport.getDefault)
+    LatestDetailsSource: str = "Page"
 
     # Constant Variables
     QuotationsAPI = analizyplQuotationAPI
+    LatestDetailsFromPage = "Page"
+    LatestDetailsFromQuotation = "Quotation"
+    UpdateDateFormat = "%d.%m.%Y"
+    MinPriceDecimalDigits = 2
 
     # Calculated Variables
     ID: str = field(init=False)
     Name: str = field(init=False)
     Category: str = field(init=False)
     CategoryShortCut: str = field(init=False)
+    Price: str | None = field(default=None, init=False)
+    Currency: str | None = field(default=None, init=False)
+    UpdateDate: str | None = field(default=None, init=False)
+    ChangePercentage1D: str | None = field(default=None, init=False)
+    ChangeValue1D: str | None = field(default=None, init=False)
+    QuotationCurrency: str | None = field(default=None, init=False)
+    PriceIndex: QuotationIndex = field(default_factory=QuotationIndex, init=False)
+    Statistics: FundStatistics = field(default_factory=FundStatistics, init=False, repr=False)
+    IsLatestDetailsLoaded: bool = field(default=False, init=False)
+    IsHistoricalQuotationLoaded: bool = field(default=False, init=False)
+    LoadLock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
 
     def __post_init__(self):
 
@@ -66,160 +131,159 @@ class AnalizyFund:
         self.CategoryShortCut = "".join(
             [word[0] for word in self.Category.split("-")])
 
-        # Invoke method to download stats for Today: Price, Currency, LastUpdate date,
+        return None
+
+    def load(self) -> None:
+
+        # Invoke method to load stats for Today: Price, Currency, LastUpdate date,
         # Change Value comparing to previous day, Change percentage comparing to previous day
-        self.downloadLatestDetails()
+        self.loadLatestDetails()
+
+        # Load historical quotation
+        self.loadHistoricalQuotation()
+
+        return None
+
+    def loadLatestDetails(self) -> None:
+
+        # Lock is needed as fund can be accessed from multiple threads at the same time
+        with self.LoadLock:
+
+            # Details are loaded only once
+            if self.IsLatestDetailsLoaded:
+                return None
+
+            # Latest details can be calculated from quotation, fund page is downloaded only as a fallback
+            if self.LatestDetailsSource == AnalizyFund.LatestDetailsFromQuotation:
+
+                # Load historical quotation
+                self.loadHistoricalQuotation()
+
+                # Calculate stats for Today from 2 latest quotations,
+                # if it is not possible download them from fund page
+                if not self.calcLatestDetailsFromQuotation():
+                    self.downloadLatestDetails()
+
+            else:
+                self.downloadLatestDetails()
+
+            self.IsLatestDetailsLoaded = True
 
-        # Download historical quotation in JSON format
-        self.downloadHistoricalQuotation()
+        return None
+
+    def loadHistoricalQuotation(self) -> None:
+
+        # Lock is needed as fund can be accessed from multiple threads at the same time
+        with self.LoadLock:
+
+            # Download historical quotation in JSON format only once
+            if not self.IsHistoricalQuotationLoaded:
+                self.downloadHistoricalQuotation()
+                self.IsHistoricalQuotationLoaded = True
 
         return None
 
+    def isLoaded(self) -> bool:
+        return self.IsLatestDetailsLoaded and self.IsHistoricalQuotationLoaded
+
     def getFundID(self) -> str:
         return self.ID
 
     def getPrice(self) -> float:
+        self.loadLatestDetails()
         return float(self.Price)
 
     def getCurrency(self) -> str:
+        self.loadLatestDetails()
         return self.Currency
 
     def getLastChangePercentage(self) -> float:
+        self.loadLatestDetails()
         return self.ChangePercentage1D
 
     def getFundPriceOnDate(self, date) -> float | None:
-        try:
-            priceToReturn = float(
-                [
-                    item
-                    for item in self.QuotationJSON["Price"]
-                    if item[analizyplAPIresponse_QuotationDate] == date
-                ][0][analizyplAPIresponse_QuotationValue]
-            )
-        except:
-            priceToReturn = None
+        self.loadHistoricalQuotation()
+        if metrics.Enabled:
+            metrics.increment(metricFundPriceLookups, type="exact")
 
-        return priceToReturn
+        # return price for exact date from the index, None if there is no quotation for that day
+        return self.PriceIndex.getPriceOnDate(date)
+
+    def getQuotationIndex(self) -> QuotationIndex:
+        self.loadHistoricalQuotation()
+        return self.PriceIndex
 
     def getLastQuotationDate(self) -> datetime.date:
+        self.loadHistoricalQuotation()
 
-        # return date parsed to datetime type from last entry in quotation dict
-        return (
-            parse(
-                self.QuotationJSON["Price"][-1][analizyplAPIresponse_QuotationDate]
-            ).date()
-        )
+        # return date of last entry in quotation index
+        return self.PriceIndex.getLastDate()
 
-    def getNearestFundPrice(self, date: datetime.date, daysLimit: int = 7) -> float:
-        # init local variables to look for fund quotation
-        daysToSubtract = 0
-        newDateToCheck = date
-        priceToReturn = None
+    def getStatistics(self) -> dict[str, float | None]:
+        self.loadHistoricalQuotation()
 
-        # Loop until price is None or daysToSubtract is greater than provided daysLimit
+        # Refresh statistics from the index, they are calculated again only if the index was replaced
+        with self.LoadLock:
+            return self.Statistics.update(self.PriceIndex)
+
+    def getNearestFundPrice(self, date: datetime.date, daysLimit: int = 7) -> float | None:
+        self.loadHistoricalQuotation()
+        if metrics.Enabled:
+            metrics.increment(metricFundPriceLookups, type="nearest")
+
+        # return last price on or before provided date, not older than provided daysLimit
         # It makes no sense to look further in the past for the quotation of particular fund investment
-        while priceToReturn == None and daysToSubtract <= daysLimit:
+        # if there is no valid price in that time frame, None will be returned
+        return self.PriceIndex.getNearestPrice(date, daysLimit)
 
-            # calculate new date to check the quotation
-            newDateToCheck -= datetime.timedelta(
-                days=daysToSubtract
-            )
+    def getNearestFundPrices(self, dates: list[datetime.date], daysLimit: int = 7) -> list[float | None]:
+        self.loadHistoricalQuotation()
+        if metrics.Enabled:
+            metrics.increment(metricFundPriceLookups, len(dates), type="nearest")
 
-            # get the fund price for new (older) date
-            # if it will be different than None, than while loop will not be continued
-            priceToReturn = self.getFundPriceOnDate(
-                newDateToCheck.strftime("%Y-%m-%d")
-            )
+        # return nearest price for each provided date, in the same order as dates
+        return self.PriceIndex.getNearestPrices(dates, daysLimit)
 
-            # Increment value for next iteration if value will be still None
-            daysToSubtract += 1
-
-        # return found price,
-        # if while loop will not find the valid price,
-        # None will be returned
-        return priceToReturn
-
-    def getRefundAnalysis(self, paymentPeriods: dict[str, any]) -> dict[str, float]:
-
-        # loop through payments
-        for i in range(0, len(paymentPeriods)):
-
-            # get local var for better readability
-            startDate = paymentPeriods[i]["startDate"]
-            endDate = paymentPeriods[i]["endDate"]
-
-            # get prices for the beginning and end of the period.
-            startPrice = self.getNearestFundPrice(startDate)
-            endPrice = self.getNearestFundPrice(endDate)
-            
-            # calculate participation units
-            paymentPeriods[i]["ParticipationUnits"] = paymentPeriods[i]["InvestedMoney"] / startPrice
-            
-            # if current iteration is not the first one sum participation units which are already owned
-            if i != 0:
-                paymentPeriods[i]["ParticipationUnits"] += paymentPeriods[i-1]["ParticipationUnits"]
-            
-            # calculate the duration for current amount of money
-            # -1, because money can produce first profit the day after the buy date
-            paymentPeriods[i]["timeFrameInDays"] = (
-                endDate - startDate
-            ).days - 1
-
-            # calculate the refund
-            # -1 to get the profit or loss only
-            # multiply by 100 to convert it to the %
-            paymentPeriods[i]["refund"] = (
-                (endPrice / startPrice) - 1
-            ) * 100
-
-        # number of days during which money can make profit
-        numOfDays = sum(
+    def getRefundAnalysis(self, paymentPeriods: list[dict[str, any]]) -> dict[str, float] | None:
+        self.loadHistoricalQuotation()
+
+        # Payment periods are calculated by batch RefundAnalysis engine as the only fund of the analysis,
+        # so result is the same as for the fund in investment refund analysis
+        analysis = RefundAnalysis()
+        analysis.addPeriods(
+            self.ID,
             [
-                item["timeFrameInDays"]
-                for item in paymentPeriods
+                (
+                    self.ID,
+                    self,
+                    [
+                        (period["startDate"].toordinal(), period["endDate"].toordinal(), float(period["InvestedMoney"]))
+                        for period in paymentPeriods
+                    ]
+                )
             ]
         )
 
-        # calculate weighted average for the fund,
-        fundRefund = (
-            # value <- refund for particular period
-            # timeFrame <- the weight of the value
-            sum(
-                [
-                    item["timeFrameInDays"] * item["refund"] * item["ParticipationUnits"]
-                    for item in paymentPeriods
-                ]
-            )
-            /  # divided
-            # sum of the days taken under the consideration
-            sum(
-                [
-                    item["timeFrameInDays"] * item["ParticipationUnits"]
-                    for item in paymentPeriods
-                ]
-            )
-        )
-
-        # calculate the refund per day
-        fundRefundPerDay = (
-            fundRefund
-            /
-            numOfDays
-        )
-        
-        # return predefined dict
-        return {
-            "FundName": self.Name,
-            "FundID": self.ID,
-            "Refund_%": fundRefund,
-            "RefundPerDay_%": fundRefundPerDay,
-            "RefundYearly_%": fundRefundPerDay * 365
-        }
+        # return predefined dict, None if price of any period was not found
+        result = analysis.calculate()[self.ID]
+        if result == None:
+            return None
+        return result[self.ID]
 
     def downloadLatestDetails(self):
 
-        # Invoke web request to provided URL
-        response = requests.get(self.URL)
+        # Invoke web request to provided URL,
+        # conditional request can be sent only if details from previous run are stored
+        response = self.Transport.get(
+            self.URL,
+            timeout=self.RequestTimeout,
+            conditional=self.LocalQuotationStore != None and self.LocalQuotationStore.hasLatestDetails(self.ID)
+        )
+
+        # If page has not changed since last run, read details from the local store without parsing
+        if self.Transport.isNotModified(response):
+            self.setLatestDetails(self.LocalQuotationStore.loadLatestDetails(self.ID))
+            return None
 
         # Convert response to HTML tree
         treeHTML = fromstring(response.content)
@@ -259,6 +323,100 @@ class AnalizyFund:
             str(treeHTML.xpath(xpathFilter_ChangeValue1D)
                 [0]).strip().replace(",", ".")
         )
+
+        # If local store is used, save details for next run and remember validators of the page
+        if self.LocalQuotationStore != None:
+            self.LocalQuotationStore.saveLatestDetails(self.ID, self.getLatestDetails())
+            self.Transport.rememberValidators(self.URL, response)
+
+        return None
+
+    def calcLatestDetailsFromQuotation(self) -> bool:
+
+        # At least 2 quotations are required to calculate change comparing to previous day
+        if len(self.PriceIndex) < 2:
+            return False
+
+        # get 2 latest prices
+        lastPrice = self.PriceIndex.Prices[-1]
+        previousPrice = self.PriceIndex.Prices[-2]
+
+        # Price is written with the same precision as quotation, but not less than 2 decimal digits,
+        # so price quoted with more digits is not rounded comparing to the source data
+        decimalDigits = max(
+            AnalizyFund.MinPriceDecimalDigits,
+            AnalizyFund.getDecimalDigits(lastPrice),
+            AnalizyFund.getDecimalDigits(previousPrice)
+        )
+
+        # Set the same values as read out from fund page
+        self.Price = "{:.{}f}".format(lastPrice, decimalDigits)
+        self.Currency = self.QuotationCurrency
+        self.UpdateDate = self.PriceIndex.getLastDate().strftime(
+            AnalizyFund.UpdateDateFormat
+        )
+        self.ChangeValue1D = "{:.{}f}".format(lastPrice - previousPrice, decimalDigits)
+
+        # -1 to get the change only, multiply by 100 to convert it to the %
+        self.ChangePercentage1D = "{:.2f}".format(
+            ((lastPrice / previousPrice) - 1) * 100
+        )
+
+        return True
+
+    @staticmethod
+    def getDecimalDigits(value: float) -> int:
+
+        # Number of decimal digits in the shortest representation of the number, e.g. 12.3456 -> 4
+        exponent = Decimal(repr(value)).as_tuple().exponent
+        return -exponent if exponent < 0 else 0
+
+    def getLatestDetails(self) -> dict[str, str]:
+        # Return details read out from fund page as dict
+        return {
+            "Price": self.Price,
+            "Currency": self.Currency,
+            "UpdateDate": self.UpdateDate,
+            "ChangePercentage1D": self.ChangePercentage1D,
+            "ChangeValue1D": self.ChangeValue1D,
+        }
+
+    def setLatestDetails(self, details: dict[str, str]) -> None:
+        # Set details in the same structure as returned by getLatestDetails
+        self.Price = details["Price"]
+        self.Currency = details["Currency"]
+        self.UpdateDate = details["UpdateDate"]
+        self.ChangePercentage1D = details["ChangePercentage1D"]
+        self.ChangeValue1D = details["ChangeValue1D"]
+
+        return None
+
+    def setHistoricalQuotation(self, quotationJSON: dict[str, str | list[dict[str, str | float]]]) -> None:
+
+        # Lock is needed as fund can be accessed from multiple threads at the same time
+        with self.LoadLock:
+
+            # Index quotation provided in the same structure as downloaded from API,
+            # quotation will not be downloaded anymore
+            self.QuotationCurrency = quotationJSON["Currency"]
+            self.PriceIndex = QuotationIndex(quotationJSON["Price"])
+            self.IsHistoricalQuotationLoaded = True
+
+        return None
+
+    def loadQuotationArchive(self, filePath: str) -> None:
+
+        # Lock is needed as fund can be accessed from multiple threads at the same time
+        with self.LoadLock:
+
+            # Read out mapped archive, index is created directly from sorted arrays
+            with QuotationArchive(filePath) as archive:
+                self.PriceIndex = QuotationIndex.fromArrays(archive.getDates(), archive.getPrices())
+                self.QuotationCurrency = archive.getCurrency()
+
+            # Quotation will not be downloaded anymore
+            self.IsHistoricalQuotationLoaded = True
+
         return None
 
     def downloadHistoricalQuotation(self):
@@ -266,70 +424,149 @@ class AnalizyFund:
         # Create custom URL to access API to download JSON with all quotation
         URL = f"{AnalizyFund.QuotationsAPI}/{self.CategoryShortCut}/{self.ID}"
 
-        # Invoke web request and convert JSON response to dict
-        fundQuotationResponse = json.loads(requests.get(URL).content)
+        # Invoke web request, body is streamed to be parsed while it is downloaded,
+        # conditional request can be sent only if quotation from previous run is stored
+        response = self.Transport.get(
+            URL,
+            timeout=self.RequestTimeout,
+            conditional=self.LocalQuotationStore != None and self.LocalQuotationStore.hasQuotation(self.ID),
+            stream=True
+        )
+
+        # If quotation has not changed since last run, load it from the local store without parsing,
+        # index is created directly from stored arrays
+        if self.Transport.isNotModified(response):
+            response.close()
+            storedQuotation = self.LocalQuotationStore.load(self.ID)
+            self.QuotationCurrency = storedQuotation["Currency"]
+            self.PriceIndex = QuotationIndex.fromArrays(storedQuotation["Ordinals"], storedQuotation["Prices"])
+            if metrics.Enabled:
+                metrics.increment(metricQuotationRowsParsed, len(self.PriceIndex), source="store")
+            return None
+
+        # Parse response chunk by chunk while it is downloaded, each quotation entry is indexed as soon as
+        # it is received, so neither whole body nor decoded response is kept in memory.
+        # Index gives exact date and as-of lookups without scanning the list, only compact arrays are kept
+        parser = QuotationStreamParser()
+        self.PriceIndex = QuotationIndex(
+            parser.parse(self.Transport.iterContent(URL, response))
+        )
+        self.QuotationCurrency = parser.getCurrency()
+        if metrics.Enabled:
+            metrics.increment(metricQuotationRowsParsed, parser.getCount(), source="api")
+
+        # If local store is used, continue stored history with quotations newer than the last stored one,
+        # index arrays are passed directly and index is created again only if stored history is longer
+        if self.LocalQuotationStore != None:
+            ordinals, prices = self.LocalQuotationStore.update(
+                self.ID,
+                self.QuotationCurrency,
+                self.PriceIndex.Ordinals,
+                self.PriceIndex.Prices
+            )
+            if ordinals is not self.PriceIndex.Ordinals:
+                self.PriceIndex = QuotationIndex.fromArrays(ordinals, prices)
+            self.Transport.rememberValidators(URL, response)
 
-        # Save needed data from response to class attribute
-        self.QuotationJSON = {
-            "FundID": fundQuotationResponse[analizyplAPIresponse_ID],
-            "Currency": fundQuotationResponse[analizyplAPIresponse_Currency],
-            "Price": fundQuotationResponse[analizyplAPIresponse_QuotationDetails][0][
-                analizyplAPIresponse_QuotationList
-            ],
-        }
         return None
 
-    def saveQuotationJSON(self, destinationPath):
+    def getQuotationFileName(self, extension: str) -> str:
+        return f"FQ_{self.CategoryShortCut}_{self.ID}.{extension}"
 
-        # Check if destination Path was provided and create appropriate `destinationFilePath`
-        if destinationPath == None:
-            destinationFilePath = f"FQ_{self.CategoryShortCut}_{self.ID}.json"
-        else:
-            destinationFilePath = (
-                f"{destinationPath}/FQ_{self.CategoryShortCut}_{self.ID}.json"
-            )
+    def saveQuotationJSON(self, destinationPath, writer: OutputWriter | None = None):
 
-        # Open destination file and write dict dumped to JSON structure
-        with open(destinationFilePath, "w") as destinationFileJSON:
-            destinationFileJSON.write(json.dumps(self.QuotationJSON, indent=4))
+        # Write file in destination directory, file is replaced only if its content has changed
+        self.saveQuotationFile(destinationPath, "json", self.writeQuotationJSON, writer)
 
         return None
 
-    def saveQuotationCSV(self, destinationPath):
+    def saveQuotationFile(self, destinationPath, extension: str, writeContent, writer: OutputWriter | None) -> None:
 
-        # Check if destination Path was provided and create appropriate `destinationFilePath`
+        # File written with provided writer is only queued in its manifest,
+        # caller saves manifest once for all files (e.g. OutputWriter.writeAll)
+        if writer != None:
+            writer.write(self.getQuotationFileName(extension), writeContent)
+            return None
+
+        # Otherwise file is written with its own writer, which saves manifest with this file
+        OutputWriter(destinationPath).writeAll({self.getQuotationFileName(extension): writeContent})
+
+        return None
+
+    def getQuotationJSON(self) -> dict[str, str | list[dict[str, str | float]]]:
+        self.loadHistoricalQuotation()
+
+        # return quotation in the same structure as downloaded from API, regenerated from the index arrays
+        return {
+            "FundID": self.ID,
+            "Currency": self.QuotationCurrency,
+            "Price": self.PriceIndex.getQuotations()
+        }
+
+    def writeQuotationJSON(self, destinationFileJSON) -> None:
+
+        # Write dict dumped to JSON structure chunk by chunk, without creating whole string
+        destinationFileJSON.writelines(
+            json.JSONEncoder(indent=4).iterencode(self.getQuotationJSON())
+        )
+
+        return None
+
+    def getQuotationArchiveFilePath(self, destinationPath=None) -> str:
+
+        # Check if destination Path was provided and create appropriate file path
+        fileName = self.getQuotationFileName(QuotationArchive.FileExtension)
         if destinationPath == None:
-            destinationFilePath = f"FQ_{self.CategoryShortCut}_{self.ID}.csv"
-        else:
-            destinationFilePath = (
-                f"{destinationPath}/FQ_{self.CategoryShortCut}_{self.ID}.csv"
-            )
+            return fileName
+        return f"{destinationPath}/{fileName}"
+
+    def saveQuotationBIN(self, destinationPath):
+        self.loadHistoricalQuotation()
+
+        # Write sorted dates and prices from the index to binary archive
+        QuotationArchive.write(
+            self.getQuotationArchiveFilePath(destinationPath),
+            self.ID,
+            self.QuotationCurrency,
+            self.PriceIndex.Ordinals,
+            self.PriceIndex.Prices
+        )
 
-        # Open destination file
-        with open(destinationFilePath, "w") as destinationFileCSV:
+        return None
 
-            # Create csv writer instance
-            writer = csv.writer(destinationFileCSV, delimiter="\t")
+    def saveQuotationCSV(self, destinationPath, writer: OutputWriter | None = None):
 
-            # Write csv headers
-            writer.writerow(["Date", "Price", "Currency"])
+        # Write file in destination directory, file is replaced only if its content has changed
+        self.saveQuotationFile(destinationPath, "csv", self.writeQuotationCSV, writer)
 
-            # Loop through quotation dict format
-            for row in self.QuotationJSON["Price"]:
+        return None
 
-                # write CSV row with writer
-                writer.writerow(
-                    # Convert dict structure to list with same column order as already written headers
-                    [
-                        row[analizyplAPIresponse_QuotationDate],
-                        row[analizyplAPIresponse_QuotationValue],
-                        self.Currency,
-                    ]
-                )
+    def writeQuotationCSV(self, destinationFileCSV) -> None:
+        self.loadLatestDetails()
+        self.loadHistoricalQuotation()
+
+        # Create csv writer instance
+        writer = csv.writer(destinationFileCSV, delimiter="\t")
+
+        # Write csv headers
+        writer.writerow(["Date", "Price", "Currency"])
+
+        # Write all rows at once, rows are generated from the index arrays
+        # with same column order as already written headers
+        writer.writerows(
+            [
+                date,
+                price,
+                self.Currency,
+            ]
+            for date, price in self.PriceIndex.iterQuotations()
+        )
 
         return None
 
     def ExportTodaysResults(self) -> dict:
+        self.loadLatestDetails()
+
         # Return class attributes as dict
         return {
             "FundName": self.Name,
@@ -340,9 +577,15 @@ class AnalizyFund:
             "ChangePrice(1D)": self.ChangeValue1D,
             "LastUpdate": self.UpdateDate,
             "FundURL": self.URL,
+            "Statistics": {
+                name: "{:.2f}".format(value) if value != None else None
+                for name, value in self.getStatistics().items()
+            },
         }
 
     def getFundInfo(self) -> dict:
+        self.loadLatestDetails()
+
         # Return class attributes as dict
         return {
             "Name": f"{self.Name}",
@@ -352,3 +595,12 @@ class AnalizyFund:
             "PercentChange": f"{self.ChangePercentage1D}",
             "LastUpdate": f"{self.UpdateDate}",
         }
+
+    def getStatisticsInfo(self) -> dict:
+
+        # Return statistics with fund name and ID as dict
+        return {
+            "Name": f"{self.Name}",
+            "ID": f"{self.ID}",
+            **self.getStatistics()
+        }
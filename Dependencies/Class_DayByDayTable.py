@@ -0,0 +1,224 @@
+"""
+.DESCRIPTION
+    Definition file of DayByDayTable class.
+    Class is columnar data structure to store DayByDay results of a single investment.
+    Instead of list of dicts (one per day) results are kept as columns:
+        - Dates <- array of date ordinals (datetime.date.toordinal())
+        - Columns <- array of floats per numeric header, e.g. "Value", "<Fund_ID> P.U."
+        - TextColumns <- list of strings per text header, e.g. "<Fund_ID> Currency"
+    Headers keep the order of columns, the same as in DayByDay CSV file.
+
+    For backward compatibility each row can be read out as dict, where keys are headers:
+        table[-1]["<Fund_ID> P.U."]
+        for row in table: ...
+
+.INITIALIZATION
+    By default class was meant to be a attribute of Investment class.
+    Table can be created empty and appended with row dicts, or created from columns with .fromColumns()
+    Table resumed from the file can be truncated with .truncate() and extended with new rows with .extend()
+
+.NOTES
+
+    Version:            1.1
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-17      Stanisław Horna         Table can be extended with another table and truncated in place,
+                                            rows can be read out starting from provided index.
+                                            Column types in fromRows derived from headers only (no fallback to text).
+                                            fromColumns copies numpy float64 columns from their buffer.
+
+"""
+# Official and 3-rd party imports
+import datetime
+from array import array
+from dataclasses import dataclass, field
+
+
+@dataclass
+class DayByDayTable:
+
+    # Initialization Variables
+    Headers: list[str] = field(default_factory=list)
+    Dates: array = field(default_factory=lambda: array("l"))
+    Columns: dict[str, array] = field(default_factory=dict)
+    TextColumns: dict[str, list[str]] = field(default_factory=dict)
+
+    # Constant Variables
+    DateHeader = "Date"
+    TextHeaderSuffix = "Currency"
+
+    @classmethod
+    def fromColumns(
+        cls,
+        dates: list[int],
+        columns: dict[str, list[float] | list[str] | str]
+    ) -> "DayByDayTable":
+
+        # Init table with date column as the first one
+        table = cls(Headers=[DayByDayTable.DateHeader], Dates=array("l", dates))
+
+        # Loop through provided columns keeping their order
+        for header, values in columns.items():
+            table.Headers.append(header)
+
+            # Text column can be provided as single value, which is the same for each day
+            if DayByDayTable.isTextHeader(header):
+                table.TextColumns[header] = (
+                    [values] * len(dates) if isinstance(values, str) else list(values)
+                )
+            elif isinstance(values, list):
+                table.Columns[header] = array("d", values)
+
+            # Numeric column calculated with numpy (float64 array) is copied from its buffer at once
+            else:
+                table.Columns[header] = array("d")
+                table.Columns[header].frombytes(memoryview(values).cast("B"))
+
+        return table
+
+    @classmethod
+    def fromRows(cls, headers: list[str], rows: list[list[str]]) -> "DayByDayTable":
+
+        # Init table with the same headers as provided
+        table = cls(Headers=list(headers))
+
+        # Each row has to contain value of each column, otherwise columns would not be aligned
+        if any(len(row) != len(headers) for row in rows):
+            raise ValueError("DayByDay row does not match headers")
+
+        # Transpose rows to columns, to convert each column at once
+        columns = list(zip(*rows)) if rows else [() for header in headers]
+
+        for header, values in zip(headers, columns):
+
+            # Date column is converted to ordinals
+            if header == DayByDayTable.DateHeader:
+                table.Dates = array(
+                    "l", [datetime.date.fromisoformat(item).toordinal() for item in values]
+                )
+                continue
+
+            # Text columns are kept as they are
+            if DayByDayTable.isTextHeader(header):
+                table.TextColumns[header] = list(values)
+                continue
+
+            # Type of remaining columns is known from headers, so whole column is converted to floats at once
+            table.Columns[header] = array("d", map(float, values))
+
+        return table
+
+    @staticmethod
+    def isTextHeader(header: str) -> bool:
+        return header.endswith(DayByDayTable.TextHeaderSuffix)
+
+    def __len__(self) -> int:
+        return len(self.Dates)
+
+    def __getitem__(self, index: int) -> dict[str, float | str]:
+        # return single day as dict, the same as DayByDay row
+        return dict(zip(self.Headers, self.getRowValues(index)))
+
+    def __iter__(self):
+        # Loop through each day and return it as dict
+        for values in self.iterRowValues():
+            yield dict(zip(self.Headers, values))
+
+    def getHeaders(self) -> list[str]:
+        return self.Headers
+
+    def getDate(self, index: int) -> datetime.date:
+        return datetime.date.fromordinal(self.Dates[index])
+
+    def getColumn(self, header: str) -> array | list[str]:
+        # return column values for provided header
+        if header in self.TextColumns:
+            return self.TextColumns[header]
+        return self.Columns[header]
+
+    def getLastValue(self, header: str) -> float | str:
+        return self.getColumn(header)[-1]
+
+    def getRowValues(self, index: int) -> list[float | str]:
+
+        # Collect values of each column for the same day in the order of headers
+        return [
+            datetime.date.fromordinal(self.Dates[index]).isoformat()
+            if header == DayByDayTable.DateHeader
+            else self.getColumn(header)[index]
+            for header in self.Headers
+        ]
+
+    def iterRowValues(self, start: int = 0):
+
+        # Convert dates only once and walk through all columns at the same time,
+        # rows before provided start index are skipped
+        columns = [
+            [datetime.date.fromordinal(item).isoformat() for item in self.Dates[start:]]
+            if header == DayByDayTable.DateHeader
+            else self.getColumn(header)[start:]
+            for header in self.Headers
+        ]
+
+        # return list of values for each day in the order of headers
+        for values in zip(*columns):
+            yield list(values)
+
+    def appendRow(self, row: dict[str, float | str]) -> None:
+
+        # First row defines headers and type of columns
+        if not self.Headers:
+            self.Headers = list(row.keys())
+            for header in self.Headers:
+                if header == DayByDayTable.DateHeader:
+                    continue
+                if DayByDayTable.isTextHeader(header):
+                    self.TextColumns[header] = []
+                else:
+                    self.Columns[header] = array("d")
+
+        # Append each column with value from the row
+        self.Dates.append(
+            datetime.date.fromisoformat(row[DayByDayTable.DateHeader]).toordinal()
+        )
+        for header in self.Columns:
+            self.Columns[header].append(row[header])
+        for header in self.TextColumns:
+            self.TextColumns[header].append(row[header])
+
+        return None
+
+    def extend(self, table: "DayByDayTable") -> None:
+
+        # Empty table takes over headers and columns of provided one
+        if not self.Headers:
+            self.Headers = list(table.Headers)
+            self.Dates = array("l", table.Dates)
+            self.Columns = {header: array("d", values) for header, values in table.Columns.items()}
+            self.TextColumns = {header: list(values) for header, values in table.TextColumns.items()}
+            return None
+
+        # Append each column with values of the same header from provided table
+        self.Dates.extend(table.Dates)
+        for header in self.Headers:
+            if header == DayByDayTable.DateHeader:
+                continue
+            self.getColumn(header).extend(table.getColumn(header))
+
+        return None
+
+    def truncate(self, rowsCount: int) -> None:
+
+        # Remove rows after provided number of rows, columns are shortened in place
+        del self.Dates[rowsCount:]
+        for values in self.Columns.values():
+            del values[rowsCount:]
+        for values in self.TextColumns.values():
+            del values[rowsCount:]
+
+        return None
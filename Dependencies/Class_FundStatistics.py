@@ -0,0 +1,176 @@
+"""
+.DESCRIPTION
+    Definition file of FundStatistics class.
+    Class is data structure to calculate performance statistics of a single fund from its quotation:
+        - Return<Window>_% <- change of price between the last quotation and the last quotation
+            on or before the same date 1M / 3M / 6M / 1Y / 3Y / 5Y earlier
+        - Volatility1Y_% <- annualized standard deviation of log returns during the last year
+        - MaxDrawdown_% <- the biggest drop of price from the highest price before it, whole history
+        - SharpeRatio1Y <- log return of the last year divided by its annualized volatility (risk-free rate 0)
+    Statistic is None if quotation history is too short to calculate it.
+
+    Statistics are calculated with prefix arrays built once for the whole quotation:
+        - LogPrices <- log of each price, window log return is a difference of two values
+        - SquaredReturns <- cumulative sum of squared log returns, window variance is calculated
+            from differences of prefix values
+        - RunningMax <- the highest price up to each quotation
+        - MaxDrawdowns <- the biggest drawdown up to each quotation
+    Arrays are rebuilt only when fund quotation index is replaced (e.g. downloaded again),
+    statistics are not persisted between runs.
+
+.INITIALIZATION
+    By default class was meant to be a attribute of AnalizyFund class.
+    Class construction does not require any parameters, statistics are refreshed with .update(),
+    which requires QuotationIndex of the fund.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import datetime
+import numpy as np
+from dateutil.relativedelta import relativedelta
+from dataclasses import dataclass, field
+
+# Custom created class modules
+from Dependencies.Class_QuotationIndex import QuotationIndex
+
+
+@dataclass
+class FundStatistics:
+
+    # Calculated Variables
+    Ordinals: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64), init=False, repr=False)
+    LogPrices: np.ndarray = field(default_factory=lambda: np.empty(0), init=False, repr=False)
+    SquaredReturns: np.ndarray = field(default_factory=lambda: np.empty(0), init=False, repr=False)
+    RunningMax: np.ndarray = field(default_factory=lambda: np.empty(0), init=False, repr=False)
+    MaxDrawdowns: np.ndarray = field(default_factory=lambda: np.empty(0), init=False, repr=False)
+    Quotation: QuotationIndex | None = field(default=None, init=False, repr=False)
+    Statistics: dict[str, float | None] = field(default_factory=dict, init=False)
+
+    # Constant Variables
+    ReturnWindows = {
+        "1M": relativedelta(months=1),
+        "3M": relativedelta(months=3),
+        "6M": relativedelta(months=6),
+        "1Y": relativedelta(years=1),
+        "3Y": relativedelta(years=3),
+        "5Y": relativedelta(years=5),
+    }
+    VolatilityWindow = relativedelta(years=1)
+
+    def update(self, quotation: QuotationIndex) -> dict[str, float | None]:
+
+        # Statistics of the same quotation index are already calculated
+        if quotation is self.Quotation:
+            return self.Statistics
+
+        # Nothing to calculate without quotation
+        self.Quotation = quotation
+        if not len(quotation):
+            self.Statistics = FundStatistics.getEmptyStatistics()
+            return self.Statistics
+
+        # Build prefix arrays of whole quotation and calculate statistics from them
+        self.build(quotation)
+        self.Statistics = self.calcStatistics()
+
+        return self.Statistics
+
+    def build(self, quotation: QuotationIndex) -> None:
+
+        # get quotation as arrays
+        self.Ordinals = np.asarray(quotation.Ordinals, dtype=np.int64)
+        prices = np.asarray(quotation.Prices, dtype=np.float64)
+
+        # calculate log prices and prefix sum of squared log returns, the first return is 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.LogPrices = np.log(prices)
+        self.SquaredReturns = np.cumsum(np.diff(self.LogPrices, prepend=self.LogPrices[0]) ** 2)
+
+        # calculate running maximum of price and running minimum of drawdown
+        self.RunningMax = np.maximum.accumulate(prices)
+        self.MaxDrawdowns = np.minimum.accumulate(prices / self.RunningMax - 1)
+
+        return None
+
+    def getWindowStarts(self, windows: list[relativedelta]) -> np.ndarray:
+
+        # Find position of the last quotation on or before the start date of each window,
+        # -1 means that quotation history does not reach the start date
+        lastDate = datetime.date.fromordinal(int(self.Ordinals[-1]))
+        startOrdinals = np.asarray(
+            [(lastDate - window).toordinal() for window in windows],
+            dtype=np.int64
+        )
+
+        return np.searchsorted(self.Ordinals, startOrdinals, side="right") - 1
+
+    def calcStatistics(self) -> dict[str, float | None]:
+
+        statistics = {}
+        last = len(self.Ordinals) - 1
+
+        # calculate change of price in each window at once,
+        # -1 to get the profit or loss only, multiply by 100 to convert it to the %
+        starts = self.getWindowStarts(list(FundStatistics.ReturnWindows.values()))
+        returns = (np.exp(self.LogPrices[last] - self.LogPrices[np.clip(starts, 0, None)]) - 1) * 100
+        for name, start, value in zip(FundStatistics.ReturnWindows, starts, returns):
+            statistics[f"Return{name}_%"] = FundStatistics.getValue(value) if start >= 0 else None
+
+        # calculate volatility of the last year from sums of log returns and squared log returns,
+        # at least 2 returns are needed to calculate their standard deviation
+        start = int(self.getWindowStarts([FundStatistics.VolatilityWindow])[0])
+        count = last - start
+        volatility = None
+        sharpeRatio = None
+        if start >= 0 and count > 1:
+            logReturn = self.LogPrices[last] - self.LogPrices[start]
+            variance = (
+                (self.SquaredReturns[last] - self.SquaredReturns[start]) - logReturn ** 2 / count
+            ) / (count - 1)
+
+            # annualize volatility with the number of returns in the year
+            volatility = FundStatistics.getValue(np.sqrt(max(variance, 0.0) * count))
+            if volatility:
+                sharpeRatio = FundStatistics.getValue(logReturn / volatility)
+                volatility *= 100
+
+        statistics["Volatility1Y_%"] = volatility
+
+        # the biggest drawdown of whole history is the last value of prefix minimum
+        statistics["MaxDrawdown_%"] = FundStatistics.getValue(self.MaxDrawdowns[last] * 100)
+        statistics["SharpeRatio1Y"] = sharpeRatio
+
+        return statistics
+
+    @staticmethod
+    def getValue(value: float) -> float | None:
+
+        # Statistics which cannot be calculated (e.g. price is not positive) are None
+        if not np.isfinite(value):
+            return None
+        return float(value)
+
+    @staticmethod
+    def getEmptyStatistics() -> dict[str, float | None]:
+
+        # return statistics in the same structure as calculated ones
+        return {
+            **{f"Return{name}_%": None for name in FundStatistics.ReturnWindows},
+            "Volatility1Y_%": None,
+            "MaxDrawdown_%": None,
+            "SharpeRatio1Y": None
+        }
+
+    def getStatistics(self) -> dict[str, float | None]:
+        return self.Statistics
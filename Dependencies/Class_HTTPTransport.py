@@ -0,0 +1,227 @@
+"""
+.DESCRIPTION
+    Definition file of HTTPTransport class.
+    Class is shared transport layer for web requests invoked by AnalizyFund instances:
+        - keep-alive connection pool <- single requests.Session reused by all funds
+        - compression <- gzip / deflate encoded responses (requested by default by requests) are decoded
+        - revalidation <- ETag and Last-Modified validators are remembered per URL,
+            conditional request returns status 304 if content has not changed since last run
+        - timeout <- default time in seconds to wait for the server response
+        - streaming <- response body can be read out chunk by chunk with .iterContent(),
+            so it can be processed while it is downloaded, without keeping whole body in memory
+    Validators are saved to the JSON file, so they can be reused by the next run.
+
+.INITIALIZATION
+    By default class was meant to be a attribute of ListOfFunds class, shared by all AnalizyFund instances.
+    AnalizyFund created without transport uses the one returned by HTTPTransport.getDefault(),
+    which is created on the first call, so no session is opened when module is imported.
+    Optional keywords:
+        - ValidatorCacheFilePath <- JSON file with validators, validators are not saved if it is not provided
+        - Timeout <- time in seconds to wait for the server response for single request
+        - PoolSize <- number of connections kept open in the pool
+        - Timer <- StageTimer to measure each request (elapsed time, status and size of response)
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-17      Stanisław Horna         Optional measurement of each request with StageTimer.
+                                            Requests, response bytes and errors per host counted in metrics registry.
+                                            Optional streamed response read out in chunks with iterContent.
+                                            Validator cache replaced atomically.
+                                            Default transport created on first use instead of on import.
+
+"""
+# Official and 3-rd party imports
+import os
+import json
+import tempfile
+import threading
+import requests
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from dataclasses import dataclass, field
+
+# Custom created variables modules
+from Dependencies.Variables_API import *
+from Dependencies.Variables_Metrics import *
+
+# Custom created class modules
+from Dependencies.Class_StageTimer import StageTimer, disabledStageTimer
+from Dependencies.Class_MetricsRegistry import metrics
+
+
+@dataclass
+class HTTPTransport:
+
+    # Initialization Variables
+    ValidatorCacheFilePath: str | None = None
+    Timeout: float = analizyplRequestTimeout
+    PoolSize: int = 8
+    Timer: StageTimer = field(default_factory=lambda: disabledStageTimer)
+
+    # Calculated Variables
+    Session: requests.Session = field(init=False)
+    Validators: dict[str, dict[str, str]] = field(default_factory=dict, init=False)
+    ValidatorsLock: threading.Lock = field(default_factory=threading.Lock, init=False)
+
+    # Constant Variables
+    NotModified = 304
+    StreamChunkSize = 64 * 1024
+    ValidatorHeaders = {
+        "ETag": "If-None-Match",
+        "Last-Modified": "If-Modified-Since"
+    }
+    DefaultTransport = None
+    DefaultTransportLock = threading.Lock()
+
+    def __post_init__(self):
+
+        # Create session with connection pool big enough for all concurrent downloads
+        self.Session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.PoolSize,
+            pool_maxsize=self.PoolSize
+        )
+        self.Session.mount("https://", adapter)
+        self.Session.mount("http://", adapter)
+
+        # Load validators saved by previous run
+        if self.ValidatorCacheFilePath and os.path.isfile(self.ValidatorCacheFilePath):
+            with open(self.ValidatorCacheFilePath, "r") as validatorCache:
+                self.Validators = json.loads(validatorCache.read())
+
+        return None
+
+    @classmethod
+    def getDefault(cls) -> "HTTPTransport":
+
+        # Transport shared by AnalizyFund instances created without dedicated transport,
+        # it is created on the first use, so session is not opened if funds use their own transport
+        with cls.DefaultTransportLock:
+            if cls.DefaultTransport == None:
+                cls.DefaultTransport = cls()
+
+        return cls.DefaultTransport
+
+    def get(
+        self,
+        URL: str,
+        timeout: float | None = None,
+        conditional: bool = False,
+        stream: bool = False
+    ) -> requests.Response:
+
+        # Init local variable for additional request headers
+        headers = {}
+
+        # If caller is able to handle not modified response, send validators remembered for the URL
+        if conditional:
+            for validator, header in HTTPTransport.ValidatorHeaders.items():
+                if validator in self.Validators.get(URL, {}):
+                    headers[header] = self.Validators[URL][validator]
+
+        # Invoke web request using pooled connection,
+        # request which failed without response (e.g. timeout) is counted and raised again,
+        # streamed response body is not read out here, only headers are received
+        with self.Timer.measureItem("HTTPRequest", URL=URL) as measurement:
+            try:
+                response = self.Session.get(
+                    URL,
+                    headers=headers,
+                    timeout=timeout if timeout != None else self.Timeout,
+                    stream=stream
+                )
+            except requests.RequestException:
+                if metrics.Enabled:
+                    metrics.increment(metricHTTPRequestErrors, host=urlsplit(URL).netloc)
+                raise
+            measurement["Status"] = response.status_code
+            measurement["Bytes"] = None if stream else len(response.content)
+
+        # Count request and received bytes per host, bytes of streamed response are counted while it is read out
+        if metrics.Enabled:
+            host = urlsplit(URL).netloc
+            metrics.increment(metricHTTPRequests, host=host, status=str(response.status_code))
+            if not stream:
+                metrics.increment(metricHTTPResponseBytes, len(response.content), host=host)
+
+        # Not modified response is returned as it is, content has to be read out from local store
+        if response.status_code == HTTPTransport.NotModified:
+            return response
+
+        # Connection of failed streamed response is released before the error is raised
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+
+        return response
+
+    def iterContent(self, URL: str, response: requests.Response, chunkSize: int = StreamChunkSize):
+
+        # Yield decompressed body of streamed response chunk by chunk
+        host = urlsplit(URL).netloc
+        try:
+            for chunk in response.iter_content(chunk_size=chunkSize):
+                if metrics.Enabled:
+                    metrics.increment(metricHTTPResponseBytes, len(chunk), host=host)
+                yield chunk
+
+        # Connection is returned to the pool even if content was not read out until the end
+        finally:
+            response.close()
+
+        return None
+
+    def isNotModified(self, response: requests.Response) -> bool:
+        return response.status_code == HTTPTransport.NotModified
+
+    def rememberValidators(self, URL: str, response: requests.Response) -> None:
+
+        # Validators should be remembered only when response content was processed and stored,
+        # otherwise next conditional request could point to content which is not available
+        if self.isNotModified(response):
+            return None
+
+        # Collect validators returned by the server
+        validators = {
+            validator: response.headers[validator]
+            for validator in HTTPTransport.ValidatorHeaders
+            if validator in response.headers
+        }
+
+        # Update validators, requests for different funds are invoked concurrently
+        with self.ValidatorsLock:
+            if validators:
+                self.Validators[URL] = validators
+            else:
+                self.Validators.pop(URL, None)
+
+        return None
+
+    def saveValidatorCache(self) -> None:
+
+        # Validators are not saved if file path was not provided
+        if not self.ValidatorCacheFilePath:
+            return None
+
+        # Write dict dumped to JSON structure to temporary file in the same directory and replace the cache with it,
+        # so cache is never left partially written
+        with self.ValidatorsLock:
+            with tempfile.NamedTemporaryFile(
+                "w",
+                dir=os.path.dirname(os.path.abspath(self.ValidatorCacheFilePath)),
+                delete=False
+            ) as validatorCache:
+                validatorCache.write(json.dumps(self.Validators, indent=4))
+            os.replace(validatorCache.name, self.ValidatorCacheFilePath)
+
+        return None
@@ -28,10 +28,29 @@
         - EndDate <- end date of investment to correctly duration, profit, refund per day and
                         stop calculating the bought participation units value.
         - FundsList <- an instance of ListOfFunds with already downloaded data from web
+    Optional keywords:
+        - DayByDayEngine <- "NumPy" (default) to calculate DayByDay results for all days at once with arrays,
+                            "Python" to calculate them day after day. Both engines include the same days,
+                            values rounded with numpy can differ by 1 in the last rounded digit (0.01 of value,
+                            0.0001 of refund) for halves, invested money by floating point summation error.
+                            "Stream" to calculate them day after day and write each row to DayByDay CSV file
+                            as soon as it is calculated, only the last row is kept in memory.
+                            "Batch" to leave DayByDay results pending (isDayByDayPending), they are calculated
+                            together with other investments by WalletEvaluation and appended with .completeDayByDay()
+        - DayByDayDirectory <- directory of DayByDay files resumed and written during calculation,
+                            "InvestmentHistoryDayByDayDirectory" from config file is used if it is not provided
+
+    DayByDay results saved to CSV file are accompanied with "<InvestmentName>_OrderBook.json" file,
+    which contains hash of investment order book (InvestmentDetails and EndDate) and the date of the last row
+    where all funds had quotation established exactly on that date, at the moment of saving.
+    If the hash is the same in the next run, rows are read out from CSV file until that date.
+    Only days after it are calculated, the file is truncated after that row
+    (if there were any rows calculated with nearest prices) and new rows are appended to it.
+    "Stream" engine reads out only the row of that date, instead of the whole file.
 
 .NOTES
 
-    Version:            1.6
+    Version:            1.9
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
@@ -52,22 +71,63 @@
                                             instead of taking the last one
     2024-03-12      Stanisław Horna         getRefundAnalysis returns refund analysis, based on 
                                             the payments, timing and invested money of each fund in self investment
+    2026-10-17      Stanisław Horna         Nearest fund price lookups delegated to AnalizyFund as-of lookup,
+                                            lookback is now limited to exactly 7 days before processed date.
+                                            Vectorized NumPy engine for DayByDay calculation (DayByDayEngine),
+                                            columns rounded with numpy and passed to DayByDayTable as arrays.
+                                            DayByDay results stored in columnar DayByDayTable instead of list of dicts.
+                                            Active investments resume DayByDay results from the CSV file if order book
+                                            has not changed, only new days are calculated and appended to the file.
+                                            DayByDay file or order book which cannot be parsed is not resumed.
+                                            Results can be calculated more than once (initResults resets summarized values).
+                                            Calculated and resumed DayByDay rows counted in metrics registry.
+                                            Archived investments can be read out from QuotationDatabase,
+                                            if DayByDay CSV file does not exist.
+                                            Day after day engine implemented as generator of rows,
+                                            "Stream" engine writes rows directly to the file with bounded memory.
+                                            Archived investment file is parsed only if its last row (read out from
+                                            the tail of the file) ends with EndDate, "Stream" engine keeps only that row.
+                                            Refund analysis calculated with batch RefundAnalysis engine (vectorized
+                                            as-of lookup), result is cached until order book or quotation changes.
+                                            NumPy engine and refund analysis read out fund prices from price matrix
+                                            shared by all investments (ListOfFunds.getPriceMatrix).
+                                            "Batch" engine leaves DayByDay results to be calculated by WalletEvaluation,
+                                            DayByDay columns built with getDayByDayColumns shared by both engines,
+                                            buildDayByDayColumns builds them without fund objects (worker processes).
+                                            Directory of DayByDay files can be provided (DayByDayDirectory).
+                                            iterDayByDayRowValues skips rows until provided date.
+                                            iterInvestmentDayByDay yields each row with its final flag,
+                                            so streamed rows are not looked up again.
+                                            Price matrix is requested from the first order date (getFirstOrderDate)
+                                            or the first date on the axis, not from the first fund quotation.
 
 """
 # Official and 3-rd party imports
 import os
 import csv
+import io
+import shutil
+import json
+import bisect
+import hashlib
 import datetime
+from itertools import accumulate
+import numpy as np
 from dateutil.parser import parse
 from dataclasses import dataclass, field
 
 # Custom created function modules
 from Dependencies.Variable_InvestmentFile import *
+from Dependencies.Variables_Metrics import *
 from Dependencies.Function_config import getConfiguration
 
 # Custom created class modules
 from Dependencies.Class_ListOfFund import ListOfFunds
 from Dependencies.Class_AnalizyFund import AnalizyFund
+from Dependencies.Class_DayByDayTable import DayByDayTable
+from Dependencies.Class_QuotationIndex import QuotationIndex
+from Dependencies.Class_RefundAnalysis import RefundAnalysis
+from Dependencies.Class_MetricsRegistry import metrics
 
 from tabulate import tabulate
 
@@ -81,6 +141,8 @@ class Investment:
     StartDate: datetime.date
     EndDate: datetime.date
     FundsList: ListOfFunds
+    DayByDayEngine: str = "NumPy"
+    DayByDayDirectory: str | None = None
 
     # Calculated Variables
     Currency: str = field(
@@ -105,21 +167,61 @@ class Investment:
         init=False,
         default_factory=dict
     )
-    QuotationRefunds: dict[str, dict[str, float | str]] = field(
+    QuotationRefunds: dict[str, dict[str, float | str]] | None = field(
         init=False,
         default_factory=dict
     )
-    DayByDay: list[dict[str, float | str]] = field(
+    RefundAnalysisKey: tuple | None = field(
         init=False,
-        default_factory=list
+        default=None
+    )
+    DayByDay: DayByDayTable = field(
+        init=False,
+        default_factory=DayByDayTable
     )
     InvestmentDetailsDurationDays: int = field(
         init=False
     )
+    PersistedFilePath: str | None = field(
+        init=False,
+        default=None
+    )
+    PersistedFileSize: int = field(
+        init=False,
+        default=0
+    )
+    PersistedRowsCount: int = field(
+        init=False,
+        default=0
+    )
+    IsDayByDayStreamed: bool = field(
+        init=False,
+        default=False
+    )
+    LastFinalDate: str | None = field(
+        init=False,
+        default=None
+    )
+    IsDayByDayPending: bool = field(
+        init=False,
+        default=False
+    )
+    PendingFirstDate: datetime.date | None = field(
+        init=False,
+        default=None
+    )
 
     # Constant Variables
     EndDateNotSet = datetime.datetime(2200, 1, 1).date()
     PrefixForSoldFunds = "(Arch.)"
+    EnginePython = "Python"
+    EngineNumPy = "NumPy"
+    EngineStream = "Stream"
+    EngineBatch = "Batch"
+    PriceLookbackDays = 7
+    OrderBookFileSuffix = "OrderBook"
+    OrderBookHashKey = "OrderBookHash"
+    LastFinalDateKey = "LastFinalDate"
 
     def __post_init__(self) -> None:
         currencySet = set()
@@ -128,13 +230,16 @@ class Investment:
         if self.isEndDateSet() and self.importArchivedInvestmentFromFile():
 
             # get investment currency
-            firstDay = self.DayByDay[0]
-            for column in [col for col in list(firstDay.keys()) if "Currency" in col]:
-                currencySet.add(firstDay[column])
+            for column in [col for col in self.DayByDay.getHeaders() if "Currency" in col]:
+                currencySet.add(self.DayByDay.getColumn(column)[0])
 
             self.Currency = currencySet.pop()
             while len(currencySet):
                 self.Currency += " / " + currencySet.pop()
+
+            # All rows were read out from file
+            if metrics.Enabled:
+                metrics.increment(metricDayByDayRows, self.getDayByDayRowsCount(), investment=self.InvestmentName, mode="resumed")
         else:
 
             # Loop through selected funds, assign them to the class variable `FundsQuotations`, add fund currency to the set
@@ -149,7 +254,37 @@ class Investment:
             while len(currencySet):
                 self.Currency += " / " + currencySet.pop()
 
-            self.calcInvestmentDayByDay()
+            # Stream engine resumes and writes DayByDay results on its own, keeping only the last row
+            if self.DayByDayEngine == Investment.EngineStream:
+                resumedRowsCount, calculatedRowsCount = self.streamInvestmentDayByDay()
+
+            else:
+
+                # Resume DayByDay results saved by previous run,
+                # if it was possible only days after the last resumed one have to be calculated
+                firstDate = self.resumeInvestmentDayByDay()
+                resumedRowsCount = len(self.DayByDay)
+
+                # Calculate DayByDay results with selected engine,
+                # "Batch" engine calculates them later together with other investments of the wallet
+                if self.DayByDayEngine == Investment.EngineBatch:
+                    self.IsDayByDayPending = True
+                    self.PendingFirstDate = firstDate
+                elif self.DayByDayEngine == Investment.EngineNumPy:
+                    self.calcInvestmentDayByDayVectorized(firstDate)
+                else:
+                    self.calcInvestmentDayByDay(firstDate)
+                calculatedRowsCount = len(self.DayByDay) - resumedRowsCount
+
+            # Count rows read out from file and calculated in this run
+            if metrics.Enabled:
+                metrics.increment(metricDayByDayRows, resumedRowsCount, investment=self.InvestmentName, mode="resumed")
+                metrics.increment(
+                    metricDayByDayRows,
+                    calculatedRowsCount,
+                    investment=self.InvestmentName,
+                    mode="calculated"
+                )
 
         self.calcInvestmentDuration()
 
@@ -157,86 +292,339 @@ class Investment:
 
     def importArchivedInvestmentFromFile(self) -> bool:
 
-        # Import config file to get localization of DayByDay investment files
-        config = getConfiguration()
-        investFilePath = f"{
-            config["InvestmentHistoryDayByDayDirectory"]}/{self.InvestmentName}.csv"
+        # get localization of DayByDay investment files
+        investFilePath = self.getInvestmentFilePath(self.getDayByDayDirectory())
 
         # Check if file exists
         if os.path.isfile(investFilePath):
 
-            # Open file and assign it to class attribute
-            with open(investFilePath, "r") as file:
-                self.DayByDay = list((csv.DictReader(file, delimiter='\t')))
-
-            # Convert number values to float datatype
-            for row in self.DayByDay:
-                for col in row:
-                    try:
-                        row[col] = float(row[col])
-                    except:
-                        pass
-
-            # Check if found file ends with the same date as End investment date is set
-            if parse(self.DayByDay[-1]["Date"]).date() == self.EndDate:
+            # File with value which cannot be converted (e.g. partially written) is not imported,
+            # results are calculated again and the file is rewritten
+            try:
+                if self.importArchivedInvestmentFile(investFilePath):
+                    return True
+            except ValueError:
+                pass
+
+        # If file does not exist try to read out results saved in the database
+        if self.FundsList.Database != None:
+            dayByDay = self.FundsList.Database.loadWalletDays(self.InvestmentName)
+            if dayByDay != None and len(dayByDay) and dayByDay.getDate(-1) == self.EndDate:
+                self.DayByDay = dayByDay
                 return True
 
-        # If file does not exist return False as nothing can be done
+        # If results were not saved return False as nothing can be done
         return False
 
-    def calcRefundAnalysis(self) -> None:
+    def importArchivedInvestmentFile(self, investFilePath: str) -> bool:
+
+        # Read out only headers and the last row, to check if found file ends with the same date
+        # as End investment date is set, whole file is up to date, so there is nothing to save
+        headers, lastRow = self.readInvestmentHistoryFileTail(investFilePath)
+        if lastRow == None or datetime.date.fromisoformat(lastRow[0]) != self.EndDate:
+            return False
+
+        # Stream engine keeps only the last row, it is enough to calculate investment results
+        if self.DayByDayEngine == Investment.EngineStream:
+            self.DayByDay = DayByDayTable.fromRows(headers, [lastRow])
+            self.IsDayByDayStreamed = True
+            self.LastFinalDate = lastRow[0]
+            self.setPersistedFile(
+                investFilePath,
+                self.countInvestmentHistoryRows(investFilePath),
+                os.path.getsize(investFilePath)
+            )
+            return True
+
+        # Open file and convert it to columnar table, number values are converted to float datatype
+        dayByDay, rowEndOffsets = self.readInvestmentHistoryFile(investFilePath)
+        self.DayByDay = dayByDay
+        self.setPersistedFile(investFilePath, len(dayByDay), rowEndOffsets[-1])
+
+        return True
+
+    def resumeInvestmentDayByDay(self) -> datetime.date | None:
 
-        refundPeriods = {}
+        # get localization of DayByDay investment files
+        directoryPath = self.getDayByDayDirectory()
+        investFilePath = self.getInvestmentFilePath(directoryPath)
 
-        # loop through each fund in investments
+        # Results can be resumed only if they were saved together with order book hash
+        if not (
+            os.path.isfile(investFilePath) and
+            os.path.isfile(self.getOrderBookFilePath(directoryPath))
+        ):
+            return None
+
+        # Results calculated for different order book are not valid anymore,
+        # order book or file with value which cannot be converted (e.g. partially written) is not resumed
+        try:
+            orderBook = self.loadOrderBook(directoryPath)
+            if orderBook.get(Investment.OrderBookHashKey) != self.getOrderBookHash():
+                return None
+
+            # Open file and convert it to columnar table
+            dayByDay, rowEndOffsets = self.readInvestmentHistoryFile(investFilePath)
+        except ValueError:
+            return None
+
+        # File with different columns was not created for current set of funds
+        if dayByDay.getHeaders() != self.getDayByDayHeaders():
+            return None
+
+        # Find the last row calculated with exact prices of all funds.
+        # Rows after it were calculated with nearest prices, so they can change
+        # when missing quotations are published and have to be calculated again
+        lastFinalDate = orderBook.get(Investment.LastFinalDateKey)
+        lastFinalRow = len(dayByDay) - 1
+        while lastFinalRow >= 0 and dayByDay.getDate(lastFinalRow).isoformat() != lastFinalDate:
+            lastFinalRow -= 1
+
+        # Nothing to resume if there is no final row
+        if lastFinalRow < 0:
+            return None
+
+        # Keep rows until the last final one and remember which part of the file is still valid,
+        # first offset belongs to headers line
+        dayByDay.truncate(lastFinalRow + 1)
+        self.DayByDay = dayByDay
+        self.setPersistedFile(investFilePath, len(dayByDay), rowEndOffsets[lastFinalRow + 1])
+
+        # return the first date which has to be calculated
+        return dayByDay.getDate(-1) + datetime.timedelta(days=1)
+
+    def readInvestmentHistoryFile(self, filePath: str) -> tuple[DayByDayTable, list[int]]:
+
+        # Open file in binary mode to get the size of each line,
+        # it is required to know where the file can be truncated
+        with open(filePath, "rb") as file:
+            content = file.read()
+
+        # Decode whole content at once and parse it as CSV, first row contains headers
+        reader = csv.reader(io.StringIO(content.decode(), newline=""), delimiter='\t')
+        headers = next(reader, None)
+        if headers == None:
+            return DayByDayTable(), [0]
+
+        # return table with columns converted according to headers and offset of the end of each line in the file
+        return (
+            DayByDayTable.fromRows(headers, list(reader)),
+            list(accumulate(len(line) for line in content.splitlines(keepends=True)))
+        )
+
+    def readInvestmentHistoryFileTail(
+        self,
+        filePath: str,
+        blockSize: int = 4096
+    ) -> tuple[list[str] | None, list[str] | None]:
+
+        with open(filePath, "rb") as file:
+
+            # First line contains headers
+            headers = next(csv.reader([file.readline().decode()], delimiter='\t'), None)
+            headersEnd = file.tell()
+            fileSize = file.seek(0, os.SEEK_END)
+
+            # Read blocks from the end of the file until the whole last row is read out,
+            # block is doubled if it contains only a part of the row
+            while True:
+                blockStart = max(headersEnd, fileSize - blockSize)
+                file.seek(blockStart)
+                lines = [line for line in file.read().splitlines() if line]
+                if blockStart == headersEnd or len(lines) > 1:
+                    break
+                blockSize *= 2
+
+        # File does not contain any row
+        if not lines:
+            return headers, None
+
+        # return headers and values of the last row
+        return headers, next(csv.reader([lines[-1].decode()], delimiter='\t'))
+
+    def countInvestmentHistoryRows(self, filePath: str) -> int:
+
+        # Count line ends in blocks, without parsing the file, first line contains headers
+        rowsCount = -1
+        with open(filePath, "rb") as file:
+            while block := file.read(1024 * 1024):
+                rowsCount += block.count(b"\n")
+
+        return max(rowsCount, 0)
+
+    def isDayByDayRowFinal(self, date: datetime.date) -> bool:
+
+        # Row is final if each fund had quotation established on that date
+        return all(
+            self.FundsQuotations[fund].getFundPriceOnDate(date.strftime("%Y-%m-%d")) != None
+            for fund in self.InvestmentDetails
+        )
+
+    def getLastFinalDate(self) -> str | None:
+
+        # Streamed rows are not kept in memory, the last final date was remembered while they were written
+        if self.IsDayByDayStreamed:
+            return self.LastFinalDate
+
+        # Results read out from archived file are not calculated again, so all rows are final
+        if not self.FundsQuotations:
+            return self.DayByDay.getDate(-1).isoformat() if len(self.DayByDay) else None
+
+        # Loop from the last row until the one calculated with exact prices of all funds
+        for i in range(len(self.DayByDay) - 1, -1, -1):
+            if self.isDayByDayRowFinal(self.DayByDay.getDate(i)):
+                return self.DayByDay.getDate(i).isoformat()
+
+        return None
+
+    def getDayByDayHeaders(self) -> list[str]:
+
+        # Headers in the same order as in entries returned by getOutputForCurrentDay
+        headers = ["Date", "Value", "Invested Money"]
         for fund in self.InvestmentDetails:
-            
-            refundPeriods = []
-            
-            # loop through each order for current fund
-            for i in range(0, len(self.InvestmentDetails[fund])):
-                
-                # append list of buckets between fund orders
-                refundPeriods.append(
+            headers += [
+                f"{fund} P.U.",
+                f"{fund} Value",
+                f"{fund} Invested Money",
+                f"{fund} Refund",
+                f"{fund} Currency"
+            ]
+
+        return headers
+
+    def getDayByDayDirectory(self) -> str:
+
+        # Directory provided for the investment is used instead of the one from config file
+        if self.DayByDayDirectory != None:
+            return self.DayByDayDirectory
+
+        # Import config file to get localization of DayByDay investment files
+        return getConfiguration()["InvestmentHistoryDayByDayDirectory"]
+
+    def getInvestmentFilePath(self, directoryPath: str | None = None) -> str:
+
+        # File is located in current directory if path was not provided
+        if directoryPath == None or not directoryPath:
+            return f"{self.InvestmentName}.csv"
+        return f"{directoryPath}/{self.InvestmentName}.csv"
+
+    def getOrderBookFilePath(self, directoryPath: str | None = None) -> str:
+
+        # File is located in current directory if path was not provided
+        fileName = f"{self.InvestmentName}_{Investment.OrderBookFileSuffix}.json"
+        if directoryPath == None or not directoryPath:
+            return fileName
+        return f"{directoryPath}/{fileName}"
+
+    def getOrderBookHash(self) -> str:
+
+        # Hash funds orders and end date, both of them are changing DayByDay results
+        orderBook = json.dumps([self.InvestmentDetails, self.EndDate.isoformat()])
+        return hashlib.sha256(orderBook.encode()).hexdigest()
+
+    def loadOrderBook(self, directoryPath: str | None = None) -> dict[str, str | None]:
+
+        # Open order book file and parse JSON content
+        with open(self.getOrderBookFilePath(directoryPath), "r") as orderBookFile:
+            return json.loads(orderBookFile.read())
+
+    def saveOrderBook(self, directoryPath: str | None = None) -> None:
+
+        # Open order book file and write hash with the last final date dumped to JSON structure
+        with open(self.getOrderBookFilePath(directoryPath), "w") as orderBookFile:
+            orderBookFile.write(
+                json.dumps(
                     {
-                        "startDate": parse(self.InvestmentDetails[fund][i]["BuyDate"]).date(),
-                        "endDate": None,
-                        "timeFrameInDays": None,
-                        "ParticipationUnits": None,
-                        "InvestedMoney": self.InvestmentDetails[fund][i]["Money"],
-                        "refund": None
-                    }
+                        Investment.OrderBookHashKey: self.getOrderBookHash(),
+                        Investment.LastFinalDateKey: self.getLastFinalDate()
+                    },
+                    indent=4
                 )
-                
-                # if it is not first iteration add end date for previous bucket
-                if i != 0:
-                    
-                    refundPeriods[i-1]["endDate"] = parse(
-                        self.InvestmentDetails[fund][i]["BuyDate"]
-                    ).date()
-                
+            )
 
-            # Add end date for last bucket 
-            refundPeriods[-1]["endDate"] = self.FundsQuotations[fund].getLastQuotationDate()
+        return None
 
-            # get Refund analysis based on prepared list of buckets
-            self.QuotationRefunds[fund] = (
-                self.FundsQuotations[fund]
-            ).getRefundAnalysis(refundPeriods)
+    def setPersistedFile(self, filePath: str, rowsCount: int, fileSize: int) -> None:
+
+        # Remember how many rows of DayByDay results are already saved in the file
+        self.PersistedFilePath = os.path.abspath(filePath)
+        self.PersistedRowsCount = rowsCount
+        self.PersistedFileSize = fileSize
 
         return None
-    
-    def getRefundAnalysis(self) -> dict[str , dict[str, float]]:
-        
-        try:
-            # invoke analysis calculation
-            self.calcRefundAnalysis()
-        except:
-            return None
-        
+
+    def isPersistedFile(self, filePath: str) -> bool:
+
+        # Rows can be appended only to the same file from which results were read out
+        return (
+            self.PersistedFilePath == os.path.abspath(filePath) and
+            os.path.isfile(filePath) and
+            os.path.getsize(filePath) >= self.PersistedFileSize
+        )
+
+    def getRefundAnalysisKey(self) -> tuple[str, tuple[QuotationIndex, ...]]:
+
+        # Refund analysis depends on order book and quotation of each fund,
+        # quotation index is replaced with a new one whenever fund quotation is loaded again
+        return (
+            self.getOrderBookHash(),
+            tuple(fund.getQuotationIndex() for fund in self.FundsQuotations.values())
+        )
+
+    def isRefundAnalysisValid(self, key: tuple[str, tuple[QuotationIndex, ...]]) -> bool:
+        # Analysis is valid if it was calculated for the same inputs
+        return self.RefundAnalysisKey != None and self.RefundAnalysisKey == key
+
+    def setRefundAnalysis(
+        self,
+        refunds: dict[str, dict[str, float]] | None,
+        key: tuple[str, tuple[QuotationIndex, ...]]
+    ) -> None:
+
+        # Remember analysis together with inputs used to calculate it
+        self.QuotationRefunds = refunds
+        self.RefundAnalysisKey = key
+
+        return None
+
+    def calcRefundAnalysis(self, key: tuple[str, tuple[QuotationIndex, ...]] | None = None) -> None:
+
+        # Calculate analysis of all funds in investment with batch engine
+        analysis = RefundAnalysis(
+            DaysLimit=Investment.PriceLookbackDays,
+            FundsPriceMatrix=self.FundsList.getPriceMatrix(
+                list(self.FundsQuotations),
+                Investment.getFirstOrderDate(self.InvestmentDetails)
+            )
+        )
+        analysis.addInvestment(self.InvestmentName, self.InvestmentDetails, self.FundsQuotations)
+        self.setRefundAnalysis(
+            analysis.calculate()[self.InvestmentName],
+            key if key != None else self.getRefundAnalysisKey()
+        )
+
+        return None
+
+    def getRefundAnalysis(self) -> dict[str , dict[str, float]] | None:
+
+        # Calculate analysis only if inputs have changed since the last calculation,
+        # analysis is None if it cannot be calculated (e.g. for archived investment)
+        key = self.getRefundAnalysisKey()
+        if not self.isRefundAnalysisValid(key):
+            self.calcRefundAnalysis(key)
+
         # return calculated value
         return self.QuotationRefunds
 
+    @staticmethod
+    def getFirstOrderDate(investmentDetails: dict[str, list[dict[str, float | str]]]) -> datetime.date | None:
+
+        # return the first buy date of any fund, prices are not needed before it
+        return min(
+            (parse(order["BuyDate"]).date() for orders in investmentDetails.values() for order in orders),
+            default=None
+        )
+
     def isEndDateSet(self) -> bool:
         if self.EndDate != Investment.EndDateNotSet:
             return True
@@ -253,33 +641,15 @@ class Investment:
 
     def getNearestFundPrice(self, fundID: str, date: datetime.date, daysLimit: int = 7) -> float:
         
-        # init local variables to look for fund quotation
-        daysToSubtract = 0
-        newDateToCheck = date
-        price = None
-
-        # Loop until price is None or daysToSubtract is greater than 7
-        # It makes no sense to look further in the past for the quotation of particular fund investment
-        while price == None and daysToSubtract <= daysLimit:
-
-            # calculate new date to check the quotation
-            newDateToCheck -= datetime.timedelta(
-                days=daysToSubtract
-            )
-
-            # get the fund price for new (older) date
-            # if it will be different than None, than while loop will not be continued
-            price = self.FundsQuotations[fundID].getFundPriceOnDate(
-                newDateToCheck.strftime("%Y-%m-%d")
-            )
-
-            # Increment value for next iteration if value will be still None
-            daysToSubtract += 1
-
-        return price
+        # return last fund price on or before provided date, not older than daysLimit
+        return self.FundsQuotations[fundID].getNearestFundPrice(date, daysLimit)
 
     def initResults(self) -> None:
 
+        # Reset summarized values, so results can be calculated again without doubling them
+        self.TodaysValue = 0.0
+        self.InvestedMoney = 0.0
+
         # Loop through each fund, to calculate latest results
         for fund in self.InvestmentDetails:
 
@@ -288,22 +658,22 @@ class Investment:
 
             # Set current participation units
             self.Results[fund]["ParticipationUnits"] = (
-                self.DayByDay[-1][f"{fund} P.U."]
+                self.DayByDay.getLastValue(f"{fund} P.U.")
             )
 
             # Set invested in fund money
             self.Results[fund]["InvestedMoney"] = (
-                self.DayByDay[-1][f"{fund} Invested Money"]
+                self.DayByDay.getLastValue(f"{fund} Invested Money")
             )
 
             # Set the fund value for today
             self.Results[fund]["TodaysValue"] = (
-                self.DayByDay[-1][f"{fund} Value"]
+                self.DayByDay.getLastValue(f"{fund} Value")
             )
 
             # Set refund rate
             self.Results[fund]["RefundRate"] = (
-                self.DayByDay[-1][f"{fund} Refund"] * 100
+                self.DayByDay.getLastValue(f"{fund} Refund") * 100
             )
 
             # Add value of today's Fund value to calculate today's value of investment
@@ -560,8 +930,17 @@ class Investment:
 
         return None
 
-    def calcInvestmentDayByDay(self) -> None:
+    def calcInvestmentDayByDay(self, firstDate: datetime.date | None = None) -> None:
+
+        # Append result attribute with each calculated row
+        for row, isFinal in self.iterInvestmentDayByDay(firstDate):
+            self.DayByDay.appendRow(row)
+
+        return None
+
+    def iterInvestmentDayByDay(self, firstDate: datetime.date | None = None):
 
+        # Generator yields each row together with flag if it was calculated with exact prices of all funds
         # Init local calculation variables
         fundsOperationsByDate = self.initFundsOperationsByDate()
         fundsCumulatively = self.initFundsCumulatively()
@@ -569,6 +948,18 @@ class Investment:
         # Get first date when any fund of the investment was bought
         currentProcessingDate = sorted(list(fundsOperationsByDate.keys()))[0]
 
+        # If calculation is resumed, apply operations done before the first date to calculate
+        # in the same order as they would be applied day after day, and start from that date
+        if firstDate != None:
+            for date in sorted(list(fundsOperationsByDate.keys())):
+                if date < firstDate:
+                    fundsCumulatively = self.appendFundsCumulatively(
+                        date,
+                        fundsCumulatively,
+                        fundsOperationsByDate
+                    )
+            currentProcessingDate = max(currentProcessingDate, firstDate)
+
         # Loop until the current date is less or equal to today's date or investment end date
         while (
             (currentProcessingDate <= datetime.date.today()) and
@@ -623,43 +1014,26 @@ class Investment:
 
                 # Loop thorough each fund with None price,
                 # for each fund we will try to find quotation for previous days before this currently being processed.
+                # It makes no sense to look further in the past than 7 days for the quotation of particular fund investment
                 for fund in fundsWithoutPrice:
-
-                    # init local variables to look for fund quotation
-                    daysToSubtract = 1
-                    newDateToCheck = currentProcessingDate
-
-                    # Loop until price is None or daysToSubtract is greater than 7
-                    # It makes no sense to look further in the past for the quotation of particular fund investment
-                    while tempInvestDetails[fund]["price"] == None and daysToSubtract <= 7:
-
-                        # calculate new date to check the quotation
-                        newDateToCheck -= datetime.timedelta(
-                            days=daysToSubtract
-                        )
-
-                        # get the fund price for new (older) date
-                        # if it will be different than None, than while loop will not be continued
-                        tempInvestDetails[fund]["price"] = self.FundsQuotations[fund].getFundPriceOnDate(
-                            newDateToCheck.strftime("%Y-%m-%d")
-                        )
-
-                        # Increment value for next iteration if value will be still None
-                        daysToSubtract += 1
+                    tempInvestDetails[fund]["price"] = self.getNearestFundPrice(
+                        fund, currentProcessingDate
+                    )
 
             # Check if all funds of the investment have the price found.
             # Dates with missing fund values will not be included in DayByDay investment result.
-            # We have to keep this condition according to the while loop above with additional exit condition:
-            # daysToSubtract <= 7
+            # We have to keep this condition according to the lookup above with days limit
             if None not in [tempInvestDetails[fund]["price"] for fund in tempInvestDetails.keys()]:
 
-                # Append result attribute with the proper output
-                self.DayByDay.append(
+                # Return the proper output, rows are calculated only when they are requested.
+                # Row is final if each fund had quotation established on that date (no nearest price was used)
+                yield (
                     self.getOutputForCurrentDay(
                         currentDate=currentProcessingDate,
                         todaysFundStats=tempInvestDetails,
                         fundsCumulatively=fundsCumulatively
-                    )
+                    ),
+                    not fundsWithoutPrice
                 )
 
             # Increment calculation date with +1 day
@@ -667,32 +1041,419 @@ class Investment:
 
         return None
 
+    def streamInvestmentDayByDay(self) -> tuple[int, int]:
+
+        # get localization of DayByDay investment files
+        directoryPath = self.getDayByDayDirectory()
+        investFilePath = self.getInvestmentFilePath(directoryPath)
+
+        # Resume only the last final row saved by previous run,
+        # if it was possible only days after it have to be calculated
+        firstDate = self.resumeStreamedInvestmentDayByDay(directoryPath)
+        resumedRowsCount = self.PersistedRowsCount if firstDate != None else 0
+        calculatedRowsCount = 0
+
+        # Remove rows which will be calculated again, if there were any
+        if firstDate != None and os.path.getsize(investFilePath) != self.PersistedFileSize:
+            os.truncate(investFilePath, self.PersistedFileSize)
+
+        # open file to append resumed results or to write them from scratch
+        with open(investFilePath, "a" if firstDate != None else "w") as investHistory:
+
+            # Init CSV writer and write headers if file is created from scratch
+            writer = csv.writer(investHistory, delimiter='\t')
+            if firstDate == None:
+                writer.writerow(self.getDayByDayHeaders())
+
+            # Write each row as soon as it is calculated, only the last one is kept
+            lastRow = None
+            for lastRow, isFinal in self.iterInvestmentDayByDay(firstDate):
+                writer.writerow(lastRow.values())
+                calculatedRowsCount += 1
+
+                # Remember the last row calculated with exact prices of all funds
+                if isFinal:
+                    self.LastFinalDate = lastRow["Date"]
+
+        # Keep the last row in memory, it is enough to calculate investment results
+        if lastRow != None:
+            self.DayByDay = DayByDayTable()
+            self.DayByDay.appendRow(lastRow)
+
+        # Remember that all rows are saved and save order book, so next run can resume results from this file
+        self.IsDayByDayStreamed = True
+        self.setPersistedFile(
+            investFilePath,
+            resumedRowsCount + calculatedRowsCount,
+            os.path.getsize(investFilePath)
+        )
+        self.saveOrderBook(directoryPath)
+
+        return resumedRowsCount, calculatedRowsCount
+
+    def resumeStreamedInvestmentDayByDay(self, directoryPath: str) -> datetime.date | None:
+
+        investFilePath = self.getInvestmentFilePath(directoryPath)
+
+        # Results can be resumed only if they were saved together with order book hash
+        if not (
+            os.path.isfile(investFilePath) and
+            os.path.isfile(self.getOrderBookFilePath(directoryPath))
+        ):
+            return None
+
+        # Results calculated for different order book are not valid anymore,
+        # order book which cannot be parsed (e.g. partially written) is not resumed
+        try:
+            orderBook = self.loadOrderBook(directoryPath)
+        except ValueError:
+            return None
+        if orderBook.get(Investment.OrderBookHashKey) != self.getOrderBookHash():
+            return None
+
+        # Nothing to resume if there is no final row
+        lastFinalDate = orderBook.get(Investment.LastFinalDateKey)
+        if lastFinalDate == None:
+            return None
+
+        # Read file line by line in binary mode to get the size of each line,
+        # only the row of the last final date is kept
+        lastFinalRow = None
+        with open(investFilePath, "rb") as file:
+
+            # File with different columns was not created for current set of funds
+            headers = next(csv.reader([file.readline().decode()], delimiter='\t'), None)
+            if headers != self.getDayByDayHeaders():
+                return None
+
+            rowEndOffset = file.tell()
+            rowsCount = 0
+            for line in file:
+                rowEndOffset += len(line)
+                rowsCount += 1
+                if line.startswith(f"{lastFinalDate}\t".encode()):
+                    lastFinalRow = (line, rowsCount, rowEndOffset)
+
+        # Final date was not found in the file
+        if lastFinalRow == None:
+            return None
+
+        # Keep the last final row and remember which part of the file is still valid,
+        # row with value which cannot be converted is not resumed
+        try:
+            self.DayByDay = DayByDayTable.fromRows(
+                headers,
+                list(csv.reader([lastFinalRow[0].decode()], delimiter='\t'))
+            )
+        except ValueError:
+            return None
+        self.LastFinalDate = lastFinalDate
+        self.setPersistedFile(investFilePath, lastFinalRow[1], lastFinalRow[2])
+
+        # return the first date which has to be calculated
+        return self.DayByDay.getDate(-1) + datetime.timedelta(days=1)
+
+    def getDayByDayRowsCount(self) -> int:
+
+        # Streamed rows are saved only in the file
+        if self.IsDayByDayStreamed:
+            return self.PersistedRowsCount
+        return len(self.DayByDay)
+
+    def iterDayByDayRowValues(self, afterDate: str | None = None):
+
+        # Rows kept in memory are returned directly, rows until provided date are skipped
+        if not self.IsDayByDayStreamed:
+            yield from self.DayByDay.iterRowValues(
+                bisect.bisect_right(self.DayByDay.Dates, datetime.date.fromisoformat(afterDate).toordinal())
+                if afterDate != None else 0
+            )
+            return None
+
+        # Streamed rows are read out from the file line by line,
+        # numeric columns are converted to floats the same as in columnar table
+        with open(self.PersistedFilePath, "r") as investHistory:
+            reader = csv.reader(investHistory, delimiter='\t')
+            isTextColumn = [
+                header == DayByDayTable.DateHeader or DayByDayTable.isTextHeader(header)
+                for header in next(reader)
+            ]
+            for row in reader:
+                if afterDate != None and row[0] <= afterDate:
+                    continue
+                yield [
+                    value if isText else float(value)
+                    for value, isText in zip(row, isTextColumn)
+                ]
+
+        return None
+
+    def getDateAxis(
+        self,
+        fundsOperationsByDate: dict[datetime.date, dict[str, dict[str, float]]],
+        firstDate: datetime.date | None = None
+    ) -> np.ndarray:
+
+        # Get first date when any fund of the investment was bought (or first date to calculate if resumed)
+        # and last date which is today's date or investment end date
+        axisStartDate = min(fundsOperationsByDate.keys())
+        if firstDate != None:
+            axisStartDate = max(axisStartDate, firstDate)
+        lastDate = min(datetime.date.today(), self.EndDate)
+
+        # return ordinals of each calendar day between them
+        return np.arange(
+            axisStartDate.toordinal(),
+            lastDate.toordinal() + 1,
+            dtype=np.int64
+        )
+
+    def getFundPricesOnAxis(self, fund: str, dateAxis: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+
+        # Read out prices of the fund from calendar-aligned price matrix shared by all investments,
+        # matrix is extended only if any fund of the investment or date of the axis is not placed in it yet
+        priceMatrix = self.FundsList.getPriceMatrix(
+            list(self.FundsQuotations),
+            datetime.date.fromordinal(int(dateAxis[0]))
+        )
+
+        # return prices with NaN for dates without valid price and exact price mask
+        return priceMatrix.getFundPricesOnAxis(fund, dateAxis, Investment.PriceLookbackDays)
+
+    def getFundOrderDeltasOnAxis(
+        self,
+        fund: str,
+        dateAxis: np.ndarray,
+        fundsOperationsByDate: dict[datetime.date, dict[str, dict[str, float]]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+
+        # Init arrays with bought participation units and invested money for each date on the axis
+        units = np.zeros(len(dateAxis))
+        money = np.zeros(len(dateAxis))
+
+        # Init sums of operations done before the first date on the axis (calculation resumed)
+        unitsBefore = 0.0
+        moneyBefore = 0.0
+
+        # Place operations of the fund on the axis, operations after the last date are not included,
+        # operations before the first date are summed up day after day as in full calculation
+        for date in sorted(list(fundsOperationsByDate.keys())):
+            operations = fundsOperationsByDate[date]
+            position = date.toordinal() - dateAxis[0]
+            if fund not in operations or position >= len(dateAxis):
+                continue
+            if position < 0:
+                unitsBefore += operations[fund]["ParticipationUnits"]
+                moneyBefore += operations[fund]["Money"]
+            else:
+                units[position] = operations[fund]["ParticipationUnits"]
+                money[position] = operations[fund]["Money"]
+
+        # Add operations done before the axis to the first date
+        units[0] += unitsBefore
+        money[0] += moneyBefore
+
+        # return units and money bought at each date
+        return units, money
+
+    def getFundOrdersOnAxis(
+        self,
+        fund: str,
+        dateAxis: np.ndarray,
+        fundsOperationsByDate: dict[datetime.date, dict[str, dict[str, float]]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+
+        # return cumulative sum of units and money owned at each date
+        units, money = self.getFundOrderDeltasOnAxis(fund, dateAxis, fundsOperationsByDate)
+        return np.cumsum(units), np.cumsum(money)
+
+    def isDayByDayPending(self) -> bool:
+        return self.IsDayByDayPending
+
+    def getPendingFirstDate(self) -> datetime.date | None:
+        return self.PendingFirstDate
+
+    def completeDayByDay(self, table: DayByDayTable | None) -> None:
+
+        # Append rows calculated by WalletEvaluation (None if there were no days to calculate)
+        if table != None:
+            self.DayByDay.extend(table)
+            if metrics.Enabled:
+                metrics.increment(metricDayByDayRows, len(table), investment=self.InvestmentName, mode="calculated")
+        self.IsDayByDayPending = False
+        self.PendingFirstDate = None
+
+        return None
+
+    def calcInvestmentDayByDayVectorized(self, firstDate: datetime.date | None = None) -> None:
+
+        # Init local calculation variables
+        fundsOperationsByDate = self.initFundsOperationsByDate()
+        dateAxis = self.getDateAxis(fundsOperationsByDate, firstDate)
+
+        # Nothing to calculate if investment ended before first fund was bought
+        # or there are no new days after resumed results
+        if len(dateAxis) == 0:
+            return None
+
+        # Init local variables for arrays of each fund and masks for all dates on the axis
+        prices = {}
+        units = {}
+        money = {}
+        isAnyExact = np.zeros(len(dateAxis), dtype=bool)
+        isAllPriced = np.ones(len(dateAxis), dtype=bool)
+
+        # Loop through each fund in investment and get its arrays aligned to the date axis
+        for fund in self.InvestmentDetails:
+            prices[fund], isExact = self.getFundPricesOnAxis(fund, dateAxis)
+            units[fund], money[fund] = self.getFundOrdersOnAxis(fund, dateAxis, fundsOperationsByDate)
+
+            isAnyExact |= isExact
+            isAllPriced &= ~np.isnan(prices[fund])
+
+        # Dates are included only if any fund has quotation established for that day
+        # (there is nothing to calculate during the weekends or bank holidays)
+        # and all funds have price found within lookback limit
+        isIncluded = isAnyExact & isAllPriced
+
+        # Calculate investment value and invested money summed in the same order as funds
+        value = np.zeros(np.count_nonzero(isIncluded))
+        investedMoney = np.zeros(np.count_nonzero(isIncluded))
+        for fund in self.InvestmentDetails:
+            value += units[fund][isIncluded] * prices[fund][isIncluded]
+            investedMoney += money[fund][isIncluded]
+
+        # Round values of each fund with numpy, half cents can be rounded in different direction
+        # than with built-in round used by day after day engine
+        fundsValue = {
+            fund: np.round(units[fund][isIncluded] * prices[fund][isIncluded], 2)
+            for fund in self.InvestmentDetails
+        }
+
+        # Refund is 0 if there is no money invested in the fund yet
+        fundsRefund = {}
+        for fund in self.InvestmentDetails:
+            fundMoney = money[fund][isIncluded]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                fundsRefund[fund] = np.round(
+                    np.where(fundMoney != 0, (fundsValue[fund] / fundMoney) - 1, 0.0), 4
+                )
+
+        # Append calculated columns to class attribute (empty if calculation was not resumed)
+        self.DayByDay.extend(
+            DayByDayTable.fromColumns(
+                dateAxis[isIncluded].tolist(),
+                self.getDayByDayColumns(
+                    value=np.round(value, 2),
+                    investedMoney=investedMoney,
+                    fundsUnits={fund: units[fund][isIncluded] for fund in self.InvestmentDetails},
+                    fundsValue=fundsValue,
+                    fundsMoney={
+                        fund: np.round(money[fund][isIncluded], 2)
+                        for fund in self.InvestmentDetails
+                    },
+                    fundsRefund=fundsRefund
+                )
+            )
+        )
+
+        return None
+
+    def getDayByDayColumns(
+        self,
+        value: list[float] | np.ndarray,
+        investedMoney: list[float] | np.ndarray,
+        fundsUnits: dict[str, np.ndarray],
+        fundsValue: dict[str, list[float] | np.ndarray],
+        fundsMoney: dict[str, list[float] | np.ndarray],
+        fundsRefund: dict[str, list[float] | np.ndarray]
+    ) -> dict[str, list[float] | np.ndarray | str]:
+
+        # Build columns with currency of each fund in investment
+        return Investment.buildDayByDayColumns(
+            {fund: self.FundsQuotations[fund].getCurrency() for fund in self.InvestmentDetails},
+            value,
+            investedMoney,
+            fundsUnits,
+            fundsValue,
+            fundsMoney,
+            fundsRefund
+        )
+
+    @staticmethod
+    def buildDayByDayColumns(
+        fundsCurrency: dict[str, str],
+        value: list[float] | np.ndarray,
+        investedMoney: list[float] | np.ndarray,
+        fundsUnits: dict[str, np.ndarray],
+        fundsValue: dict[str, list[float] | np.ndarray],
+        fundsMoney: dict[str, list[float] | np.ndarray],
+        fundsRefund: dict[str, list[float] | np.ndarray]
+    ) -> dict[str, list[float] | np.ndarray | str]:
+
+        # Init DayByDay columns in the same order and structure as day after day engine
+        columns = {
+            "Value": value,
+            "Invested Money": investedMoney
+        }
+
+        # Loop through each fund to add fund's related columns
+        for fund, currency in fundsCurrency.items():
+            columns[f"{fund} P.U."] = fundsUnits[fund]
+            columns[f"{fund} Value"] = fundsValue[fund]
+            columns[f"{fund} Invested Money"] = fundsMoney[fund]
+            columns[f"{fund} Refund"] = fundsRefund[fund]
+            columns[f"{fund} Currency"] = currency
+
+        return columns
+
     def saveInvestmentHistoryDayByDay(self, destinationPath=None) -> None:
 
         # Check if destination Path was provided and create appropriate `destinationFilePath`
-        if destinationPath == None or not destinationPath:
-            destinationFilePath = f"{self.InvestmentName}.csv"
+        destinationFilePath = self.getInvestmentFilePath(destinationPath)
+
+        # Streamed rows were already written, the file can be only copied to different destination
+        if self.IsDayByDayStreamed:
+            if not self.isPersistedFile(destinationFilePath):
+                shutil.copyfile(self.PersistedFilePath, destinationFilePath)
+            self.saveOrderBook(destinationPath)
+            return None
+
+        # If results were resumed from the same file, only new rows have to be written
+        if self.isPersistedFile(destinationFilePath):
+
+            # Remove rows which were calculated again, if there were any
+            if os.path.getsize(destinationFilePath) != self.PersistedFileSize:
+                os.truncate(destinationFilePath, self.PersistedFileSize)
+
+            # open file to append Day to day investment stats
+            with open(destinationFilePath, "a") as investHistory:
+
+                # Init CSV writer and write values of each newly calculated date to file
+                writer = csv.writer(investHistory, delimiter='\t')
+                writer.writerows(self.DayByDay.iterRowValues(self.PersistedRowsCount))
+
         else:
-            destinationFilePath = f"{
-                destinationPath}/{self.InvestmentName}.csv"
 
-        # open file to write Day to day investment stats
-        with open(destinationFilePath, "w") as investHistory:
+            # open file to write Day to day investment stats
+            with open(destinationFilePath, "w") as investHistory:
 
-            # Init CSV writer and write headers to the file
-            writer = csv.writer(investHistory, delimiter='\t')
-            
-            # write headers to file
-            writer.writerow(list(self.DayByDay[0].keys()))
-            
-            # loop through each calculated date
-            for i in range(0, len(self.DayByDay)):
-                
-                # convert values for current date to list and write them to file
-                writer.writerow(
-                    list(
-                        self.DayByDay[i].values()
-                    )
-                )
+                # Init CSV writer and write headers to the file
+                writer = csv.writer(investHistory, delimiter='\t')
+
+                # write headers to file
+                writer.writerow(self.DayByDay.getHeaders())
+
+                # write values of each calculated date to file
+                writer.writerows(self.DayByDay.iterRowValues())
+
+        # Remember that all rows are saved and save order book,
+        # so next run can resume results from this file
+        self.setPersistedFile(
+            destinationFilePath,
+            len(self.DayByDay),
+            os.path.getsize(destinationFilePath)
+        )
+        self.saveOrderBook(destinationPath)
 
         return None
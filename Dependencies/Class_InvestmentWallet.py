@@ -62,10 +62,19 @@
                 }
             EndDate in JSON structure can be set to empty string or does not exist
         - FundsList <- an instance of ListOfFunds with already downloaded data from web
+    Optional keywords:
+        - DayByDayEngine <- engine used by each Investment to calculate DayByDay results ("NumPy", "Python" or "Stream"),
+                            "Batch" to calculate DayByDay results of all investments at once with WalletEvaluation
+        - Timer <- StageTimer to measure calculation of each investment
+        - MaxWorkerProcesses <- number of processes calculating DayByDay results of "Batch" engine,
+                                investments are split between them and fund prices are shared
+                                through shared memory, 1 (default) calculates them in current process
+        - DayByDayDirectory <- directory of DayByDay files resumed by each Investment,
+                                "InvestmentHistoryDayByDayDirectory" from config file is used if it is not provided
         
 .NOTES
 
-    Version:            1.4
+    Version:            1.5
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
@@ -80,11 +89,31 @@
     2024-02-21      Stanisław Horna         Adjustments to calling Investment Class contractor and methods.
     2024-03-12      Stanisław Horna         printQuotationRefundAnalysis method to display analysis,
                                             based on the payments, timing and invested money
+    2026-10-17      Stanisław Horna         getActiveFundIDs returns funds referenced by active investments,
+                                            so only they can be downloaded before wallet calculation.
+                                            DayByDayEngine passed to each Investment.
+                                            Optional measurement of each investment calculation with StageTimer.
+                                            DayByDay results saved also in QuotationDatabase of FundsList, if it is used.
+                                            DayByDay rows streamed to file are read out from it to save them in the database
+                                            Refund analysis of all investments calculated at once (calcRefundAnalysis).
+                                            Price matrix of funds used by active investments built once before
+                                            investments are calculated.
+                                            DayByDay results of investments created with "Batch" engine calculated
+                                            together over shared date axis (calcPendingDayByDay).
+                                            Optional calculation of "Batch" engine in worker processes
+                                            with price matrix in shared memory (MaxWorkerProcesses).
+                                            Directory of DayByDay files passed to each Investment.
+                                            Only DayByDay rows after the last final date are saved in the database.
+                                            Price matrix built before investments are created only for "NumPy" engine.
+                                            Price matrix requested only from the first order date of used investments.
+                                            Worker processes started with forkserver or spawn method.
 
 """
 
 # Official and 3-rd party imports
 import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from tabulate import tabulate
 import datetime
@@ -95,7 +124,12 @@ from Dependencies.Function_Conversion import convertNumericToStrPlsMnsSigns
 
 # Custom created class modules
 from Dependencies.Class_Investment import Investment
+from Dependencies.Class_RefundAnalysis import RefundAnalysis
+from Dependencies.Class_WalletEvaluation import WalletEvaluation
+from Dependencies.Class_SharedPriceMatrix import SharedPriceMatrix
+from Dependencies.Class_DayByDayTable import DayByDayTable
 from Dependencies.Class_ListOfFund import ListOfFunds
+from Dependencies.Class_StageTimer import StageTimer, disabledStageTimer
 
 
 @dataclass(kw_only=True)
@@ -104,6 +138,10 @@ class InvestmentWallet:
     # Initialization Variables
     InvestmentsFilePath: str
     FundsList: ListOfFunds
+    DayByDayEngine: str = Investment.EngineNumPy
+    Timer: StageTimer = field(default_factory=lambda: disabledStageTimer)
+    MaxWorkerProcesses: int = 1
+    DayByDayDirectory: str | None = None
 
     TableFormatInvestmentResults: str = "simple_grid"
     TableFormatRefundAnalysis: str = "github"
@@ -114,36 +152,180 @@ class InvestmentWallet:
         default_factory=dict, init=False
     )
 
+    # Constant Variables
+    WorkerStartMethods = ["forkserver", "spawn"]
+
     def __post_init__(self):
         # Open investment file and parse JSON content
-        with open(self.InvestmentsFilePath, "r") as Invest:
-            investments = json.loads(str("\n".join(Invest.readlines())))
+        investments = InvestmentWallet.readInvestmentsFile(self.InvestmentsFilePath)
+
+        # "NumPy" engine reads out prices from price matrix while each investment is created,
+        # so matrix of funds used by active investments from their first order is built once before,
+        # otherwise it would be extended each time investment with not placed fund is calculated.
+        # Other engines do not read it, "Batch" engine and refund analysis build it when they are calculated
+        if self.DayByDayEngine == Investment.EngineNumPy:
+            self.FundsList.getPriceMatrix(
+                [
+                    fund for fund in InvestmentWallet.getActiveFunds(investments)
+                    if fund in self.FundsList.ListOfFunds
+                ],
+                InvestmentWallet.getActiveFirstOrderDate(investments)
+            )
 
         # Loop through each configured investment
         # Create separate Investment class instance for each of it
         for item in investments:
 
             # Parse start date and end date for constructor of investment class
-            startDate = parse(investments[item]["StartDate"]).date()
-            if "EndDate" in list(investments[item].keys()):
-                try:
-                    endDate = parse(investments[item]["EndDate"]).date()
-                except:
-                    endDate = Investment.EndDateNotSet
-            else:
-                endDate = Investment.EndDateNotSet
+            startDate, endDate = InvestmentWallet.parseInvestmentDates(investments[item])
 
-            self.Wallets[item] = Investment(
-                InvestmentDetails=investments[item]["Funds"],
-                InvestmentName = item,
-                StartDate=startDate,
-                EndDate=endDate,
-                FundsList=self.FundsList
-            )
+            with self.Timer.measureItem("DayByDay", Investment=item) as measurement:
+                self.Wallets[item] = Investment(
+                    InvestmentDetails=investments[item]["Funds"],
+                    InvestmentName = item,
+                    StartDate=startDate,
+                    EndDate=endDate,
+                    FundsList=self.FundsList,
+                    DayByDayEngine=self.DayByDayEngine,
+                    DayByDayDirectory=self.DayByDayDirectory
+                )
+                measurement["Rows"] = self.Wallets[item].getDayByDayRowsCount()
+
+        # Calculate DayByDay results left pending by "Batch" engine for all investments at once
+        self.calcPendingDayByDay()
 
         self.calcWalletResults()
         return None
 
+    @staticmethod
+    def readInvestmentsFile(InvestmentsFilePath: str) -> dict[str, dict]:
+        # Open investment file and parse JSON content
+        with open(InvestmentsFilePath, "r") as Invest:
+            return json.loads(str("\n".join(Invest.readlines())))
+
+    @staticmethod
+    def parseInvestmentDates(investment: dict) -> tuple[datetime.date, datetime.date]:
+        # Parse start date and end date,
+        # if end date is not set or it is not a valid date investment is still active
+        startDate = parse(investment["StartDate"]).date()
+        if "EndDate" in list(investment.keys()):
+            try:
+                endDate = parse(investment["EndDate"]).date()
+            except:
+                endDate = Investment.EndDateNotSet
+        else:
+            endDate = Investment.EndDateNotSet
+
+        return startDate, endDate
+
+    @staticmethod
+    def getActiveFundIDs(InvestmentsFilePath: str) -> list[str]:
+        # return funds of investments read out from the file
+        return InvestmentWallet.getActiveFunds(
+            InvestmentWallet.readInvestmentsFile(InvestmentsFilePath)
+        )
+
+    @staticmethod
+    def getActiveFunds(investments: dict[str, dict]) -> list[str]:
+        # Init local variable to collect IDs without duplicates, keeping the order
+        fundIDs = {}
+
+        # Loop through investments which are not ended,
+        # ended ones are read out from DayByDay file and do not need fund quotation
+        for item in investments:
+            if InvestmentWallet.parseInvestmentDates(investments[item])[1] == Investment.EndDateNotSet:
+                fundIDs.update(dict.fromkeys(investments[item]["Funds"]))
+
+        return list(fundIDs)
+
+    @staticmethod
+    def getActiveFirstOrderDate(investments: dict[str, dict]) -> datetime.date | None:
+
+        # return the first buy date of investments which are not ended
+        return min(
+            [
+                firstDate for item in investments
+                if InvestmentWallet.parseInvestmentDates(investments[item])[1] == Investment.EndDateNotSet
+                and (firstDate := Investment.getFirstOrderDate(investments[item]["Funds"])) != None
+            ],
+            default=None
+        )
+
+    @staticmethod
+    def getWalletsFirstOrderDate(items: list[Investment]) -> datetime.date | None:
+
+        # return the first buy date of provided investments
+        return min(
+            [
+                firstDate for item in items
+                if (firstDate := Investment.getFirstOrderDate(item.InvestmentDetails)) != None
+            ],
+            default=None
+        )
+
+    def calcPendingDayByDay(self) -> None:
+
+        # Collect investments which DayByDay results were not calculated yet
+        pending = [item for item in self.Wallets.values() if item.isDayByDayPending()]
+        if not pending:
+            return None
+
+        # Calculate them together over date axis shared by all of them
+        evaluation = WalletEvaluation(
+            FundsPriceMatrix=self.FundsList.getPriceMatrix(
+                [fund for item in pending for fund in item.FundsQuotations],
+                InvestmentWallet.getWalletsFirstOrderDate(pending)
+            ),
+            DaysLimit=Investment.PriceLookbackDays
+        )
+        with self.Timer.measureItem("DayByDay", Investment=Investment.EngineBatch) as measurement:
+            for item in pending:
+                evaluation.addInvestment(item)
+
+            # Split investments between worker processes if more than one is allowed
+            if self.MaxWorkerProcesses > 1 and evaluation.getWalletsCount() > 1:
+                results = self.calcEvaluationInProcesses(evaluation)
+            else:
+                results = evaluation.calculate()
+
+            # Append results in the same order as investments in wallet
+            for item in pending:
+                item.completeDayByDay(results[item.InvestmentName])
+            measurement["Rows"] = sum(item.getDayByDayRowsCount() for item in pending)
+
+        return None
+
+    def calcEvaluationInProcesses(self, evaluation: WalletEvaluation) -> dict[str, DayByDayTable | None]:
+
+        # Split investments into parts with similar number of calculated cells, one part per process
+        parts = evaluation.split(min(self.MaxWorkerProcesses, evaluation.getWalletsCount()))
+
+        # Place price matrix in shared memory, so processes read it out instead of receiving its copy,
+        # shared memory is removed when all parts are calculated
+        results = {}
+        with SharedPriceMatrix.create(evaluation.FundsPriceMatrix) as sharedMatrix:
+            with ProcessPoolExecutor(max_workers=len(parts), mp_context=InvestmentWallet.getWorkerContext()) as executor:
+                calculations = [
+                    executor.submit(WalletEvaluation.calculateShared, part, sharedMatrix.getHandle())
+                    for part in parts
+                ]
+
+                # Collect DayByDay results of each part, error of any part is raised
+                for calculation in calculations:
+                    results.update(calculation.result())
+
+        return results
+
+    @staticmethod
+    def getWorkerContext() -> multiprocessing.context.BaseContext:
+
+        # Worker processes are started without copying the main process (fork), which can hold locks
+        # of running threads (e.g. connection pool), forkserver is used if it is available, spawn otherwise
+        startMethods = multiprocessing.get_all_start_methods()
+        return multiprocessing.get_context(
+            next(method for method in InvestmentWallet.WorkerStartMethods if method in startMethods)
+        )
+
     def calcRefundDetails(self):
         # Invoke Refund calculation for each child Investment class
         for item in self.Wallets:
@@ -220,9 +402,37 @@ class InvestmentWallet:
 
         return None
 
+    def calcRefundAnalysis(self) -> None:
+
+        # Collect investments which analysis was not calculated yet for current inputs
+        analysis = RefundAnalysis(
+            DaysLimit=Investment.PriceLookbackDays,
+            FundsPriceMatrix=self.FundsList.getPriceMatrix(
+                [fund for item in self.Wallets.values() for fund in item.FundsQuotations],
+                InvestmentWallet.getWalletsFirstOrderDate(
+                    [item for item in self.Wallets.values() if item.FundsQuotations]
+                )
+            )
+        )
+        keys = {}
+        for name, item in self.Wallets.items():
+            key = item.getRefundAnalysisKey()
+            if not item.isRefundAnalysisValid(key):
+                keys[name] = key
+                analysis.addInvestment(name, item.InvestmentDetails, item.FundsQuotations)
+
+        # Calculate all of them at once and cache results in each investment
+        for name, refunds in analysis.calculate().items():
+            self.Wallets[name].setRefundAnalysis(refunds, keys[name])
+
+        return None
+
     def printRefundAnalysis(self):
         
         dataList = []
+
+        # Calculate analysis of all investments at once, results are cached in each investment
+        self.calcRefundAnalysis()
         
         # Loop through investments in wallet
         for item in self.Wallets.values():
@@ -253,3 +463,27 @@ class InvestmentWallet:
         # Invoke saving Investment history day by day for each Investment class instance
         for item in self.Wallets:
             self.Wallets[item].saveInvestmentHistoryDayByDay(destinationPath)
+
+            # Save the same rows in the database if it is used
+            if self.FundsList.Database != None:
+                self.saveWalletDaysInDatabase(self.Wallets[item])
+
+    def saveWalletDaysInDatabase(self, investment: Investment) -> None:
+
+        # Rows saved by previous run until the last final date are kept if order book has not changed,
+        # so only rows after that date are written
+        headers = investment.DayByDay.getHeaders()
+        orderBookHash = investment.getOrderBookHash()
+        keptUntilDate = self.FundsList.Database.getWalletLastFinalDate(
+            investment.InvestmentName, headers, orderBookHash
+        )
+        self.FundsList.Database.saveWalletDays(
+            investment.InvestmentName,
+            headers,
+            investment.iterDayByDayRowValues(keptUntilDate),
+            orderBookHash=orderBookHash,
+            lastFinalDate=investment.getLastFinalDate(),
+            keptUntilDate=keptUntilDate
+        )
+
+        return None
@@ -7,11 +7,24 @@
     
 .INITIALIZATION
     Class construction requires only and list of valid URLs to funds on www.analizy.pl
+    Constructor does not download any data, .prefetch() downloads selected funds concurrently
+    Optional keywords:
+        - MaxConcurrentDownloads <- number of funds downloaded at the same time
+        - RequestTimeout <- time in seconds to wait for the server response for single request
+        - QuotationStoreDirectory <- directory of local quotation store, store is not used if it is not provided
+        - LatestDetailsSource <- "Page" to read out latest fund details from fund page,
+                                "Quotation" to calculate them from downloaded quotation
+        - Timer <- StageTimer to measure download of each fund and each web request
+        - MaxConcurrentWrites <- number of fund quotation files written at the same time
+        - DatabaseFilePath <- path to SQLite database file (QuotationDatabase), if it is provided
+                                database is used as local quotation store instead of QuotationStoreDirectory
+                                and todays results are saved in it as well.
+                                Pending writes are committed with .close() at the end of the run
         
 
 .NOTES
 
-    Version:            1.1
+    Version:            1.2
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
@@ -21,10 +34,34 @@
     Date            Who                     What
     2024-02-21      Stanisław Horna         Raising an custom exception in .getFundByID(),
                                             if fund with ID passed as method argument does not exist
+    2026-10-17      Stanisław Horna         Funds downloaded concurrently with bounded worker pool,
+                                            failed downloads collected in FailedFunds instead of aborting the whole list.
+                                            Optional local QuotationStore shared by all funds.
+                                            HTTPTransport with connection pool shared by all funds,
+                                            HTTP validators saved in QuotationStore directory.
+                                            Source of latest fund details passed to each fund.
+                                            Funds are not downloaded in constructor, .prefetch() downloads only
+                                            selected funds, remaining ones are loaded on first access.
+                                            Optional measurement of each fund download with StageTimer.
+                                            Failed downloads counted in metrics registry.
+                                            Quotations can be saved in binary archive format.
+                                            Optional QuotationDatabase used as local quotation store,
+                                            todays results saved also in the database.
+                                            Quotation files written concurrently by OutputWriter, each file
+                                            is replaced atomically and only if its content has changed
+                                            Performance statistics of each fund printed with fund info
+                                            and exported in todays report (getFundsStatistics).
+                                            Calendar-aligned price matrix of funds (getPriceMatrix) built once
+                                            and shared by all investments.
+                                            .close() saves HTTP validators of funds loaded after prefetch as well.
+                                            Database writes are committed before HTTP validators are saved.
+                                            Price matrix contains only requested funds from the first needed date,
+                                            it is extended with new funds and dates instead of rebuilt.
 """
 # Official and 3-rd party imports
 import json
-from datetime import datetime
+from datetime import datetime, date
+from concurrent.futures import ThreadPoolExecutor
 from tabulate import tabulate
 from lxml.html import fromstring
 from dataclasses import dataclass, field
@@ -34,32 +71,155 @@ from Dependencies.Function_Conversion import convertNumericToStrPlsMnsSigns
 
 # Custom created class modules
 from Dependencies.Class_AnalizyFund import AnalizyFund
+from Dependencies.Class_PriceMatrix import PriceMatrix
+from Dependencies.Class_QuotationStore import QuotationStore
+from Dependencies.Class_QuotationDatabase import QuotationDatabase
+from Dependencies.Class_OutputWriter import OutputWriter
+from Dependencies.Class_HTTPTransport import HTTPTransport
+from Dependencies.Class_StageTimer import StageTimer, disabledStageTimer
+from Dependencies.Class_MetricsRegistry import metrics
+
+# Custom created variables modules
+from Dependencies.Variables_API import analizyplRequestTimeout
+from Dependencies.Variables_Metrics import metricFailedFunds
 
 global todaysFundStatsFileSuffix
+global defaultMaxConcurrentDownloads
+global defaultMaxConcurrentWrites
 
 todaysFundStatsFileSuffix = "Report"
+defaultMaxConcurrentDownloads = 8
+defaultMaxConcurrentWrites = 4
 
 @dataclass
 class ListOfFunds:
     ListOfFundURL: list[str]
+    MaxConcurrentDownloads: int = defaultMaxConcurrentDownloads
+    RequestTimeout: float = analizyplRequestTimeout
+    QuotationStoreDirectory: str | None = None
+    LatestDetailsSource: str = AnalizyFund.LatestDetailsFromPage
+    Timer: StageTimer = field(default_factory=lambda: disabledStageTimer)
+    DatabaseFilePath: str | None = None
+    MaxConcurrentWrites: int = defaultMaxConcurrentWrites
     
     ListOfFunds: dict[str, AnalizyFund] = field(default_factory=dict, init=False)
+    FailedFunds: dict[str, Exception] = field(default_factory=dict, init=False)
+    LocalQuotationStore: QuotationStore | QuotationDatabase | None = field(default=None, init=False)
+    Database: QuotationDatabase | None = field(default=None, init=False)
+    Transport: HTTPTransport = field(init=False)
+    FundsPriceMatrix: PriceMatrix | None = field(default=None, init=False, repr=False)
     
     def __post_init__(self):
         
+        # Create local quotation store if directory was provided
+        if self.QuotationStoreDirectory:
+            self.LocalQuotationStore = QuotationStore(self.QuotationStoreDirectory)
+        
+        # Database takes over the role of local quotation store if it was provided
+        if self.DatabaseFilePath:
+            self.Database = QuotationDatabase(self.DatabaseFilePath)
+            self.LocalQuotationStore = self.Database
+        
+        # Create transport shared by all funds, with connection per concurrent download,
+        # validators for conditional requests are saved only if local store is used,
+        # as not modified content has to be read out from it
+        self.Transport = HTTPTransport(
+            ValidatorCacheFilePath=(
+                self.LocalQuotationStore.getValidatorCacheFilePath()
+                if self.LocalQuotationStore != None
+                else None
+            ),
+            Timeout=self.RequestTimeout,
+            PoolSize=max(1, self.MaxConcurrentDownloads),
+            Timer=self.Timer
+        )
+        
         # Loop through list of provided URLs
         for item in self.ListOfFundURL:
             
-            # Create and instance of AnalizyFund class
-            temp = AnalizyFund(URL=item)
+            # Create and instance of AnalizyFund class, data is not downloaded yet
+            temp = AnalizyFund(
+                URL=item,
+                RequestTimeout=self.RequestTimeout,
+                LocalQuotationStore=self.LocalQuotationStore,
+                Transport=self.Transport,
+                LatestDetailsSource=self.LatestDetailsSource
+            )
             
             # Assign created class instance to a dict, where key is an ID of the fund
             self.ListOfFunds[temp.getFundID()] = temp
             
         return None
 
+    def prefetch(self, fundIDs: list[str] | None = None) -> None:
+        
+        # If fund IDs were not provided download all configured funds,
+        # funds which are already loaded are skipped
+        fundsToLoad = [
+            fund for fund in self.ListOfFunds.values()
+            if (fundIDs == None or fund.getFundID() in fundIDs) and not fund.isLoaded()
+        ]
+        
+        # Download funds concurrently
+        with ThreadPoolExecutor(max_workers=max(1, self.MaxConcurrentDownloads)) as executor:
+            downloads = [
+                executor.submit(self.loadFund, fund)
+                for fund in fundsToLoad
+            ]
+
+        # Loop through downloads in the same order as configured funds
+        for fund, download in zip(fundsToLoad, downloads):
+            
+            # if download failed save the error under fund URL and remove fund from the list
+            try:
+                download.result()
+            except Exception as error:
+                self.FailedFunds[fund.URL] = error
+                del self.ListOfFunds[fund.getFundID()]
+                if metrics.Enabled:
+                    metrics.increment(metricFailedFunds)
+        
+        # Save validators for conditional requests in next run
+        self.saveValidatorCache()
+            
+        return None
+
+    def saveValidatorCache(self) -> None:
+        
+        # Quotations stored in the database are committed before validators pointing to them are saved,
+        # otherwise if the run failed later, not modified response in next run
+        # would be read out from stored history without quotations downloaded in this run
+        if self.Database != None:
+            self.Database.commit()
+        
+        self.Transport.saveValidatorCache()
+        
+        return None
+
+    def loadFund(self, fund: AnalizyFund) -> None:
+        
+        # Load fund data measuring the time of whole fund download
+        with self.Timer.measureItem("Download", FundID=fund.getFundID(), URL=fund.URL):
+            fund.load()
+        
+        return None
+
+    def getFailedFunds(self) -> dict[str, Exception]:
+        return self.FailedFunds
+
+    def printFailedFunds(self):
+        
+        # Print each URL which could not be downloaded with the reason
+        for url, error in self.FailedFunds.items():
+            print(f"Failed to download fund {url}: {error}")
+        
+        return None
+
     def printFundInfo(self):
         
+        # Download all funds which are not loaded yet
+        self.prefetch()
+        
         # Init local variables for dataset and headers
         dataList = []
         dataHeaders = list(self.ListOfFunds[list(self.ListOfFunds.keys())[0]].getFundInfo().keys())
@@ -92,29 +252,124 @@ class ListOfFunds:
             )
         print("\n")
         
+        # Print performance statistics of each fund as additional table
+        self.printFundStatistics()
+        
         return None
 
-    def saveQuotationJSON(self, destinationPath = None):
-        # Invoke saving quotation for each configured fund in JSON format
+    def getFundsStatistics(self) -> dict[str, dict[str, float | None]]:
+        
+        # Download all funds which are not loaded yet
+        self.prefetch()
+        
+        # return statistics of each fund, they are refreshed only with prices appended since the last call
+        return {
+            fund: self.ListOfFunds[fund].getStatistics()
+            for fund in self.ListOfFunds
+        }
+
+    def getPriceMatrix(self, fundIDs: list[str] | None = None, firstDate: date | None = None) -> PriceMatrix:
+
+        # If fund IDs were not provided matrix contains funds which quotation is already loaded,
+        # so funds are not downloaded only to be placed in the matrix
+        if fundIDs == None:
+            fundIDs = [fund for fund in self.ListOfFunds if self.ListOfFunds[fund].IsHistoricalQuotationLoaded]
+
+        # get quotation of each fund, funds are loaded on first access
+        quotations = {
+            fund: self.getFundByID(fund).getQuotationIndex()
+            for fund in dict.fromkeys(fundIDs)
+        }
+
+        # Build matrix from the first date which prices are needed, if it does not exist yet,
+        # otherwise extend it only with new funds, replaced quotations and earlier dates,
+        # so it is not rebuilt for each investment
+        if self.FundsPriceMatrix == None:
+            self.FundsPriceMatrix = PriceMatrix(quotations, FirstDate=firstDate)
+        else:
+            self.FundsPriceMatrix = self.FundsPriceMatrix.extend(quotations, firstDate)
+
+        return self.FundsPriceMatrix
+
+    def printFundStatistics(self):
+        
+        # Init local variables for dataset and headers
+        dataList = []
+        dataHeaders = list(self.ListOfFunds[list(self.ListOfFunds.keys())[0]].getStatisticsInfo().keys())
+        
+        # Loop through each fund
         for fund in self.ListOfFunds:
-            self.ListOfFunds[fund].saveQuotationJSON(destinationPath)
+            
+            # append dataset list with values to display,
+            # statistics which cannot be calculated (None) are left empty
+            dataList.append(
+                convertNumericToStrPlsMnsSigns(
+                    inputValues=list(self.ListOfFunds[fund].getStatisticsInfo().values()),
+                    headers = dataHeaders,
+                    columnsExcludedFromSigns = ["Volatility1Y_%"], 
+                    currencyColumnNames = [],
+                    currency = self.ListOfFunds[fund].getCurrency(),
+                    percentageColumnNames = [header for header in dataHeaders if header.endswith("_%")]
+                    )
+                )
+        
+        # Print collected dataset as table using tabulate Library
+        print(
+            tabulate(
+                tabular_data = dataList,
+                tablefmt = "github", 
+                headers = dataHeaders
+                    )
+            )
+        print("\n")
+        
+        return None
+
+    def saveQuotationJSON(self, destinationPath = None):
+        # Download all funds which are not loaded yet
+        self.prefetch()
+        
+        # Write quotation of each configured fund in JSON format concurrently
+        OutputWriter(destinationPath, MaxConcurrentWrites=self.MaxConcurrentWrites).writeAll(
+            {
+                fund.getQuotationFileName("json"): fund.writeQuotationJSON
+                for fund in self.ListOfFunds.values()
+            }
+        )
         
         return None
 
     def saveQuotationCSV(self, destinationPath = None):
-        # Invoke saving quotation for each configured fund in CSV format
+        # Download all funds which are not loaded yet
+        self.prefetch()
+        
+        # Write quotation of each configured fund in CSV format concurrently
+        OutputWriter(destinationPath, MaxConcurrentWrites=self.MaxConcurrentWrites).writeAll(
+            {
+                fund.getQuotationFileName("csv"): fund.writeQuotationCSV
+                for fund in self.ListOfFunds.values()
+            }
+        )
+        
+        return None
+
+    def saveQuotationBIN(self, destinationPath = None):
+        # Download all funds which are not loaded yet
+        self.prefetch()
+        
+        # Invoke saving quotation for each configured fund in binary archive format
         for fund in self.ListOfFunds:
-            self.ListOfFunds[fund].saveQuotationCSV(destinationPath)
+            self.ListOfFunds[fund].saveQuotationBIN(destinationPath)
         
         return None
 
     def saveTodaysResults(self, destinationPath = None):
         
-        # Check if destination Path was provided and create appropriate `destinationFilePath`
-        if destinationPath == None or not destinationPath:
-            destinationFilePath = f"{datetime.now().strftime("%Y-%m-%d")}_{todaysFundStatsFileSuffix}.json"
-        else:
-            destinationFilePath = f"{destinationPath}/{datetime.now().strftime("%Y-%m-%d")}_{todaysFundStatsFileSuffix}.json"
+        # Create file name for todays report, it is located in current directory if path was not provided
+        destinationFileName = f"{datetime.now().strftime("%Y-%m-%d")}_{todaysFundStatsFileSuffix}.json"
+
+        # Download all funds which are not loaded yet
+        self.prefetch()
 
         # Init local variable
         listToExport = []
@@ -123,12 +378,42 @@ class ListOfFunds:
         for fund in self.ListOfFunds:
             listToExport.append(self.ListOfFunds[fund].ExportTodaysResults())
         
-        # Open destination file and write dumped dict to JSON structure
-        with open(destinationFilePath, "w") as todaysResultJSON:
-            todaysResultJSON.write(json.dumps(listToExport, indent=4))
+        # Write dict dumped to JSON structure chunk by chunk,
+        # file is replaced only if report has changed since the last run
+        writer = OutputWriter(destinationPath)
+        writer.write(
+            destinationFileName,
+            lambda todaysResultJSON: todaysResultJSON.writelines(
+                json.JSONEncoder(indent=4).iterencode(listToExport)
+            )
+        )
+        writer.saveManifest()
+        
+        # Save the same report in the database if it is used
+        if self.Database != None:
+            self.Database.saveDailyReport(datetime.now().date(), listToExport)
             
         return None
 
+    def closeDatabase(self) -> None:
+        
+        # Commit all writes of the run and close the database if it is used
+        if self.Database != None:
+            self.Database.close()
+        
+        return None
+
+    def close(self) -> None:
+        
+        # Commit all writes of the run, stored quotations have to be saved before validators pointing to them
+        self.closeDatabase()
+        
+        # Save validators of all funds loaded during the run,
+        # including funds loaded on first access after prefetch
+        self.Transport.saveValidatorCache()
+        
+        return None
+
     def getFundByID(self, ID: str) -> AnalizyFund:
         # try to get fund with ID passed to method.
         # if it is not available raise an error to provide URL to config file
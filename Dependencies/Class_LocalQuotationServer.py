@@ -0,0 +1,245 @@
+"""
+.DESCRIPTION
+    Definition file of LocalQuotationServer class.
+    Class is local stand-in of www.analizy.pl web server, used to measure web requests without internet access.
+    Server is started in background thread on local address and responds to the same requests
+    which are invoked by AnalizyFund instances:
+        - fund page <- "/<Category>/<Fund_ID>/<Fund_Name>", HTML with latest details in the same elements
+            as read out with xpath filters
+        - quotation API <- "/api/quotation/<CategoryShortCut>/<Fund_ID>", JSON in the same structure as API response
+    Each response has ETag validator, conditional request with the same ETag receives status 304 without body.
+    Body is compressed with gzip if client accepts it. Each request is delayed with provided latency
+    to simulate network round trip. Number of responses of each status is counted.
+
+.INITIALIZATION
+    Class construction requires dict of fund IDs and their quotation
+    in the same structure as AnalizyFund.getQuotationJSON(), server is started with .start() or as context manager:
+        with LocalQuotationServer(<quotations>) as server:
+            urls = [server.getFundURL(fundID) for fundID in <quotations>]
+            AnalizyFund.QuotationsAPI = server.getQuotationAPI()
+    Optional keywords:
+        - Latency <- time in seconds to delay each request
+        - Category <- category of funds in fund page URL
+        - Host <- address to listen on
+        - Port <- port to listen on, any free port is used by default
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import gzip
+import json
+import time
+import hashlib
+import datetime
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from dataclasses import dataclass, field
+
+# Custom created variables modules
+from Dependencies.Variables_API import *
+
+
+@dataclass
+class LocalQuotationServer:
+
+    # Initialization Variables
+    Quotations: dict[str, dict[str, str | list[dict[str, str | float]]]] = field(repr=False)
+    Latency: float = 0.01
+    Category: str = "fundusze-inwestycyjne-otwarte"
+    Host: str = "127.0.0.1"
+    Port: int = 0
+
+    # Calculated Variables
+    Bodies: dict[str, tuple[bytes, str, str]] = field(default_factory=dict, init=False, repr=False)
+    Statuses: dict[int, int] = field(default_factory=dict, init=False)
+    StatusesLock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    Server: ThreadingHTTPServer | None = field(default=None, init=False, repr=False)
+    Thread: threading.Thread | None = field(default=None, init=False, repr=False)
+
+    # Constant Variables
+    PageDateFormat = "%d.%m.%Y"
+
+    def __post_init__(self):
+
+        # Prepare body, content type and ETag of each response once, so server only copies them
+        categoryShortCut = "".join([word[0] for word in self.Category.split("-")])
+        for fundID, quotation in self.Quotations.items():
+            self.addBody(
+                f"/{self.Category}/{fundID}/{LocalQuotationServer.getFundName(fundID)}",
+                self.getFundPage(quotation).encode(),
+                "text/html; charset=utf-8"
+            )
+            self.addBody(
+                f"/api/quotation/{categoryShortCut}/{fundID}",
+                json.dumps(LocalQuotationServer.getAPIResponse(fundID, quotation)).encode(),
+                "application/json"
+            )
+
+        return None
+
+    def __enter__(self) -> "LocalQuotationServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+        return None
+
+    @staticmethod
+    def getFundName(fundID: str) -> str:
+        return f"fund-{fundID.lower()}"
+
+    @staticmethod
+    def getAPIResponse(
+        fundID: str,
+        quotation: dict[str, str | list[dict[str, str | float]]]
+    ) -> dict[str, any]:
+
+        # return quotation in the same structure as API response
+        return {
+            analizyplAPIresponse_ID: fundID,
+            analizyplAPIresponse_Currency: quotation["Currency"],
+            analizyplAPIresponse_QuotationDetails: [
+                {analizyplAPIresponse_QuotationList: quotation["Price"]}
+            ]
+        }
+
+    def getFundPage(self, quotation: dict[str, str | list[dict[str, str | float]]]) -> str:
+
+        # Latest details are calculated from 2 latest quotations, numbers are written with decimal comma
+        last = quotation["Price"][-1]
+        previous = quotation["Price"][-2] if len(quotation["Price"]) > 1 else last
+        lastPrice = last[analizyplAPIresponse_QuotationValue]
+        previousPrice = previous[analizyplAPIresponse_QuotationValue]
+        updateDate = datetime.date.fromisoformat(last[analizyplAPIresponse_QuotationDate])
+
+        # return page with elements read out by xpath filters
+        return (
+            "<html><body>"
+            f'<span class="productBigText"> {LocalQuotationServer.formatNumber(lastPrice)} </span>'
+            '<div class="primaryContent"> - </div>'
+            f'<div class="primaryContent"> {quotation["Currency"]} </div>'
+            f'<p class="lightProductText"> {updateDate.strftime(LocalQuotationServer.PageDateFormat)} </p>'
+            f'<p class="productValueChange"> {LocalQuotationServer.formatNumber(lastPrice - previousPrice, "+.2f")} </p>'
+            f'<p class="productValueChange">/ {LocalQuotationServer.formatNumber(((lastPrice / previousPrice) - 1) * 100, "+.2f")}%</p>'
+            "</body></html>"
+        )
+
+    @staticmethod
+    def formatNumber(value: float, format: str = "") -> str:
+        # Numbers on fund page are written with decimal comma
+        return "{:{}}".format(value, format).replace(".", ",")
+
+    def addBody(self, path: str, body: bytes, contentType: str) -> None:
+        self.Bodies[path] = (body, contentType, f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+        return None
+
+    def getURL(self) -> str:
+        return f"http://{self.Host}:{self.Port}"
+
+    def getFundURL(self, fundID: str) -> str:
+        return f"{self.getURL()}/{self.Category}/{fundID}/{LocalQuotationServer.getFundName(fundID)}"
+
+    def getQuotationAPI(self) -> str:
+        return f"{self.getURL()}/api/quotation"
+
+    def getStatuses(self) -> dict[int, int]:
+        with self.StatusesLock:
+            return dict(self.Statuses)
+
+    def resetStatuses(self) -> None:
+        with self.StatusesLock:
+            self.Statuses = {}
+        return None
+
+    def countStatus(self, status: int) -> None:
+        with self.StatusesLock:
+            self.Statuses[status] = self.Statuses.get(status, 0) + 1
+        return None
+
+    def start(self) -> None:
+
+        # Create request handler with access to prepared responses of this server
+        server = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+
+            # Keep-alive connections, the same as web server
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args) -> None:
+                # Requests are not logged to console
+                return None
+
+            def do_GET(self) -> None:
+                server.respond(self)
+                return None
+
+        # Start server in background thread, port is assigned by the system if it was not provided
+        self.Server = ThreadingHTTPServer((self.Host, self.Port), RequestHandler)
+        self.Server.daemon_threads = True
+        self.Port = self.Server.server_address[1]
+        self.Thread = threading.Thread(target=self.Server.serve_forever, daemon=True)
+        self.Thread.start()
+
+        return None
+
+    def stop(self) -> None:
+
+        # Stop serving and release the port
+        if self.Server != None:
+            self.Server.shutdown()
+            self.Server.server_close()
+            self.Thread.join()
+            self.Server = None
+            self.Thread = None
+
+        return None
+
+    def respond(self, request: BaseHTTPRequestHandler) -> None:
+
+        # Simulate network round trip
+        time.sleep(self.Latency)
+
+        # Unknown path is not found
+        if request.path not in self.Bodies:
+            self.countStatus(404)
+            request.send_response(404)
+            request.send_header("Content-Length", "0")
+            request.end_headers()
+            return None
+
+        body, contentType, etag = self.Bodies[request.path]
+
+        # Content has not changed if client sent the same validator
+        if request.headers.get("If-None-Match") == etag:
+            self.countStatus(304)
+            request.send_response(304)
+            request.send_header("ETag", etag)
+            request.send_header("Content-Length", "0")
+            request.end_headers()
+            return None
+
+        # Compress body if client accepts it
+        request.send_response(200)
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel=1)
+            request.send_header("Content-Encoding", "gzip")
+        request.send_header("Content-Type", contentType)
+        request.send_header("ETag", etag)
+        request.send_header("Content-Length", str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+        self.countStatus(200)
+
+        return None
@@ -0,0 +1,134 @@
+"""
+.DESCRIPTION
+    Definition file of MetricsRegistry class.
+    Class is lightweight in-process registry of counters and gauges updated by the program,
+    e.g. number of price lookups, web requests and bytes per host, parsed quotation rows, DayByDay rows.
+    Each metric value is kept per set of labels, e.g. host or investment name.
+    Collected metrics can be saved in Prometheus text format, so they can be read out by node exporter
+    (textfile collector), file is replaced atomically to not expose partially written file.
+
+    Registry is disabled by default, updates are ignored until it is enabled.
+    Hot paths should check .Enabled before the update, to skip building labels at all:
+        if metrics.Enabled:
+            metrics.increment(metricFundPriceLookups, type="exact")
+
+.INITIALIZATION
+    By default module-global instance `metrics` is shared by all classes and enabled by the main program.
+    Optional keywords:
+        - Enabled <- True to collect metrics
+        - Definitions <- dict with metric name as a key and tuple (metric type, description) as value
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import os
+import threading
+from dataclasses import dataclass, field
+
+# Custom created variables modules
+from Dependencies.Variables_Metrics import *
+
+
+@dataclass
+class MetricsRegistry:
+
+    # Initialization Variables
+    Enabled: bool = False
+    Definitions: dict[str, tuple[str, str]] = field(default_factory=lambda: dict(metricsDefinitions))
+
+    # Calculated Variables
+    Values: dict[str, dict[tuple[tuple[str, str], ...], float]] = field(default_factory=dict, init=False)
+    Lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def enable(self) -> None:
+        self.Enabled = True
+        return None
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+
+        # Updates are ignored if registry is disabled
+        if not self.Enabled:
+            return None
+
+        # Labels are sorted, so the same set of labels is always the same key
+        key = tuple(sorted(labels.items()))
+
+        # Metrics are updated from multiple threads at the same time
+        with self.Lock:
+            metric = self.Values.setdefault(name, {})
+            metric[key] = metric.get(key, 0) + value
+
+        return None
+
+    def setGauge(self, name: str, value: float, **labels: str) -> None:
+
+        # Updates are ignored if registry is disabled
+        if not self.Enabled:
+            return None
+
+        # Labels are sorted, so the same set of labels is always the same key
+        key = tuple(sorted(labels.items()))
+
+        with self.Lock:
+            self.Values.setdefault(name, {})[key] = value
+
+        return None
+
+    def getValue(self, name: str, **labels: str) -> float | None:
+        return self.Values.get(name, {}).get(tuple(sorted(labels.items())))
+
+    @staticmethod
+    def escapeLabelValue(value: str) -> str:
+        # Escape characters which are not allowed in label value of Prometheus text format
+        return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+    def exportPrometheus(self) -> str:
+
+        # Init local variable to collect lines of the output
+        lines = []
+
+        with self.Lock:
+
+            # Loop through each metric, sorted to keep the same order between runs
+            for name in sorted(self.Values):
+
+                # Add description and type of the metric, untyped if it was not defined
+                metricType, description = self.Definitions.get(name, ("untyped", ""))
+                if description:
+                    lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} {metricType}")
+
+                # Add value for each set of labels
+                for key, value in sorted(self.Values[name].items()):
+                    labels = ",".join(
+                        f"{label}=\"{MetricsRegistry.escapeLabelValue(labelValue)}\""
+                        for label, labelValue in key
+                    )
+                    lines.append(f"{name}{{{labels}}} {value}" if labels else f"{name} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def savePrometheus(self, destinationFilePath: str) -> None:
+
+        # Write metrics to temporary file in the same directory and replace destination file with it,
+        # so exporter never reads partially written file
+        temporaryFilePath = f"{destinationFilePath}.tmp"
+        with open(temporaryFilePath, "w") as metricsFile:
+            metricsFile.write(self.exportPrometheus())
+        os.replace(temporaryFilePath, destinationFilePath)
+
+        return None
+
+
+# Registry shared by all classes, disabled until it is enabled by the main program
+metrics = MetricsRegistry()
@@ -0,0 +1,258 @@
+"""
+.DESCRIPTION
+    Definition file of OutputWriter class.
+    Class is writer of output files saved in a single directory, each file is:
+        - written to temporary file in the same directory and moved to destination path with os.replace,
+            so destination file is always complete, even if the program was stopped while writing
+        - streamed in chunks by provided function, which receives file-like object with .write() method,
+            e.g. csv.writer can be created on it or JSON chunks from json.JSONEncoder.iterencode written to it
+        - hashed before it is written, if the hash, size and modification time are the same as
+            saved by previous run in hash manifest, destination file is not replaced and temporary file
+            is not created at all. Content up to MaxBufferedSize is kept in memory while it is hashed,
+            bigger content is streamed by provided function again, directly to the temporary file
+
+    Hash manifest is a hidden JSON file in destination directory:
+        {
+            "<File_name>": {"Hash": "<sha256>", "Size": <int>, "ModifiedTime": <int_nanoseconds>}
+        }
+
+    Multiple files can be written concurrently with bounded worker pool using .writeAll(),
+    hash manifest is saved once for all of them.
+
+.INITIALIZATION
+    Class construction requires only path to destination directory, None means current directory.
+    Optional keywords:
+        - MaxConcurrentWrites <- number of files written at the same time by .writeAll()
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-17      Stanisław Horna         Content hashed before temporary file is created,
+                                            manifest written to unique temporary file.
+
+"""
+# Official and 3-rd party imports
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+# Temporary files are created only for the owner,
+# files are given the same mode as created with open() before they are moved
+currentUmask = os.umask(0)
+os.umask(currentUmask)
+defaultFileMode = 0o666 & ~currentUmask
+
+@dataclass
+class HashingFile:
+
+    # Initialization Variables
+    File: any = None
+    MaxBufferedSize: int = 0
+
+    # Calculated Variables
+    Hash: any = field(default_factory=hashlib.sha256, init=False)
+    Pending: list[str] = field(default_factory=list, init=False)
+    PendingSize: int = field(default=0, init=False)
+    Size: int = field(default=0, init=False)
+    Chunks: list[bytes] | None = field(default_factory=list, init=False, repr=False)
+
+    # Constant Variables
+    ChunkSize = 64 * 1024
+
+    def write(self, text: str) -> int:
+
+        # Collect small pieces of text and encode them together in bigger chunks
+        self.Pending.append(text)
+        self.PendingSize += len(text)
+        if self.PendingSize >= HashingFile.ChunkSize:
+            self.flush()
+
+        return len(text)
+
+    def writelines(self, lines) -> None:
+
+        # Write each piece of text, lines are not separated the same as in file objects
+        for text in lines:
+            self.write(text)
+
+        return None
+
+    def flush(self) -> None:
+
+        # Encode collected text, update hash and write it to the file
+        chunk = "".join(self.Pending).encode()
+        self.Hash.update(chunk)
+        if self.File != None:
+            self.File.write(chunk)
+
+        # Without the file content is only hashed, encoded chunks are kept until they exceed the limit
+        elif self.Chunks != None:
+            if self.Size + len(chunk) <= self.MaxBufferedSize:
+                self.Chunks.append(chunk)
+            else:
+                self.Chunks = None
+
+        self.Size += len(chunk)
+        self.Pending = []
+        self.PendingSize = 0
+
+        return None
+
+    def getHash(self) -> str:
+        return self.Hash.hexdigest()
+
+    def isBuffered(self) -> bool:
+        # Whole content is kept in memory only if it was hashed without the file and did not exceed the limit
+        return self.File == None and self.Chunks != None
+
+
+@dataclass
+class OutputWriter:
+
+    # Initialization Variables
+    DirectoryPath: str | None = None
+    MaxConcurrentWrites: int = 4
+
+    # Calculated Variables
+    Hashes: dict[str, dict[str, str | int]] = field(default_factory=dict, init=False)
+    Lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    # Constant Variables
+    ManifestFileName = ".OutputHashes.json"
+    TemporaryFileSuffix = ".tmp"
+    MaxBufferedSize = 16 * 1024 * 1024
+
+    def __post_init__(self):
+
+        # Read out hashes of files written by previous run, if manifest is damaged all files are written
+        try:
+            with open(self.getFilePath(OutputWriter.ManifestFileName), "r") as manifestFile:
+                self.Hashes = json.loads(manifestFile.read())
+        except (OSError, ValueError):
+            self.Hashes = {}
+
+        return None
+
+    def getFilePath(self, fileName: str) -> str:
+
+        # File is located in current directory if path was not provided
+        if self.DirectoryPath == None or not self.DirectoryPath:
+            return fileName
+        return f"{self.DirectoryPath}/{fileName}"
+
+    def isUnchanged(self, fileName: str, contentHash: str) -> bool:
+
+        # File is unchanged if it was written by previous run with the same content
+        # and it was not modified since then
+        filePath = self.getFilePath(fileName)
+        saved = self.Hashes.get(fileName)
+        if saved == None or saved["Hash"] != contentHash or not os.path.isfile(filePath):
+            return False
+
+        fileStat = os.stat(filePath)
+        return fileStat.st_size == saved["Size"] and fileStat.st_mtime_ns == saved["ModifiedTime"]
+
+    def write(self, fileName: str, writeContent: Callable[[HashingFile], None]) -> bool:
+
+        # Hash content without writing it anywhere, content which is not too big is kept in memory
+        hashingFile = HashingFile(MaxBufferedSize=OutputWriter.MaxBufferedSize)
+        writeContent(hashingFile)
+        hashingFile.flush()
+
+        # Keep destination file if its content has not changed, temporary file is not created
+        contentHash = hashingFile.getHash()
+        if self.isUnchanged(fileName, contentHash):
+            return False
+
+        # Create temporary file in destination directory, so it can be moved without copying
+        temporaryFile = tempfile.NamedTemporaryFile(
+            dir=self.DirectoryPath or None,
+            prefix=f".{fileName}.",
+            suffix=OutputWriter.TemporaryFileSuffix,
+            delete=False
+        )
+
+        try:
+            # Write content kept in memory, bigger content is streamed again directly to the temporary file
+            with temporaryFile:
+                if hashingFile.isBuffered():
+                    temporaryFile.writelines(hashingFile.Chunks)
+                else:
+                    hashingFile = HashingFile(temporaryFile)
+                    writeContent(hashingFile)
+                    hashingFile.flush()
+                    contentHash = hashingFile.getHash()
+
+            # Replace destination file at once and remember its hash
+            os.chmod(temporaryFile.name, defaultFileMode)
+            os.replace(temporaryFile.name, self.getFilePath(fileName))
+            fileStat = os.stat(self.getFilePath(fileName))
+            with self.Lock:
+                self.Hashes[fileName] = {
+                    "Hash": contentHash,
+                    "Size": fileStat.st_size,
+                    "ModifiedTime": fileStat.st_mtime_ns
+                }
+
+        # Remove temporary file if content could not be written
+        except BaseException:
+            if os.path.exists(temporaryFile.name):
+                os.remove(temporaryFile.name)
+            raise
+
+        return True
+
+    def writeAll(self, files: dict[str, Callable[[HashingFile], None]]) -> int:
+
+        # Write files concurrently
+        with ThreadPoolExecutor(max_workers=max(1, self.MaxConcurrentWrites)) as executor:
+            writes = [
+                executor.submit(self.write, fileName, writeContent)
+                for fileName, writeContent in files.items()
+            ]
+
+        # Save hashes of written files before raising an error of any of them
+        self.saveManifest()
+
+        # return number of replaced files
+        return sum(write.result() for write in writes)
+
+    def saveManifest(self) -> None:
+
+        # Manifest is written the same way as other files, so it is never left incomplete,
+        # each writer uses its own temporary file, so writers of the same directory do not overwrite it
+        with self.Lock:
+            manifest = json.dumps(self.Hashes, indent=4)
+
+        temporaryFile = tempfile.NamedTemporaryFile(
+            "w",
+            dir=self.DirectoryPath or None,
+            prefix=f"{OutputWriter.ManifestFileName}.",
+            suffix=OutputWriter.TemporaryFileSuffix,
+            delete=False
+        )
+        try:
+            with temporaryFile:
+                temporaryFile.write(manifest)
+            os.chmod(temporaryFile.name, defaultFileMode)
+            os.replace(temporaryFile.name, self.getFilePath(OutputWriter.ManifestFileName))
+
+        # Remove temporary file if manifest could not be saved
+        except BaseException:
+            if os.path.exists(temporaryFile.name):
+                os.remove(temporaryFile.name)
+            raise
+
+        return None
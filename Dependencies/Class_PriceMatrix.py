@@ -0,0 +1,251 @@
+"""
+.DESCRIPTION
+    Definition file of PriceMatrix class.
+    Class is calendar-aligned price matrix of multiple funds:
+        - rows <- each calendar day from the first date (or the first quotation of any fund if it is later)
+            until the last date (today or the last quotation, whichever is later),
+            row index is date ordinal - FirstOrdinal
+        - columns <- funds in the order of provided quotations, column index is kept in FundColumns
+        - Prices <- last price of the fund on or before the date of the row (forward-filled),
+            NaN before the first quotation of the fund
+        - QuotedOrdinals <- date ordinal of the quotation used in Prices, 0 before the first quotation
+    Nearest price (within days limit) and exact date mask of any fund for any dates are read out
+    with array indexing, without searching the quotation again.
+    If rows start after the first quotation of any fund, prices are valid only from the first row (.covers()).
+    Matrix is extended with .extend(): funds not placed yet (or with replaced quotation) are added as new columns
+    and rows are added for earlier or later dates, already filled cells are copied, not calculated again.
+
+.INITIALIZATION
+    By default class was meant to be a attribute of ListOfFunds class, built once per run
+    and shared by all investments.
+    Class construction requires dict of fund IDs and their QuotationIndex.
+    Optional keywords:
+        - FirstDate <- the first date which prices are needed, the first quotation of any fund by default
+        - LastDate <- the last date of the matrix, today by default
+    Matrix can be created from already built arrays with .fromArrays() (e.g. arrays in shared memory).
+
+.NOTES
+
+    Version:            1.1
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-17      Stanisław Horna         Matrix can be created from already built arrays (fromArrays).
+                                            Rows can start at the first needed date (FirstDate),
+                                            matrix is extended with new funds and dates instead of rebuilt.
+
+"""
+# Official and 3-rd party imports
+import datetime
+import numpy as np
+from dataclasses import dataclass, field
+
+# Custom created class modules
+from Dependencies.Class_QuotationIndex import QuotationIndex
+
+
+@dataclass
+class PriceMatrix:
+
+    # Initialization Variables
+    Quotations: dict[str, QuotationIndex]
+    FirstDate: datetime.date | None = None
+    LastDate: datetime.date = field(default_factory=datetime.date.today)
+
+    # Calculated Variables
+    FundColumns: dict[str, int] = field(default_factory=dict, init=False)
+    FirstOrdinal: int = field(init=False)
+    LastOrdinal: int = field(init=False)
+    ValidFromOrdinal: int = field(init=False, default=0)
+    Prices: np.ndarray = field(init=False, repr=False)
+    QuotedOrdinals: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+
+        # Keep own copy of provided quotations, so it is not changed together with the caller's dict,
+        # assign column to each fund in provided order
+        self.Quotations = dict(self.Quotations)
+        self.FundColumns = {
+            fund: column
+            for column, fund in enumerate(self.Quotations)
+        }
+
+        # Init matrix without any prices
+        self.FirstOrdinal, self.LastOrdinal = PriceMatrix.getRowsRange(self.Quotations, self.FirstDate, self.LastDate)
+        self.Prices = np.full((self.LastOrdinal - self.FirstOrdinal + 1, len(self.FundColumns)), np.nan)
+        self.QuotedOrdinals = np.zeros(self.Prices.shape, dtype=np.int64)
+
+        # Loop through each fund and forward-fill its column
+        dateAxis = np.arange(self.FirstOrdinal, self.LastOrdinal + 1, dtype=np.int64)
+        for fund, column in self.FundColumns.items():
+            self.fillColumn(column, self.Quotations[fund], dateAxis, 0)
+        self.ValidFromOrdinal = self.getValidFromOrdinal()
+
+        return None
+
+    @staticmethod
+    def getRowsRange(
+        quotations: dict[str, QuotationIndex],
+        firstDate: datetime.date | None,
+        lastDate: datetime.date
+    ) -> tuple[int, int]:
+
+        # Rows start at the first quotation of any fund (or at the first date if it is later)
+        # and end at the last date or the last quotation
+        quoted = [quotation for quotation in quotations.values() if len(quotation)]
+        lastOrdinal = max(
+            [lastDate.toordinal()] + [quotation.Ordinals[-1] for quotation in quoted]
+        )
+        firstOrdinal = min(
+            [lastOrdinal] + [quotation.Ordinals[0] for quotation in quoted]
+        )
+        if firstDate != None:
+            firstOrdinal = min(max(firstOrdinal, firstDate.toordinal()), lastOrdinal)
+
+        return firstOrdinal, lastOrdinal
+
+    def fillColumn(self, column: int, quotation: QuotationIndex, dateAxis: np.ndarray, firstRow: int) -> None:
+
+        # Nothing to fill if fund does not have any quotation
+        if not len(quotation) or not len(dateAxis):
+            return None
+
+        # Find position of the last quotation on or before each date of the axis
+        ordinals = np.asarray(quotation.Ordinals, dtype=np.int64)
+        positions = np.searchsorted(ordinals, dateAxis, side="right") - 1
+        isQuoted = positions >= 0
+        positions = np.clip(positions, 0, None)
+
+        # Fill rows of the axis starting at provided row
+        rows = slice(firstRow, firstRow + len(dateAxis))
+        self.Prices[rows, column] = np.where(
+            isQuoted, np.asarray(quotation.Prices, dtype=np.float64)[positions], np.nan
+        )
+        self.QuotedOrdinals[rows, column] = np.where(isQuoted, ordinals[positions], 0)
+
+        return None
+
+    def getValidFromOrdinal(self) -> int:
+
+        # Prices of dates before the first row are valid only if no fund was quoted before it
+        if any(len(quotation) and quotation.Ordinals[0] < self.FirstOrdinal for quotation in self.Quotations.values()):
+            return self.FirstOrdinal
+        return 0
+
+    @classmethod
+    def fromArrays(
+        cls,
+        fundIDs: list[str],
+        firstOrdinal: int,
+        prices: np.ndarray,
+        quotedOrdinals: np.ndarray
+    ) -> "PriceMatrix":
+
+        # Create empty matrix and assign already built arrays (e.g. placed in shared memory),
+        # matrix created this way is not built from any quotation, so it covers only dates from the first row
+        matrix = cls({})
+        matrix.FundColumns = {fund: column for column, fund in enumerate(fundIDs)}
+        matrix.FirstOrdinal = firstOrdinal
+        matrix.LastOrdinal = firstOrdinal + len(prices) - 1
+        matrix.ValidFromOrdinal = firstOrdinal
+        matrix.Prices = prices
+        matrix.QuotedOrdinals = quotedOrdinals
+
+        return matrix
+
+    def extend(self, quotations: dict[str, QuotationIndex], firstDate: datetime.date | None = None) -> "PriceMatrix":
+
+        # Rows have to cover provided funds from the first date, funds not placed yet or with replaced quotation
+        # have to be filled on the whole date axis, other funds only on added rows
+        changedFunds = [fund for fund in quotations if self.Quotations.get(fund) is not quotations[fund]]
+        firstOrdinal, lastOrdinal = PriceMatrix.getRowsRange(quotations, firstDate, self.LastDate)
+        firstOrdinal = min(firstOrdinal, self.FirstOrdinal)
+        lastOrdinal = max(lastOrdinal, self.LastOrdinal)
+
+        # return the same matrix if it already contains all funds and dates
+        if not changedFunds and firstOrdinal == self.FirstOrdinal and lastOrdinal == self.LastOrdinal:
+            return self
+
+        # Create new matrix, so matrix already read out by other investments is not changed,
+        # placed funds keep their columns and new ones are added after them
+        allQuotations = self.Quotations | quotations
+        matrix = PriceMatrix.fromArrays(
+            list(allQuotations),
+            firstOrdinal,
+            np.full((lastOrdinal - firstOrdinal + 1, len(allQuotations)), np.nan),
+            np.zeros((lastOrdinal - firstOrdinal + 1, len(allQuotations)), dtype=np.int64)
+        )
+        matrix.Quotations = allQuotations
+        matrix.LastDate = self.LastDate
+
+        # Copy already filled cells and fill added rows of each placed fund
+        firstRow = self.FirstOrdinal - firstOrdinal
+        matrix.Prices[firstRow:firstRow + len(self.Prices), :len(self.FundColumns)] = self.Prices
+        matrix.QuotedOrdinals[firstRow:firstRow + len(self.Prices), :len(self.FundColumns)] = self.QuotedOrdinals
+        earlierDates = np.arange(firstOrdinal, self.FirstOrdinal, dtype=np.int64)
+        laterDates = np.arange(self.LastOrdinal + 1, lastOrdinal + 1, dtype=np.int64)
+        for fund, column in self.FundColumns.items():
+            if fund not in changedFunds:
+                matrix.fillColumn(column, self.Quotations[fund], earlierDates, 0)
+                matrix.fillColumn(column, self.Quotations[fund], laterDates, firstRow + len(self.Prices))
+
+        # Fill whole column of each new fund or fund with replaced quotation
+        dateAxis = np.arange(firstOrdinal, lastOrdinal + 1, dtype=np.int64)
+        for fund in changedFunds:
+            matrix.fillColumn(matrix.getColumn(fund), quotations[fund], dateAxis, 0)
+        matrix.ValidFromOrdinal = matrix.getValidFromOrdinal()
+
+        return matrix
+
+    def covers(self, ordinal: int) -> bool:
+
+        # Prices can be read out from the date of the first row, or for any date if no fund was quoted before it
+        return ordinal >= self.ValidFromOrdinal
+
+    def getFundIDs(self) -> list[str]:
+        return list(self.FundColumns)
+
+    def getColumn(self, fundID: str) -> int:
+        return self.FundColumns[fundID]
+
+    def getRows(self, ordinals: np.ndarray) -> np.ndarray:
+
+        # Dates outside of the matrix are read out from the first or the last row,
+        # as-of lookup checks if quotation of that row is valid for the date
+        return np.clip(ordinals - self.FirstOrdinal, 0, len(self.Prices) - 1)
+
+    def getNearestPrices(
+        self,
+        columns: np.ndarray | int,
+        ordinals: np.ndarray,
+        daysLimit: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+
+        # Read out forward-filled prices and dates of their quotations
+        rows = self.getRows(ordinals)
+        quotedOrdinals = self.QuotedOrdinals[rows, columns]
+
+        # Price is exact if quotation was established at the same date,
+        # otherwise the nearest price is used if it is not older than days limit
+        isExact = quotedOrdinals == ordinals
+        isPriced = (
+            (quotedOrdinals > 0) & (quotedOrdinals <= ordinals) &
+            (ordinals - quotedOrdinals <= daysLimit)
+        )
+
+        # return prices with NaN for dates without valid price and exact price mask
+        return np.where(isPriced, self.Prices[rows, columns], np.nan), isExact
+
+    def getFundPricesOnAxis(
+        self,
+        fundID: str,
+        dateAxis: np.ndarray,
+        daysLimit: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+
+        # Read out prices of single fund for each date on the axis
+        return self.getNearestPrices(self.getColumn(fundID), dateAxis, daysLimit)
@@ -0,0 +1,215 @@
+"""
+.DESCRIPTION
+    Definition file of QuotationArchive class.
+    Class is compact binary file format of a single fund quotation, file structure (little-endian):
+        - header (64 bytes):
+            - Magic <- 4 bytes "FQAR"
+            - Version <- uint16
+            - HeaderSize <- uint16, offset of the first date
+            - Count <- uint32, number of quotations
+            - FundID <- 24 bytes, UTF-8 padded with zeros
+            - Currency <- 24 bytes, UTF-8 padded with zeros
+            - 4 reserved bytes
+        - Dates <- Count * int32, sorted date ordinals (datetime.date.toordinal())
+        - padding to 8 bytes
+        - Prices <- Count * float64, price for date with the same index
+
+    File is read with mmap, dates and prices are returned as numpy arrays pointing to mapped file,
+    so whole file is not parsed nor copied and date range can be sliced with binary search.
+
+.INITIALIZATION
+    Archive is written with static method .write(), which requires file path, fund ID, currency,
+    sorted date ordinals and prices.
+    Class construction requires path to archive file, file is mapped in constructor
+    and it has to be closed with .close() or by using instance as context manager:
+        with QuotationArchive("<path>") as archive:
+            dates, prices = archive.getDateRange(startDate, endDate)
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import mmap
+import struct
+import datetime
+import numpy as np
+from dataclasses import dataclass, field
+
+
+@dataclass
+class QuotationArchive:
+
+    # Initialization Variables
+    FilePath: str
+
+    # Calculated Variables
+    FundID: str = field(init=False)
+    Currency: str = field(init=False)
+    Count: int = field(init=False)
+    Dates: np.ndarray = field(init=False, repr=False)
+    Prices: np.ndarray = field(init=False, repr=False)
+    File: any = field(init=False, default=None, repr=False)
+    Map: mmap.mmap | None = field(init=False, default=None, repr=False)
+
+    # Constant Variables
+    FileExtension = "bin"
+    Magic = b"FQAR"
+    Version = 1
+    HeaderFormat = "<4sHHI24s24s4x"
+    HeaderSize = struct.calcsize(HeaderFormat)
+    DateType = np.dtype("<i4")
+    PriceType = np.dtype("<f8")
+
+    def __post_init__(self):
+
+        # Open file and map it to memory, empty file cannot be mapped
+        self.File = open(self.FilePath, "rb")
+        try:
+            self.Map = mmap.mmap(self.File.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.close()
+            raise ValueError(f"{self.FilePath} is not a quotation archive")
+
+        # Read out header and check if file is in expected format
+        if len(self.Map) < QuotationArchive.HeaderSize:
+            self.close()
+            raise ValueError(f"{self.FilePath} is not a quotation archive")
+        magic, version, headerSize, self.Count, fundID, currency = struct.unpack_from(
+            QuotationArchive.HeaderFormat, self.Map, 0
+        )
+        if magic != QuotationArchive.Magic or version != QuotationArchive.Version:
+            self.close()
+            raise ValueError(f"{self.FilePath} is not a quotation archive")
+
+        self.FundID = fundID.rstrip(b"\0").decode()
+        self.Currency = currency.rstrip(b"\0").decode()
+
+        # Create arrays pointing to mapped file, without copying the data
+        self.Dates = np.frombuffer(
+            self.Map, dtype=QuotationArchive.DateType, count=self.Count, offset=headerSize
+        )
+        self.Prices = np.frombuffer(
+            self.Map,
+            dtype=QuotationArchive.PriceType,
+            count=self.Count,
+            offset=QuotationArchive.getPricesOffset(headerSize, self.Count)
+        )
+
+        return None
+
+    def __enter__(self) -> "QuotationArchive":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+        return None
+
+    def __len__(self) -> int:
+        return self.Count
+
+    @staticmethod
+    def getPricesOffset(headerSize: int, count: int) -> int:
+        # Prices start after dates, aligned to 8 bytes
+        return headerSize + ((count * QuotationArchive.DateType.itemsize + 7) // 8) * 8
+
+    @staticmethod
+    def encodeHeaderText(value: str) -> bytes:
+
+        # Text is stored in fixed size field of the header
+        encoded = value.encode()
+        if len(encoded) > 24:
+            raise ValueError(f"Value '{value}' is too long to be stored in quotation archive header")
+        return encoded
+
+    @staticmethod
+    def write(
+        filePath: str,
+        fundID: str,
+        currency: str,
+        dates: list[int] | np.ndarray,
+        prices: list[float] | np.ndarray
+    ) -> None:
+
+        # Convert provided values to arrays with the same types as in the file
+        dates = np.asarray(dates, dtype=QuotationArchive.DateType)
+        prices = np.asarray(prices, dtype=QuotationArchive.PriceType)
+        if len(dates) != len(prices):
+            raise ValueError("Number of dates and prices must be the same")
+
+        # Open file and write header, dates, padding and prices
+        with open(filePath, "wb") as archiveFile:
+            archiveFile.write(
+                struct.pack(
+                    QuotationArchive.HeaderFormat,
+                    QuotationArchive.Magic,
+                    QuotationArchive.Version,
+                    QuotationArchive.HeaderSize,
+                    len(dates),
+                    QuotationArchive.encodeHeaderText(fundID),
+                    QuotationArchive.encodeHeaderText(currency)
+                )
+            )
+            archiveFile.write(dates.tobytes())
+            archiveFile.write(
+                b"\0" * (
+                    QuotationArchive.getPricesOffset(QuotationArchive.HeaderSize, len(dates)) -
+                    QuotationArchive.HeaderSize - dates.nbytes
+                )
+            )
+            archiveFile.write(prices.tobytes())
+
+        return None
+
+    def getFundID(self) -> str:
+        return self.FundID
+
+    def getCurrency(self) -> str:
+        return self.Currency
+
+    def getDates(self) -> np.ndarray:
+        return self.Dates
+
+    def getPrices(self) -> np.ndarray:
+        return self.Prices
+
+    def getDateRange(
+        self,
+        startDate: datetime.date | None = None,
+        endDate: datetime.date | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+
+        # Find positions of the first date on or after start date
+        # and the first date after end date, not provided limit means the beginning or the end of the archive
+        start = 0 if startDate == None else np.searchsorted(self.Dates, startDate.toordinal(), side="left")
+        end = self.Count if endDate == None else np.searchsorted(self.Dates, endDate.toordinal(), side="right")
+
+        # return slices of mapped arrays, data is not copied
+        return self.Dates[start:end], self.Prices[start:end]
+
+    def close(self) -> None:
+
+        # Arrays pointing to mapped file have to be released before the map is closed
+        self.Dates = None
+        self.Prices = None
+        if self.Map != None:
+
+            # If sliced arrays are still used by the caller, map is released together with them
+            try:
+                self.Map.close()
+            except BufferError:
+                pass
+            self.Map = None
+        if self.File != None:
+            self.File.close()
+            self.File = None
+
+        return None
@@ -0,0 +1,450 @@
+"""
+.DESCRIPTION
+    Definition file of QuotationDatabase class.
+    Class is optional SQLite storage backend of the program, all data is kept in a single database file:
+        - Funds <- fund ID with currency and latest details read out from fund page
+        - Quotations <- price of each fund for each date, indexed by (FundID, Date) and (Date, FundID),
+            so both single fund history and prices of all funds on given date are read out with index
+        - DailyReports <- todays funds' stats, one row per report date and fund
+        - Wallets <- DayByDay headers of each investment, with hash of its order book and the last date
+            calculated with exact prices of all funds (LastFinalDate), at the moment of saving
+        - WalletDays <- DayByDay results of each investment, indexed by (InvestmentName, Date).
+            Value and Invested Money are kept in separate columns to query them directly,
+            whole row is kept as JSON list in the order of investment headers.
+            If order book and headers are the same as in the last save, rows until stored LastFinalDate
+            are kept and only rows after it are replaced, otherwise all rows of the investment are replaced
+
+    Class provides the same methods as QuotationStore, so it can be used as local quotation store
+    of each AnalizyFund instance. When quotation has not changed since the last run
+    it is read out from the database instead of downloading it again.
+
+    Connection is shared by all threads, each operation is done under the lock.
+    Writes are done in a single transaction, which is committed with .commit()
+    (after funds are downloaded, before HTTP validators are saved, and with .close() at the end of the run),
+    rows are inserted in bulk with executemany.
+
+.INITIALIZATION
+    By default class was meant to be a attribute of ListOfFunds class, shared by all AnalizyFund instances
+    and InvestmentWallet.
+    Class construction requires path to the database file, file and tables are created if they do not exist.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-17      Stanisław Horna         DayByDay rows until the last final date are kept if order book
+                                            has not changed, only rows after it are replaced.
+                                            Quotations passed as arrays of date ordinals and prices,
+                                            only the first and the last stored quotation are read out
+                                            to continue stored history.
+
+"""
+# Official and 3-rd party imports
+import json
+import sqlite3
+import datetime
+import threading
+from array import array
+from dataclasses import dataclass, field
+
+# Custom created class modules
+from Dependencies.Class_QuotationStore import QuotationStore
+from Dependencies.Class_DayByDayTable import DayByDayTable
+
+
+@dataclass
+class QuotationDatabase:
+
+    # Initialization Variables
+    FilePath: str
+
+    # Calculated Variables
+    Connection: sqlite3.Connection = field(init=False, repr=False)
+    Lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
+
+    # Constant Variables
+    ValidatorCacheFileSuffix = "HTTPValidators.json"
+    WalletResumeColumns = ["OrderBookHash", "LastFinalDate"]
+    Schema = """
+        CREATE TABLE IF NOT EXISTS Funds (
+            FundID TEXT PRIMARY KEY,
+            Currency TEXT NOT NULL,
+            LatestDetails TEXT
+        );
+        CREATE TABLE IF NOT EXISTS Quotations (
+            FundID TEXT NOT NULL,
+            Date TEXT NOT NULL,
+            Price REAL,
+            PRIMARY KEY (FundID, Date)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS QuotationsByDate ON Quotations (Date, FundID);
+        CREATE TABLE IF NOT EXISTS DailyReports (
+            ReportDate TEXT NOT NULL,
+            FundID TEXT NOT NULL,
+            Report TEXT NOT NULL,
+            PRIMARY KEY (ReportDate, FundID)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS Wallets (
+            InvestmentName TEXT PRIMARY KEY,
+            Headers TEXT NOT NULL,
+            OrderBookHash TEXT,
+            LastFinalDate TEXT
+        );
+        CREATE TABLE IF NOT EXISTS WalletDays (
+            InvestmentName TEXT NOT NULL,
+            Date TEXT NOT NULL,
+            Value REAL,
+            InvestedMoney REAL,
+            Row TEXT NOT NULL,
+            PRIMARY KEY (InvestmentName, Date)
+        ) WITHOUT ROWID;
+    """
+
+    def __post_init__(self):
+
+        # Open database shared by all threads, transaction is started with the first write of the run
+        self.Connection = sqlite3.connect(self.FilePath, check_same_thread=False)
+
+        # Create tables and indexes if they do not exist
+        with self.Lock:
+            self.Connection.executescript(QuotationDatabase.Schema)
+
+            # Add columns which are missing in wallets table created by previous version
+            walletColumns = [row[1] for row in self.Connection.execute("PRAGMA table_info(Wallets)")]
+            for column in QuotationDatabase.WalletResumeColumns:
+                if column not in walletColumns:
+                    self.Connection.execute(f"ALTER TABLE Wallets ADD COLUMN {column} TEXT")
+            self.Connection.commit()
+
+        return None
+
+    def commit(self) -> None:
+
+        # Save all writes of the run at once
+        with self.Lock:
+            self.Connection.commit()
+
+        return None
+
+    def close(self) -> None:
+
+        # Commit pending writes and close the database
+        with self.Lock:
+            self.Connection.commit()
+            self.Connection.close()
+
+        return None
+
+    def getValidatorCacheFilePath(self) -> str:
+        # HTTP validators are kept in JSON file next to the database
+        return f"{self.FilePath}.{QuotationDatabase.ValidatorCacheFileSuffix}"
+
+    def hasQuotation(self, fundID: str) -> bool:
+
+        # Fund can be stored only with latest details, so quotation table is checked
+        with self.Lock:
+            return self.Connection.execute(
+                "SELECT 1 FROM Quotations WHERE FundID = ? LIMIT 1", (fundID,)
+            ).fetchone() != None
+
+    def hasLatestDetails(self, fundID: str) -> bool:
+
+        with self.Lock:
+            return self.Connection.execute(
+                "SELECT 1 FROM Funds WHERE FundID = ? AND LatestDetails IS NOT NULL", (fundID,)
+            ).fetchone() != None
+
+    def loadLatestDetails(self, fundID: str) -> dict[str, str]:
+
+        # Details are kept as JSON structure
+        with self.Lock:
+            return json.loads(
+                self.Connection.execute(
+                    "SELECT LatestDetails FROM Funds WHERE FundID = ?", (fundID,)
+                ).fetchone()[0]
+            )
+
+    def saveLatestDetails(self, fundID: str, details: dict[str, str]) -> None:
+
+        # Create fund if it was not stored yet, otherwise update only its details
+        with self.Lock:
+            self.Connection.execute(
+                """
+                INSERT INTO Funds (FundID, Currency, LatestDetails) VALUES (?, ?, ?)
+                ON CONFLICT (FundID) DO UPDATE SET LatestDetails = excluded.LatestDetails
+                """,
+                (fundID, details["Currency"], json.dumps(details))
+            )
+
+        return None
+
+    def load(self, fundID: str) -> dict[str, str | array] | None:
+
+        with self.Lock:
+
+            # If fund was never stored there is nothing to load
+            fund = self.Connection.execute(
+                "SELECT Currency FROM Funds WHERE FundID = ?", (fundID,)
+            ).fetchone()
+            if fund == None:
+                return None
+
+            # Read out quotations sorted by date with primary key index
+            rows = self.Connection.execute(
+                "SELECT Date, Price FROM Quotations WHERE FundID = ? ORDER BY Date", (fundID,)
+            ).fetchall()
+
+        # return stored data with quotation as arrays of date ordinals and prices sorted by date,
+        # the same as QuotationStore.load()
+        return {
+            "FundID": fundID,
+            "Currency": fund[0],
+            "Ordinals": array(
+                QuotationStore.OrdinalTypeCode,
+                [datetime.date.fromisoformat(date).toordinal() for date, _ in rows]
+            ),
+            "Prices": array(QuotationStore.PriceTypeCode, [price for _, price in rows])
+        }
+
+    def loadTail(self, fundID: str) -> dict[str, str | int | float] | None:
+
+        with self.Lock:
+
+            # If fund was never stored there is nothing to continue
+            fund = self.Connection.execute(
+                "SELECT Currency FROM Funds WHERE FundID = ?", (fundID,)
+            ).fetchone()
+            if fund == None:
+                return None
+
+            # Read out only the first and the last quotation with primary key index
+            first = self.Connection.execute(
+                "SELECT Date FROM Quotations WHERE FundID = ? ORDER BY Date LIMIT 1", (fundID,)
+            ).fetchone()
+            last = self.Connection.execute(
+                "SELECT Date, Price FROM Quotations WHERE FundID = ? ORDER BY Date DESC LIMIT 1", (fundID,)
+            ).fetchone()
+
+        if first == None:
+            return None
+
+        # return fund details with the first and the last stored quotation, the same as QuotationStore.loadTail()
+        return {
+            "FundID": fundID,
+            "Currency": fund[0],
+            "FirstDate": datetime.date.fromisoformat(first[0]).toordinal(),
+            "LastDate": datetime.date.fromisoformat(last[0]).toordinal(),
+            "LastPrice": last[1]
+        }
+
+    def update(
+        self,
+        fundID: str,
+        currency: str,
+        ordinals: array,
+        prices: array
+    ) -> tuple[array, array]:
+
+        with self.Lock:
+
+            # Read out the first and the last quotation seen in previous runs
+            tail = self.loadTail(fundID)
+
+            # Check how many downloaded quotations are newer than the stored ones,
+            # None means that stored history cannot be continued with downloaded list
+            newQuotationsCount = QuotationStore.countNewQuotations(tail, currency, ordinals, prices)
+
+            # Stored history does not match downloaded one, replace all fund quotations
+            if newQuotationsCount == None:
+                self.Connection.execute(
+                    """
+                    INSERT INTO Funds (FundID, Currency) VALUES (?, ?)
+                    ON CONFLICT (FundID) DO UPDATE SET Currency = excluded.Currency
+                    """,
+                    (fundID, currency)
+                )
+                self.Connection.execute("DELETE FROM Quotations WHERE FundID = ?", (fundID,))
+                self.insertQuotations(fundID, ordinals, prices)
+                return ordinals, prices
+
+            # Insert only quotations newer than the last stored one
+            if newQuotationsCount > 0:
+                self.insertQuotations(fundID, ordinals[-newQuotationsCount:], prices[-newQuotationsCount:])
+
+            # If downloaded list starts on or before the first stored date, it already contains stored history
+            if ordinals[0] <= tail["FirstDate"]:
+                return ordinals, prices
+
+            # return stored history extended with new quotations
+            stored = self.load(fundID)
+
+        return stored["Ordinals"], stored["Prices"]
+
+    def insertQuotations(self, fundID: str, ordinals: array, prices: array) -> None:
+
+        # Insert all quotations at once
+        self.Connection.executemany(
+            "INSERT OR IGNORE INTO Quotations (FundID, Date, Price) VALUES (?, ?, ?)",
+            (
+                (fundID, datetime.date.fromordinal(date).isoformat(), price)
+                for date, price in zip(ordinals, prices)
+            )
+        )
+
+        return None
+
+    def getPricesOnDate(self, date: datetime.date) -> dict[str, float]:
+
+        # Read out price of each fund for provided date with date index
+        with self.Lock:
+            return dict(
+                self.Connection.execute(
+                    "SELECT FundID, Price FROM Quotations WHERE Date = ?", (date.isoformat(),)
+                ).fetchall()
+            )
+
+    def saveDailyReport(self, reportDate: datetime.date, report: list[dict[str, str]]) -> None:
+
+        # Report generated again on the same day replaces the previous one
+        with self.Lock:
+            self.Connection.executemany(
+                "INSERT OR REPLACE INTO DailyReports (ReportDate, FundID, Report) VALUES (?, ?, ?)",
+                (
+                    (reportDate.isoformat(), item["FundID"], json.dumps(item))
+                    for item in report
+                )
+            )
+
+        return None
+
+    def loadDailyReport(self, reportDate: datetime.date) -> list[dict[str, str]]:
+
+        with self.Lock:
+            return [
+                json.loads(row[0])
+                for row in self.Connection.execute(
+                    "SELECT Report FROM DailyReports WHERE ReportDate = ? ORDER BY FundID",
+                    (reportDate.isoformat(),)
+                )
+            ]
+
+    def getWalletLastFinalDate(
+        self,
+        investmentName: str,
+        headers: list[str],
+        orderBookHash: str
+    ) -> str | None:
+
+        with self.Lock:
+            wallet = self.Connection.execute(
+                "SELECT Headers, OrderBookHash, LastFinalDate FROM Wallets WHERE InvestmentName = ?",
+                (investmentName,)
+            ).fetchone()
+
+        # Stored rows are valid only if they were saved for the same order book and columns
+        if wallet == None or wallet[1] != orderBookHash or json.loads(wallet[0]) != headers:
+            return None
+
+        # return the last date which rows will not change anymore
+        return wallet[2]
+
+    def saveWalletDays(
+        self,
+        investmentName: str,
+        headers: list[str],
+        rows,
+        orderBookHash: str | None = None,
+        lastFinalDate: str | None = None,
+        keptUntilDate: str | None = None
+    ) -> None:
+
+        # Rows are provided as lists of values in the order of headers, they can be read out lazily
+        valueIndex = headers.index("Value")
+        investedMoneyIndex = headers.index("Invested Money")
+
+        with self.Lock:
+
+            # Headers are saved once per investment, as each row has the same columns,
+            # together with order book and the last final date, so next save can keep rows until that date
+            self.Connection.execute(
+                """
+                INSERT OR REPLACE INTO Wallets (InvestmentName, Headers, OrderBookHash, LastFinalDate)
+                VALUES (?, ?, ?, ?)
+                """,
+                (investmentName, json.dumps(headers), orderBookHash, lastFinalDate)
+            )
+
+            # Rows until provided date are already stored (getWalletLastFinalDate), only rows after it
+            # are replaced with provided ones, otherwise all rows of the investment are replaced,
+            # as order book could change since the last run
+            if keptUntilDate != None:
+                self.Connection.execute(
+                    "DELETE FROM WalletDays WHERE InvestmentName = ? AND Date > ?",
+                    (investmentName, keptUntilDate)
+                )
+            else:
+                self.Connection.execute(
+                    "DELETE FROM WalletDays WHERE InvestmentName = ?", (investmentName,)
+                )
+            self.Connection.executemany(
+                """
+                INSERT INTO WalletDays (InvestmentName, Date, Value, InvestedMoney, Row)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    (
+                        investmentName,
+                        values[0],
+                        values[valueIndex],
+                        values[investedMoneyIndex],
+                        json.dumps(values)
+                    )
+                    for values in rows
+                )
+            )
+
+        return None
+
+    def loadWalletDays(self, investmentName: str) -> DayByDayTable | None:
+
+        with self.Lock:
+
+            # If investment was never stored there is nothing to load
+            wallet = self.Connection.execute(
+                "SELECT Headers FROM Wallets WHERE InvestmentName = ?", (investmentName,)
+            ).fetchone()
+            if wallet == None:
+                return None
+
+            rows = self.Connection.execute(
+                "SELECT Row FROM WalletDays WHERE InvestmentName = ? ORDER BY Date",
+                (investmentName,)
+            ).fetchall()
+
+        # return rows converted to columnar table, the same as read out from DayByDay CSV file
+        return DayByDayTable.fromRows(
+            json.loads(wallet[0]),
+            [json.loads(row[0]) for row in rows]
+        )
+
+    def getWalletValues(
+        self,
+        investmentName: str,
+        startDate: datetime.date | None = None
+    ) -> list[tuple[str, float, float]]:
+
+        # Read out date, value and invested money of the investment since provided date with primary key index
+        with self.Lock:
+            return self.Connection.execute(
+                """
+                SELECT Date, Value, InvestedMoney FROM WalletDays
+                WHERE InvestmentName = ? AND Date >= ? ORDER BY Date
+                """,
+                (investmentName, startDate.isoformat() if startDate != None else "")
+            ).fetchall()
@@ -0,0 +1,229 @@
+"""
+.DESCRIPTION
+    Definition file of QuotationIndex class.
+    Class is data structure to store fund quotation sorted by date and answer price lookups:
+        - exact date lookup <- price for particular date or None
+        - as-of lookup <- last price on or before provided date, within the limit of days
+    Dates are kept as sorted array of ordinals (datetime.date.toordinal()) with parallel array of prices.
+    Dense array of positions (one item per calendar day from the first to the last quotation) keeps
+    position of the last quotation on or before each day, so as-of and exact date lookups are a single
+    array access (O(1)) instead of searching or checking day after day.
+    Arrays keep only 16 bytes per quotation and 4 bytes per calendar day, raw API list is not stored,
+    entries in the API structure are regenerated on demand with .iterQuotations().
+
+.INITIALIZATION
+    By default class was meant to be a attribute of AnalizyFund class.
+    Class construction requires list (or any iterable) of quotation entries received from Analizy.pl API:
+        [
+            {"date": "<yyyy-MM-dd>", "value": <float>},
+            {"date": "<yyyy-MM-dd>", "value": <float>}
+        ]
+    Index can be also created from already sorted date ordinals and prices with .fromArrays()
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-17      Stanisław Horna         Index can be created from sorted arrays (e.g. QuotationArchive).
+                                            Prices kept in compact arrays with __slots__, date dict removed.
+                                            Entries can be indexed lazily from iterable (e.g. streamed response),
+                                            arrays are sorted only if entries were not received in date order.
+                                            Exact date and as-of lookups read out position from dense array
+                                            of calendar days (O(1)), array is filled with numpy in one call.
+                                            Exact date lookup returns None for date not in "yyyy-MM-dd" format.
+                                            Index is created from numpy or stored arrays as memory blocks.
+
+"""
+# Official and 3-rd party imports
+import datetime
+import numpy as np
+from array import array
+from typing import Iterable
+from dataclasses import dataclass, field, InitVar
+
+# Custom created variables modules
+from Dependencies.Variables_API import *
+
+
+@dataclass(slots=True)
+class QuotationIndex:
+
+    # Initialization Variables
+    Quotations: InitVar[Iterable[dict[str, str | float]] | None] = None
+
+    # Calculated Variables
+    Ordinals: array = field(default_factory=lambda: array(QuotationIndex.OrdinalTypeCode), init=False)
+    Prices: array = field(default_factory=lambda: array(QuotationIndex.PriceTypeCode), init=False)
+    Positions: array = field(default_factory=lambda: array(QuotationIndex.PositionTypeCode), init=False, repr=False)
+
+    # Constant Variables
+    DefaultDaysLimit = 7
+    OrdinalTypeCode = "l"
+    PriceTypeCode = "d"
+    PositionTypeCode = "i"
+
+    def __post_init__(self, quotations: Iterable[dict[str, str | float]] | None):
+
+        # Nothing to index if quotation list was not provided
+        if quotations == None:
+            return None
+
+        # Loop through quotation entries and collect valid prices as soon as they are provided,
+        # entries can be generated lazily e.g. by QuotationStreamParser while response is downloaded
+        isSorted = True
+        for item in quotations:
+
+            # skip entries without valid date or price, lookup for such date will return None
+            try:
+                date = datetime.date.fromisoformat(item[analizyplAPIresponse_QuotationDate]).toordinal()
+                price = float(item[analizyplAPIresponse_QuotationValue])
+            except (TypeError, ValueError, KeyError):
+                continue
+
+            # API returns quotation sorted by date, if not, arrays are sorted once at the end
+            if self.Ordinals and date <= self.Ordinals[-1]:
+                isSorted = False
+            self.Ordinals.append(date)
+            self.Prices.append(price)
+
+        if not isSorted:
+            self.sortPrices()
+
+        self.indexPositions()
+
+        return None
+
+    def indexPositions(self) -> None:
+
+        # For each calendar day from the first to the last quotation keep position of the last quotation
+        # on or before that day, days without quotation repeat position of the previous one
+        self.Positions = array(QuotationIndex.PositionTypeCode)
+        if not self.Ordinals:
+            return None
+
+        # Number of calendar days each quotation is valid for, the last one is valid only for its own day,
+        # dense array is filled in one call instead of extending it quotation by quotation
+        ordinals = np.asarray(self.Ordinals)
+        daysCount = np.append(np.diff(ordinals), 1)
+        positions = np.repeat(np.arange(len(ordinals), dtype=np.intc), daysCount)
+        self.Positions.frombytes(positions.tobytes())
+
+        return None
+
+    def sortPrices(self) -> None:
+
+        # Sort prices by date, sort is stable so the first price is kept if API returned the date more than once
+        order = sorted(range(len(self.Ordinals)), key=self.Ordinals.__getitem__)
+        ordinals = array(QuotationIndex.OrdinalTypeCode)
+        prices = array(QuotationIndex.PriceTypeCode)
+        for position in order:
+            if ordinals and ordinals[-1] == self.Ordinals[position]:
+                continue
+            ordinals.append(self.Ordinals[position])
+            prices.append(self.Prices[position])
+
+        self.Ordinals = ordinals
+        self.Prices = prices
+
+        return None
+
+    @classmethod
+    def fromArrays(cls, ordinals, prices) -> "QuotationIndex":
+
+        # Create empty index and fill it with sorted prices, each date is expected only once,
+        # arrays (e.g. mapped QuotationArchive or stored quotation) are copied as memory blocks,
+        # without creating Python object for each value
+        index = cls()
+        index.Ordinals = array(QuotationIndex.OrdinalTypeCode)
+        index.Ordinals.frombytes(np.asarray(ordinals, dtype=QuotationIndex.OrdinalTypeCode).tobytes())
+        index.Prices = array(QuotationIndex.PriceTypeCode)
+        index.Prices.frombytes(np.asarray(prices, dtype=QuotationIndex.PriceTypeCode).tobytes())
+        index.indexPositions()
+
+        return index
+
+    def __len__(self) -> int:
+        return len(self.Ordinals)
+
+    def getPriceOnDate(self, date: str | datetime.date) -> float | None:
+
+        # Convert date provided in "yyyy-MM-dd" format to ordinal,
+        # date in any other format can not have quotation, so None is returned
+        try:
+            if isinstance(date, str):
+                date = datetime.date.fromisoformat(date)
+            ordinal = date.toordinal()
+        except (TypeError, ValueError, AttributeError):
+            return None
+
+        # return price for exact date, None if there is no quotation for that day
+        position = self.getPosition(ordinal)
+        if position < 0 or self.Ordinals[position] != ordinal:
+            return None
+
+        return self.Prices[position]
+
+    def getPosition(self, ordinal: int) -> int:
+
+        # No quotation on or before dates before the first one
+        if not self.Ordinals or ordinal < self.Ordinals[0]:
+            return -1
+
+        # Dates after the last quotation point to the last one
+        offset = ordinal - self.Ordinals[0]
+        if offset >= len(self.Positions):
+            return len(self.Ordinals) - 1
+
+        # return position of the last quotation on or before provided date ordinal
+        return self.Positions[offset]
+
+    def iterQuotations(self):
+
+        # Yield date in "yyyy-MM-dd" format with its price, sorted by date
+        for date, price in zip(self.Ordinals, self.Prices):
+            yield datetime.date.fromordinal(date).isoformat(), price
+
+        return None
+
+    def getQuotations(self) -> list[dict[str, str | float]]:
+
+        # return quotation in the same structure as received from API
+        return [
+            {
+                analizyplAPIresponse_QuotationDate: date,
+                analizyplAPIresponse_QuotationValue: price
+            }
+            for date, price in self.iterQuotations()
+        ]
+
+    def getLastDate(self) -> datetime.date:
+
+        # return date of the latest quotation
+        return datetime.date.fromordinal(self.Ordinals[-1])
+
+    def getNearestPrice(self, date: datetime.date, daysLimit: int = DefaultDaysLimit) -> float | None:
+
+        # find position of the last quotation on or before provided date
+        position = self.getPosition(date.toordinal())
+
+        # return None if there is no quotation before provided date or
+        # it is older than provided days limit,
+        # it makes no sense to look further in the past for the quotation of particular fund
+        if position < 0 or date.toordinal() - self.Ordinals[position] > daysLimit:
+            return None
+
+        return self.Prices[position]
+
+    def getNearestPrices(self, dates: list[datetime.date], daysLimit: int = DefaultDaysLimit) -> list[float | None]:
+
+        # return as-of price for each provided date, keeping the order of dates
+        return [
+            self.getNearestPrice(date, daysLimit)
+            for date in dates
+        ]
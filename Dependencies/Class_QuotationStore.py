@@ -0,0 +1,258 @@
+"""
+.DESCRIPTION
+    Definition file of QuotationStore class.
+    Class is local on-disk store of fund quotations already received from Analizy.pl API.
+    Each fund is kept in separate file named by fund ID in provided directory, file structure:
+        {"FundID": "<Fund_ID>", "Currency": "<Currency>"}
+        ["<yyyy-MM-dd>", <float>]
+        ["<yyyy-MM-dd>", <float>]
+    First line is a header with fund details, each next line is a single quotation.
+    Latest fund details read out from fund page are kept in separate JSON file per fund.
+
+    When new quotation list is downloaded, only header, the first and the last line of the file are read out.
+    If downloaded list contains the last stored date with the same price, only newer quotations are appended
+    to the file, otherwise (history has been revised by the API) file is rewritten with downloaded list.
+    Whole file is read out only if the quotation has not changed since the last run
+    or downloaded list does not cover the first stored date.
+    File is rewritten in temporary file which replaces the stored one, so it is never left partially written.
+    If appending was interrupted, partially written last line is skipped by .load()
+    and file is rewritten with the next downloaded list.
+
+.INITIALIZATION
+    By default class was meant to be a attribute of ListOfFunds class, shared by all AnalizyFund instances.
+    Class construction requires path to the directory where quotations will be stored.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-17      Stanisław Horna         Latest fund details and HTTP validators kept in the store.
+                                            countNewQuotations is static to be shared with QuotationDatabase
+                                            Quotations passed as arrays of date ordinals and prices,
+                                            only the tail of the file is read out to continue stored history.
+
+"""
+# Official and 3-rd party imports
+import os
+import json
+import bisect
+import datetime
+import tempfile
+from array import array
+from dataclasses import dataclass
+
+# Custom created class modules
+from Dependencies.Class_OutputWriter import OutputWriter, defaultFileMode
+
+
+@dataclass
+class QuotationStore:
+
+    # Initialization Variables
+    DirectoryPath: str
+
+    # Constant Variables
+    FileExtension = "jsonl"
+    LatestDetailsFileSuffix = "LatestDetails"
+    ValidatorCacheFileName = "HTTPValidators.json"
+    TailSize = 4096
+    OrdinalTypeCode = "l"
+    PriceTypeCode = "d"
+
+    def getFilePath(self, fundID: str) -> str:
+        return f"{self.DirectoryPath}/{fundID}.{QuotationStore.FileExtension}"
+
+    def getLatestDetailsFilePath(self, fundID: str) -> str:
+        return f"{self.DirectoryPath}/{fundID}_{QuotationStore.LatestDetailsFileSuffix}.json"
+
+    def getValidatorCacheFilePath(self) -> str:
+        return f"{self.DirectoryPath}/{QuotationStore.ValidatorCacheFileName}"
+
+    def hasQuotation(self, fundID: str) -> bool:
+        return os.path.isfile(self.getFilePath(fundID))
+
+    def hasLatestDetails(self, fundID: str) -> bool:
+        return os.path.isfile(self.getLatestDetailsFilePath(fundID))
+
+    def loadLatestDetails(self, fundID: str) -> dict[str, str]:
+
+        # Open details file and parse JSON content
+        with open(self.getLatestDetailsFilePath(fundID), "r") as detailsFile:
+            return json.loads(detailsFile.read())
+
+    def saveLatestDetails(self, fundID: str, details: dict[str, str]) -> None:
+
+        # Open details file and write dict dumped to JSON structure
+        with open(self.getLatestDetailsFilePath(fundID), "w") as detailsFile:
+            detailsFile.write(json.dumps(details, indent=4))
+
+        return None
+
+    def load(self, fundID: str) -> dict[str, str | array] | None:
+
+        # If fund was never stored there is nothing to load
+        if not self.hasQuotation(fundID):
+            return None
+
+        # Open file, first line is a header, each next one is a single quotation
+        with open(self.getFilePath(fundID), "r") as storeFile:
+            header = json.loads(storeFile.readline())
+            content = storeFile.read()
+
+        # Last line without line break was partially written by interrupted append, it is skipped
+        if not content.endswith("\n"):
+            content = content[:content.rfind("\n") + 1]
+
+        # Quotation lines are joined into one JSON list, which is parsed at once
+        rows = json.loads("[" + ",".join(content.splitlines()) + "]")
+
+        # return stored data with quotation as arrays of date ordinals and prices sorted by date
+        return {
+            "FundID": header["FundID"],
+            "Currency": header["Currency"],
+            "Ordinals": array(
+                QuotationStore.OrdinalTypeCode,
+                [datetime.date.fromisoformat(row[0]).toordinal() for row in rows]
+            ),
+            "Prices": array(QuotationStore.PriceTypeCode, [row[1] for row in rows])
+        }
+
+    def loadTail(self, fundID: str) -> dict[str, str | int | float] | None:
+
+        # If fund was never stored there is nothing to continue
+        if not self.hasQuotation(fundID):
+            return None
+
+        # Read out header, the first quotation line and the end of the file, without reading whole file
+        with open(self.getFilePath(fundID), "rb") as storeFile:
+            headerLine = storeFile.readline()
+            firstLine = storeFile.readline()
+            storeFile.seek(0, os.SEEK_END)
+            storeFile.seek(max(storeFile.tell() - QuotationStore.TailSize, 0))
+            tail = storeFile.read()
+
+        # File without quotation or with partially written last line cannot be continued
+        if not firstLine.endswith(b"\n") or not tail.endswith(b"\n"):
+            return None
+
+        # return fund details with the first and the last stored quotation,
+        # None if any of them cannot be parsed, so file will be rewritten
+        try:
+            header = json.loads(headerLine)
+            first = json.loads(firstLine)
+            last = json.loads(tail[:-1].rsplit(b"\n", 1)[-1])
+            return {
+                "FundID": header["FundID"],
+                "Currency": header["Currency"],
+                "FirstDate": datetime.date.fromisoformat(first[0]).toordinal(),
+                "LastDate": datetime.date.fromisoformat(last[0]).toordinal(),
+                "LastPrice": last[1]
+            }
+        except (TypeError, ValueError, KeyError, IndexError):
+            return None
+
+    def update(
+        self,
+        fundID: str,
+        currency: str,
+        ordinals: array,
+        prices: array
+    ) -> tuple[array, array]:
+
+        # Read out the first and the last quotation seen in previous runs
+        tail = self.loadTail(fundID)
+
+        # Check how many downloaded quotations are newer than the stored ones,
+        # None means that stored history cannot be continued with downloaded list
+        newQuotationsCount = self.countNewQuotations(tail, currency, ordinals, prices)
+
+        # Stored history does not match downloaded one, rewrite whole file
+        if newQuotationsCount == None:
+            self.write(fundID, currency, ordinals, prices)
+            return ordinals, prices
+
+        # Append only quotations newer than the last stored one
+        if newQuotationsCount > 0:
+            self.append(fundID, ordinals[-newQuotationsCount:], prices[-newQuotationsCount:])
+
+        # If downloaded list starts on or before the first stored date, it already contains stored history
+        if ordinals[0] <= tail["FirstDate"]:
+            return ordinals, prices
+
+        # return stored history extended with new quotations
+        stored = self.load(fundID)
+        return stored["Ordinals"], stored["Prices"]
+
+    @staticmethod
+    def countNewQuotations(
+        tail: dict[str, str | int | float] | None,
+        currency: str,
+        ordinals: array,
+        prices: array
+    ) -> int | None:
+
+        # Nothing to continue if fund was not stored or currency has changed
+        if tail == None or tail["Currency"] != currency:
+            return None
+
+        # Find the last stored date in downloaded dates sorted ascending
+        position = bisect.bisect_left(ordinals, tail["LastDate"])
+
+        # Last stored date is missing in downloaded list or its price has changed
+        if position == len(ordinals) or ordinals[position] != tail["LastDate"] or prices[position] != tail["LastPrice"]:
+            return None
+
+        # Last stored date found with the same price, stored history is up to date until this point
+        return len(ordinals) - 1 - position
+
+    def write(self, fundID: str, currency: str, ordinals: array, prices: array) -> None:
+
+        # Write header and quotations to temporary file in the same directory and replace fund file with it,
+        # so file is never left partially written
+        temporaryFile = tempfile.NamedTemporaryFile(
+            "w",
+            dir=self.DirectoryPath,
+            prefix=f".{fundID}.",
+            suffix=OutputWriter.TemporaryFileSuffix,
+            delete=False
+        )
+        try:
+            with temporaryFile:
+                temporaryFile.write(
+                    json.dumps({"FundID": fundID, "Currency": currency}) + "\n"
+                )
+                self.writeQuotations(temporaryFile, ordinals, prices)
+            os.chmod(temporaryFile.name, defaultFileMode)
+            os.replace(temporaryFile.name, self.getFilePath(fundID))
+
+        # Remove temporary file if quotation could not be saved, stored file is left unchanged
+        except BaseException:
+            if os.path.exists(temporaryFile.name):
+                os.remove(temporaryFile.name)
+            raise
+
+        return None
+
+    def append(self, fundID: str, ordinals: array, prices: array) -> None:
+
+        # Append new quotations at the end of fund file
+        with open(self.getFilePath(fundID), "a") as storeFile:
+            self.writeQuotations(storeFile, ordinals, prices)
+
+        return None
+
+    def writeQuotations(self, storeFile, ordinals: array, prices: array) -> None:
+
+        # Write each quotation in separate line
+        storeFile.writelines(
+            json.dumps([datetime.date.fromordinal(date).isoformat(), price]) + "\n"
+            for date, price in zip(ordinals, prices)
+        )
+
+        return None
@@ -0,0 +1,292 @@
+"""
+.DESCRIPTION
+    Definition file of QuotationStreamParser class.
+    Class is incremental parser of quotation response received from Analizy.pl API:
+        {
+            "id": "<Fund_ID>",
+            "currency": "<Currency>",
+            "series": [
+                {"price": [{"date": "<yyyy-MM-dd>", "value": <float>}, ...], ...},
+                ...
+            ],
+            ...
+        }
+    Response is parsed chunk by chunk while it is downloaded, only following values are read out:
+        - FundID <- "id"
+        - Currency <- "currency"
+        - quotation entries <- "series"[0]["price"], each entry is yielded as soon as it is complete
+    All other values are skipped token by token without creating objects for them,
+    so neither whole response body nor whole decoded response is kept in memory.
+
+.INITIALIZATION
+    Class construction does not require any parameters, single instance parses single response:
+        parser = QuotationStreamParser()
+        index = QuotationIndex(parser.parse(<iterable_of_byte_chunks>))
+        currency = parser.getCurrency()
+    FundID and Currency are available after all entries were consumed from .parse() generator.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import re
+import json
+import codecs
+from typing import Iterable, Iterator
+from dataclasses import dataclass, field
+
+# Custom created variables modules
+from Dependencies.Variables_API import *
+
+
+@dataclass
+class QuotationStreamParser:
+
+    # Calculated Variables
+    FundID: str | None = field(default=None, init=False)
+    Currency: str | None = field(default=None, init=False)
+    Count: int = field(default=0, init=False)
+    IsFinished: bool = field(default=False, init=False)
+    Buffer: str = field(default="", init=False, repr=False)
+    Position: int = field(default=0, init=False, repr=False)
+    Stack: list[list[str | int]] = field(default_factory=list, init=False, repr=False)
+
+    # Constant Variables
+    Decoder = json.JSONDecoder()
+    Incomplete = object()
+    Whitespace = re.compile(r"[ \t\n\r]*")
+    Scalar = re.compile(r"[^ \t\n\r,\]}]*")
+    EntrySeparator = re.compile(r"[ \t\n\r]*,[ \t\n\r]*(?=\{)")
+    ObjectStart = "{"
+    ArrayStart = "["
+    ExpectKey = "Key"
+    ExpectColon = "Colon"
+    ExpectValue = "Value"
+    ExpectComma = "Comma"
+
+    def parse(self, chunks: Iterable[bytes]) -> Iterator[dict[str, str | float]]:
+
+        # Bytes are decoded incrementally, multi-byte character can be split between chunks
+        decoder = codecs.getincrementaldecoder("utf-8")()
+
+        # Parse each chunk as soon as it is received and yield complete quotation entries
+        for chunk in chunks:
+            yield from self.feed(decoder.decode(chunk))
+        yield from self.feed(decoder.decode(b"", final=True), final=True)
+
+        # Response has to be complete to be sure that whole quotation was received
+        if not self.IsFinished:
+            raise ValueError("Quotation response is incomplete")
+        if self.Currency == None:
+            raise ValueError("Quotation response does not contain currency")
+
+        return None
+
+    def getFundID(self) -> str | None:
+        return self.FundID
+
+    def getCurrency(self) -> str | None:
+        return self.Currency
+
+    def getCount(self) -> int:
+        return self.Count
+
+    def feed(self, text: str, final: bool = False) -> Iterator[dict[str, str | float]]:
+
+        # Keep only not parsed part of the previous chunk
+        self.Buffer = self.Buffer[self.Position:] + text
+        self.Position = 0
+
+        # Loop through tokens until buffer ends or token is split between chunks
+        while True:
+
+            # Skip whitespaces, wait for next chunk if nothing is left
+            self.Position = QuotationStreamParser.Whitespace.match(self.Buffer, self.Position).end()
+            if self.Position == len(self.Buffer):
+                break
+
+            # Nothing is expected after the end of the response
+            if self.IsFinished:
+                raise ValueError("Unexpected data after the end of quotation response")
+
+            character = self.Buffer[self.Position]
+
+            # Top-level value is expected at the beginning of the response
+            if not self.Stack:
+                state = QuotationStreamParser.ExpectValue
+            else:
+                state = self.Stack[-1][2]
+
+            # Object key or the end of the object
+            if state == QuotationStreamParser.ExpectKey:
+                if character == "}" and self.Stack[-1][1] == None:
+                    self.closeContainer()
+                    continue
+                key = self.decodeValue(final)
+                if key is QuotationStreamParser.Incomplete:
+                    break
+                if not isinstance(key, str):
+                    raise ValueError("Unexpected object key in quotation response")
+                self.Stack[-1][1] = key
+                self.Stack[-1][2] = QuotationStreamParser.ExpectColon
+
+            # Separator between object key and its value
+            elif state == QuotationStreamParser.ExpectColon:
+                self.expectCharacter(character, ":")
+                self.Position += 1
+                self.Stack[-1][2] = QuotationStreamParser.ExpectValue
+
+            # Next item or the end of the container
+            elif state == QuotationStreamParser.ExpectComma:
+                if character == ",":
+                    self.Position += 1
+                    if self.Stack[-1][0] == QuotationStreamParser.ObjectStart:
+                        self.Stack[-1][2] = QuotationStreamParser.ExpectKey
+                    else:
+                        self.Stack[-1][1] += 1
+                        self.Stack[-1][2] = QuotationStreamParser.ExpectValue
+                else:
+                    self.expectCharacter(
+                        character,
+                        "}" if self.Stack[-1][0] == QuotationStreamParser.ObjectStart else "]"
+                    )
+                    self.closeContainer()
+
+            # The end of empty array
+            elif (
+                character == "]" and self.Stack
+                and self.Stack[-1][0] == QuotationStreamParser.ArrayStart and self.Stack[-1][1] == 0
+            ):
+                self.closeContainer()
+
+            # Quotation entries are decoded one after another, each entry is small object decoded at once
+            elif self.isQuotationEntry():
+                isComplete = yield from self.decodeQuotationEntries(final)
+                if not isComplete:
+                    break
+
+            # Fund ID and currency are top-level values
+            elif self.isTopLevelKey(analizyplAPIresponse_ID) or self.isTopLevelKey(analizyplAPIresponse_Currency):
+                value = self.decodeValue(final)
+                if value is QuotationStreamParser.Incomplete:
+                    break
+                if self.Stack[-1][1] == analizyplAPIresponse_ID:
+                    self.FundID = value
+                else:
+                    self.Currency = value
+                self.completeValue()
+
+            # Other containers are walked through, so only quotation entries are decoded
+            elif character == "{" or character == "[":
+                self.Position += 1
+                self.Stack.append(
+                    [QuotationStreamParser.ObjectStart, None, QuotationStreamParser.ExpectKey]
+                    if character == "{" else
+                    [QuotationStreamParser.ArrayStart, 0, QuotationStreamParser.ExpectValue]
+                )
+
+            # Other scalar values are skipped
+            else:
+                if self.decodeValue(final) is QuotationStreamParser.Incomplete:
+                    break
+                self.completeValue()
+
+        # Whole buffer has to be parsed at the end of the response
+        if final and self.Position != len(self.Buffer):
+            raise ValueError("Quotation response is not valid JSON")
+
+        return None
+
+    def decodeValue(self, final: bool) -> any:
+
+        # Number or literal can be continued in the next chunk if it is not followed by delimiter yet
+        if (
+            not final and self.Buffer[self.Position] not in "\"{["
+            and QuotationStreamParser.Scalar.match(self.Buffer, self.Position).end() == len(self.Buffer)
+        ):
+            return QuotationStreamParser.Incomplete
+
+        # Decode single JSON value starting at current position,
+        # Incomplete is returned if value is not complete yet and next chunk is needed
+        try:
+            value, self.Position = QuotationStreamParser.Decoder.raw_decode(self.Buffer, self.Position)
+        except json.JSONDecodeError:
+            if final:
+                raise ValueError("Quotation response is not valid JSON")
+            return QuotationStreamParser.Incomplete
+
+        return value
+
+    def decodeQuotationEntries(self, final: bool):
+
+        # Entries are the biggest part of the response, so they are decoded in a loop
+        # as long as next entry follows directly, without going through all states of the parser
+        entries = self.Stack[-1]
+        while True:
+            entry = self.decodeValue(final)
+            if entry is QuotationStreamParser.Incomplete:
+                return False
+            self.Count += 1
+            entries[2] = QuotationStreamParser.ExpectComma
+            yield entry
+
+            # Anything else than the next entry is handled by the parser states
+            separator = QuotationStreamParser.EntrySeparator.match(self.Buffer, self.Position)
+            if separator == None:
+                return True
+            self.Position = separator.end()
+            entries[1] += 1
+            entries[2] = QuotationStreamParser.ExpectValue
+
+    def expectCharacter(self, character: str, expected: str) -> None:
+
+        if character != expected:
+            raise ValueError(
+                f"Unexpected character '{character}' in quotation response, expected '{expected}'"
+            )
+
+        return None
+
+    def completeValue(self) -> None:
+
+        # Value of the container is complete, next item separator is expected
+        # if there is no container the whole response was parsed
+        if self.Stack:
+            self.Stack[-1][2] = QuotationStreamParser.ExpectComma
+        else:
+            self.IsFinished = True
+
+        return None
+
+    def closeContainer(self) -> None:
+
+        # Skip closing character and complete container as a value of its parent
+        self.Position += 1
+        self.Stack.pop()
+        self.completeValue()
+
+        return None
+
+    def isTopLevelKey(self, key: str) -> bool:
+        return len(self.Stack) == 1 and self.Stack[0][0] == QuotationStreamParser.ObjectStart and self.Stack[0][1] == key
+
+    def isQuotationEntry(self) -> bool:
+
+        # Entries are items of "series"[0]["price"] array
+        return (
+            len(self.Stack) == 4
+            and self.Stack[0][1] == analizyplAPIresponse_QuotationDetails
+            and self.Stack[1][0] == QuotationStreamParser.ArrayStart
+            and self.Stack[1][1] == 0
+            and self.Stack[2][1] == analizyplAPIresponse_QuotationList
+            and self.Stack[3][0] == QuotationStreamParser.ArrayStart
+        )
@@ -0,0 +1,288 @@
+"""
+.DESCRIPTION
+    Definition file of RefundAnalysis class.
+    Class is batch engine to calculate refund analysis of funds in multiple investments at once.
+    Orders of each fund in each investment are split into payment periods:
+        - start date <- buy date of the order
+        - end date <- buy date of the next order of the same fund or the date of the last fund quotation
+    Nearest prices for start and end dates of all periods of all funds are resolved in a single
+    vectorized as-of lookup. Quotations of all funds are concatenated into one sorted array of keys
+    (fund position * KeyStride + date ordinal), so one binary search finds the price of any fund.
+    If calendar-aligned PriceMatrix of the funds is provided, prices are read out from it directly.
+
+    AnalizyFund.getRefundAnalysis calculates payment periods of a single fund with this class,
+    so results are the same as in investment analysis:
+        - ParticipationUnits <- money / start price, summed up with units of previous periods
+        - timeFrameInDays <- days between start and end date - 1
+        - refund <- (end price / start price - 1) * 100
+        - Refund_% <- weighted average of refunds, weight is timeFrameInDays * ParticipationUnits
+        - RefundPerDay_% <- Refund_% / sum of timeFrameInDays
+        - RefundYearly_% <- RefundPerDay_% * 365
+    Investment analysis is None if price of any period was not found or it cannot be calculated,
+    e.g. for archived investments without loaded funds.
+
+.INITIALIZATION
+    Class construction does not require any parameters, investments are added with .addInvestment()
+    and calculated all at once with .calculate():
+        analysis = RefundAnalysis()
+        analysis.addInvestment("<Investment_name>", <InvestmentDetails>, <FundsQuotations>)
+        results = analysis.calculate()
+    Payment periods with explicit start and end dates can be added with .addPeriods().
+    Optional keywords:
+        - DaysLimit <- max number of days between period date and the nearest quotation
+        - FundsPriceMatrix <- PriceMatrix (e.g. from ListOfFunds.getPriceMatrix) to read out prices from,
+                                it is used only if it was built from the same quotation of each fund
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import numpy as np
+from dateutil.parser import parse
+from dataclasses import dataclass, field
+
+# Custom created variables modules
+from Dependencies.Variables_Metrics import *
+
+# Custom created class modules
+# AnalizyFund is not imported, as it calculates its own refund analysis with this class
+from Dependencies.Class_PriceMatrix import PriceMatrix
+from Dependencies.Class_MetricsRegistry import metrics
+
+
+@dataclass
+class RefundAnalysis:
+
+    # Initialization Variables
+    DaysLimit: int = 7
+    FundsPriceMatrix: PriceMatrix | None = field(default=None, repr=False)
+
+    # Calculated Variables
+    Investments: dict[str, list[int] | None] = field(default_factory=dict, init=False)
+    Segments: list["AnalizyFund"] = field(default_factory=list, init=False)
+    SegmentFundIDs: list[str] = field(default_factory=list, init=False)
+    Funds: dict[str, int] = field(default_factory=dict, init=False)
+    FundsQuotations: list["AnalizyFund"] = field(default_factory=list, init=False)
+    PeriodSegments: list[int] = field(default_factory=list, init=False)
+    PeriodPositions: list[int] = field(default_factory=list, init=False)
+    PeriodFunds: list[int] = field(default_factory=list, init=False)
+    StartOrdinals: list[int] = field(default_factory=list, init=False)
+    EndOrdinals: list[int] = field(default_factory=list, init=False)
+    InvestedMoney: list[float] = field(default_factory=list, init=False)
+
+    # Constant Variables
+    KeyStride = 1 << 22
+
+    def addInvestment(
+        self,
+        investmentName: str,
+        investmentDetails: dict[str, list[dict[str, float | str]]],
+        fundsQuotations: dict[str, "AnalizyFund"]
+    ) -> None:
+
+        # Split orders into periods, collected periods are added only if all of them are valid,
+        # otherwise analysis of the investment is None
+        try:
+            periods = [
+                (fund, fundsQuotations[fund], self.getFundPeriods(investmentDetails[fund], fundsQuotations[fund]))
+                for fund in investmentDetails
+            ]
+        except Exception:
+            self.Investments[investmentName] = None
+            return None
+
+        self.addPeriods(investmentName, periods)
+
+        return None
+
+    def addPeriods(
+        self,
+        investmentName: str,
+        periods: list[tuple[str, "AnalizyFund", list[tuple[int, int, float]]]]
+    ) -> None:
+
+        # Each fund of the investment is a separate segment of periods
+        segments = []
+        for fund, fundQuotation, fundPeriods in periods:
+            segment = len(self.Segments)
+            segments.append(segment)
+            self.Segments.append(fundQuotation)
+            self.SegmentFundIDs.append(fund)
+
+            # Quotation of each fund is added to the lookup only once, even if fund is in many investments
+            fundPosition = self.Funds.setdefault(fund, len(self.Funds))
+            if fundPosition == len(self.FundsQuotations):
+                self.FundsQuotations.append(fundQuotation)
+
+            for position, (startOrdinal, endOrdinal, money) in enumerate(fundPeriods):
+                self.PeriodSegments.append(segment)
+                self.PeriodPositions.append(position)
+                self.PeriodFunds.append(fundPosition)
+                self.StartOrdinals.append(startOrdinal)
+                self.EndOrdinals.append(endOrdinal)
+                self.InvestedMoney.append(money)
+
+        self.Investments[investmentName] = segments
+
+        return None
+
+    def getFundPeriods(
+        self,
+        orders: list[dict[str, float | str]],
+        fund: "AnalizyFund"
+    ) -> list[tuple[int, int, float]]:
+
+        # Period starts at buy date and ends at the buy date of the next order,
+        # the last period ends at the date of the last fund quotation
+        buyDates = [parse(order["BuyDate"]).date().toordinal() for order in orders]
+        endDates = buyDates[1:] + [fund.getLastQuotationDate().toordinal()]
+
+        return [
+            (startOrdinal, endOrdinal, float(order["Money"]))
+            for startOrdinal, endOrdinal, order in zip(buyDates, endDates, orders)
+        ]
+
+    def isPriceMatrixValid(self) -> bool:
+
+        # Matrix can be used if each fund is placed in it with the same quotation
+        # and it contains prices of the first period
+        return self.FundsPriceMatrix != None and self.FundsPriceMatrix.covers(min(self.StartOrdinals)) and all(
+            self.FundsPriceMatrix.Quotations.get(fund) is self.FundsQuotations[position].getQuotationIndex()
+            for fund, position in self.Funds.items()
+        )
+
+    def getNearestPrices(self, fundPositions: np.ndarray, ordinals: np.ndarray) -> np.ndarray:
+
+        if metrics.Enabled:
+            metrics.increment(metricFundPriceLookups, len(ordinals), type="nearest")
+
+        # Read out prices from the columns of price matrix, if it was provided for the same quotations
+        if self.isPriceMatrixValid():
+            columns = np.asarray(
+                [self.FundsPriceMatrix.getColumn(fund) for fund in self.Funds],
+                dtype=np.int64
+            )
+            return self.FundsPriceMatrix.getNearestPrices(columns[fundPositions], ordinals, self.DaysLimit)[0]
+
+        # Otherwise concatenate quotations of all funds, keys are sorted as funds are placed one after another
+        quotationKeys = np.concatenate(
+            [
+                np.asarray(fund.getQuotationIndex().Ordinals, dtype=np.int64) + position * RefundAnalysis.KeyStride
+                for position, fund in enumerate(self.FundsQuotations)
+            ]
+        )
+        quotationPrices = np.concatenate(
+            [
+                np.asarray(fund.getQuotationIndex().Prices, dtype=np.float64)
+                for fund in self.FundsQuotations
+            ]
+        )
+
+        # No date has price if none of the funds has any quotation
+        if not len(quotationKeys):
+            return np.full(len(ordinals), np.nan)
+
+        # Find position of the last quotation on or before each date,
+        # quotation of other fund is always older than days limit, as keys of funds are KeyStride apart
+        keys = fundPositions * RefundAnalysis.KeyStride + ordinals
+        positions = np.searchsorted(quotationKeys, keys, side="right") - 1
+        isQuoted = positions >= 0
+        positions = np.clip(positions, 0, None)
+        isPriced = isQuoted & (keys - quotationKeys[positions] <= self.DaysLimit)
+
+        # return prices with NaN for dates without valid price
+        return np.where(isPriced, quotationPrices[positions], np.nan)
+
+    def calculate(self) -> dict[str, dict[str, dict[str, float | str]] | None]:
+
+        # Nothing to look up if there are no valid periods
+        if not self.PeriodSegments:
+            return {
+                investmentName: None if segments == None else {}
+                for investmentName, segments in self.Investments.items()
+            }
+
+        # Convert collected periods to arrays
+        segments = np.asarray(self.PeriodSegments, dtype=np.int64)
+        periodPositions = np.asarray(self.PeriodPositions, dtype=np.int64)
+        fundPositions = np.asarray(self.PeriodFunds, dtype=np.int64)
+        startOrdinals = np.asarray(self.StartOrdinals, dtype=np.int64)
+        endOrdinals = np.asarray(self.EndOrdinals, dtype=np.int64)
+        investedMoney = np.asarray(self.InvestedMoney, dtype=np.float64)
+        segmentsCount = len(self.Segments)
+
+        # Resolve start and end prices of all periods in one lookup
+        prices = self.getNearestPrices(
+            np.concatenate((fundPositions, fundPositions)),
+            np.concatenate((startOrdinals, endOrdinals))
+        )
+        startPrices = prices[:len(segments)]
+        endPrices = prices[len(segments):]
+
+        # Period without valid price (or with zero start price) makes whole fund analysis invalid
+        isInvalidPeriod = ~np.isfinite(startPrices) | ~np.isfinite(endPrices) | (startPrices == 0)
+        startPrices = np.where(isInvalidPeriod, 1.0, startPrices)
+        endPrices = np.where(isInvalidPeriod, 1.0, endPrices)
+
+        # calculate participation units bought in each period
+        # and add units already owned, one period position at a time to sum them up in order
+        participationUnits = investedMoney / startPrices
+        for position in range(1, int(periodPositions.max()) + 1):
+            current = np.flatnonzero(periodPositions == position)
+            participationUnits[current] += participationUnits[current - 1]
+
+        # calculate the duration for current amount of money
+        # -1, because money can produce first profit the day after the buy date
+        timeFrameInDays = (endOrdinals - startOrdinals - 1).astype(np.float64)
+
+        # calculate the refund
+        # -1 to get the profit or loss only
+        # multiply by 100 to convert it to the %
+        refund = ((endPrices / startPrices) - 1) * 100
+
+        # Sum up periods of each fund, values are added in order of periods
+        numOfDays = np.bincount(segments, weights=timeFrameInDays, minlength=segmentsCount)
+        weightedRefund = np.bincount(
+            segments,
+            weights=timeFrameInDays * refund * participationUnits,
+            minlength=segmentsCount
+        )
+        weights = np.bincount(
+            segments,
+            weights=timeFrameInDays * participationUnits,
+            minlength=segmentsCount
+        )
+        isInvalidSegment = (
+            (np.bincount(segments, weights=isInvalidPeriod, minlength=segmentsCount) > 0) |
+            (weights == 0) | (numOfDays == 0)
+        )
+
+        # calculate weighted average for each fund, refund per day and yearly refund
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fundRefund = weightedRefund / weights
+            fundRefundPerDay = fundRefund / numOfDays
+        fundRefundYearly = fundRefundPerDay * 365
+
+        # return analysis of each investment in the same structure as AnalizyFund.getRefundAnalysis
+        return {
+            investmentName: None if segmentsOfInvestment == None or isInvalidSegment[segmentsOfInvestment].any() else {
+                self.SegmentFundIDs[segment]: {
+                    "FundName": self.Segments[segment].Name,
+                    "FundID": self.Segments[segment].ID,
+                    "Refund_%": float(fundRefund[segment]),
+                    "RefundPerDay_%": float(fundRefundPerDay[segment]),
+                    "RefundYearly_%": float(fundRefundYearly[segment])
+                }
+                for segment in segmentsOfInvestment
+            }
+            for investmentName, segmentsOfInvestment in self.Investments.items()
+        }
@@ -0,0 +1,171 @@
+"""
+.DESCRIPTION
+    Definition file of SharedPriceMatrix class.
+    Class places arrays of PriceMatrix in shared memory blocks, so they can be read out by
+    other processes without copying them:
+        - Prices <- shared memory block with forward-filled prices
+        - QuotedOrdinals <- shared memory block with date ordinals of used quotations
+    Handle (names of memory blocks, shape, fund columns and first ordinal) is a small dict,
+    which is passed to other process instead of the matrix itself.
+    Matrix read out from shared memory is read-only.
+    Memory blocks are removed only by the owner. Other processes do not track attached blocks
+    in resource tracker (track=False from Python 3.13, unregistered after attaching in older versions),
+    so blocks are not removed when process attached to them ends. Attached processes can share resource tracker
+    with the owner, so the owner registers blocks again before it removes them.
+
+.INITIALIZATION
+    Owner process copies the matrix to shared memory with .create(), other processes attach to it
+    with .attach() using handle from .getHandle(). Memory blocks are closed with .close(),
+    the owner removes them as well. Class can be used as context manager, which closes it on exit:
+        with SharedPriceMatrix.create(<PriceMatrix>) as sharedMatrix:
+            handle = sharedMatrix.getHandle()
+        ...
+        with SharedPriceMatrix.attach(handle) as sharedMatrix:
+            priceMatrix = sharedMatrix.getPriceMatrix()
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-17      Stanisław Horna         Attached memory blocks are not tracked by resource tracker of other processes.
+
+"""
+# Official and 3-rd party imports
+import os
+import sys
+import numpy as np
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from dataclasses import dataclass, field
+
+# Custom created class modules
+from Dependencies.Class_PriceMatrix import PriceMatrix
+
+
+@dataclass
+class SharedPriceMatrix:
+
+    # Initialization Variables
+    Handle: dict[str, any]
+    IsOwner: bool = False
+
+    # Calculated Variables
+    PricesMemory: SharedMemory = field(init=False, repr=False)
+    QuotedOrdinalsMemory: SharedMemory = field(init=False, repr=False)
+    FundsPriceMatrix: PriceMatrix | None = field(default=None, init=False, repr=False)
+
+    # Constant Variables
+    PriceType = np.float64
+    OrdinalType = np.int64
+    IsTracked = os.name == "posix"
+    IsTrackOptional = sys.version_info >= (3, 13)
+
+    def __post_init__(self):
+
+        # Attach to memory blocks created by the owner
+        self.PricesMemory = self.openMemory(self.Handle["PricesName"])
+        self.QuotedOrdinalsMemory = self.openMemory(self.Handle["QuotedOrdinalsName"])
+
+        # Create matrix with arrays placed directly in shared memory blocks
+        shape = tuple(self.Handle["Shape"])
+        prices = np.ndarray(shape, dtype=SharedPriceMatrix.PriceType, buffer=self.PricesMemory.buf)
+        quotedOrdinals = np.ndarray(shape, dtype=SharedPriceMatrix.OrdinalType, buffer=self.QuotedOrdinalsMemory.buf)
+
+        # Other processes can only read out the matrix
+        if not self.IsOwner:
+            prices.flags.writeable = False
+            quotedOrdinals.flags.writeable = False
+
+        self.FundsPriceMatrix = PriceMatrix.fromArrays(
+            self.Handle["FundIDs"],
+            self.Handle["FirstOrdinal"],
+            prices,
+            quotedOrdinals
+        )
+
+        return None
+
+    def openMemory(self, name: str) -> SharedMemory:
+
+        # Owner keeps memory blocks tracked, so they are removed even if it ends without closing them
+        if self.IsOwner or not SharedPriceMatrix.IsTracked:
+            return SharedMemory(name=name)
+
+        # Other processes do not track attached blocks, otherwise their resource tracker
+        # would remove them when the process ends, while they are still used by the owner
+        if SharedPriceMatrix.IsTrackOptional:
+            return SharedMemory(name=name, track=False)
+        memory = SharedMemory(name=name)
+        resource_tracker.unregister(memory._name, "shared_memory")
+
+        return memory
+
+    @classmethod
+    def create(cls, priceMatrix: PriceMatrix) -> "SharedPriceMatrix":
+
+        # Create memory blocks big enough for both arrays, empty block is not allowed
+        pricesMemory = SharedMemory(create=True, size=max(1, priceMatrix.Prices.nbytes))
+        quotedOrdinalsMemory = SharedMemory(create=True, size=max(1, priceMatrix.QuotedOrdinals.nbytes))
+
+        # Copy arrays of the matrix to memory blocks
+        shape = priceMatrix.Prices.shape
+        np.ndarray(shape, dtype=SharedPriceMatrix.PriceType, buffer=pricesMemory.buf)[:] = priceMatrix.Prices
+        np.ndarray(shape, dtype=SharedPriceMatrix.OrdinalType, buffer=quotedOrdinalsMemory.buf)[:] = (
+            priceMatrix.QuotedOrdinals
+        )
+
+        # Owner attaches to created blocks in the same way as other processes
+        sharedMatrix = cls(
+            {
+                "PricesName": pricesMemory.name,
+                "QuotedOrdinalsName": quotedOrdinalsMemory.name,
+                "Shape": list(shape),
+                "FundIDs": priceMatrix.getFundIDs(),
+                "FirstOrdinal": priceMatrix.FirstOrdinal
+            },
+            IsOwner=True
+        )
+        pricesMemory.close()
+        quotedOrdinalsMemory.close()
+
+        return sharedMatrix
+
+    @classmethod
+    def attach(cls, handle: dict[str, any]) -> "SharedPriceMatrix":
+        return cls(handle)
+
+    def getHandle(self) -> dict[str, any]:
+        return self.Handle
+
+    def getPriceMatrix(self) -> PriceMatrix:
+        return self.FundsPriceMatrix
+
+    def close(self) -> None:
+
+        # Arrays have to be released before memory blocks are closed
+        self.FundsPriceMatrix = None
+        self.PricesMemory.close()
+        self.QuotedOrdinalsMemory.close()
+
+        # Owner removes memory blocks, when they are not needed anymore,
+        # blocks are registered again as attached processes can unregister them from shared resource tracker
+        if self.IsOwner:
+            for memory in [self.PricesMemory, self.QuotedOrdinalsMemory]:
+                if SharedPriceMatrix.IsTracked and not SharedPriceMatrix.IsTrackOptional:
+                    resource_tracker.register(memory._name, "shared_memory")
+                memory.unlink()
+
+        return None
+
+    def __enter__(self) -> "SharedPriceMatrix":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+        return None
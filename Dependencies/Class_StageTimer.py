@@ -0,0 +1,206 @@
+"""
+.DESCRIPTION
+    Definition file of StageTimer class.
+    Class is data structure to measure and collect resources used by subsequent stages of the program:
+        - WallSeconds <- elapsed real time of the stage
+        - CPUSeconds <- CPU time of the process spent during the stage
+        - PeakMemoryBytes <- peak of memory allocated by Python during the stage,
+            measured only if memory tracing is enabled (None otherwise), as tracing slows down the program
+    Each measured stage can be described with additional labels, e.g. fund ID or investment name.
+
+    Stage is measured with context manager, which returns dict with measurement,
+    so labels known at the end of the stage can be added to it:
+        with timer.measure("DayByDay", Investment="<Investment_name>") as measurement:
+            ...
+    Measurements of the same stage cannot be nested if memory is traced,
+    as peak memory is reset at the beginning of each stage.
+
+    Smaller parts of the stage (items), e.g. single web request or single investment,
+    are measured with .measureItem() only with elapsed time and CPU time of the current thread,
+    so they can be nested in stages and measured concurrently in multiple threads.
+
+    Each stage can be additionally profiled with cProfile (only the thread which invoked the stage),
+    profile of the slowest stage can be saved to pstats file.
+
+.INITIALIZATION
+    Optional keywords:
+        - Enabled <- False to skip all measurements, disabledStageTimer can be used as default one
+        - TraceMemory <- True to measure peak memory allocated during each stage
+        - ProfileStages <- True to profile each stage with cProfile
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-17      Stanisław Horna         Items measured separately from stages, optional cProfile of each stage.
+
+"""
+# Official and 3-rd party imports
+import json
+import time
+import cProfile
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+
+@dataclass
+class StageTimer:
+
+    # Initialization Variables
+    Enabled: bool = True
+    TraceMemory: bool = False
+    ProfileStages: bool = False
+
+    # Calculated Variables
+    Stages: list[dict[str, str | float | int | None]] = field(default_factory=list, init=False)
+    Items: list[dict[str, str | float | int | None]] = field(default_factory=list, init=False)
+    Profiles: dict[int, cProfile.Profile] = field(default_factory=dict, init=False)
+
+    def __post_init__(self):
+
+        # Start memory tracing only if it was requested and it is not already started
+        if self.Enabled and self.TraceMemory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        return None
+
+    @contextmanager
+    def measure(self, stage: str, **labels: str):
+
+        # Init measurement with provided labels, it is returned to the caller to add more labels
+        measurement = {"Stage": stage, **labels}
+
+        # Nothing to measure if timer is disabled
+        if not self.Enabled:
+            yield measurement
+            return None
+
+        # Reset peak memory to measure only allocations done during this stage
+        if self.TraceMemory:
+            tracemalloc.reset_peak()
+            startMemory = tracemalloc.get_traced_memory()[0]
+
+        # Start profiler dedicated for this stage
+        if self.ProfileStages:
+            profile = cProfile.Profile()
+            profile.enable()
+
+        # Remember start time of the stage
+        startWall = time.perf_counter()
+        startCPU = time.process_time()
+
+        try:
+            yield measurement
+        finally:
+
+            # Collect stage measurements
+            measurement["WallSeconds"] = time.perf_counter() - startWall
+            measurement["CPUSeconds"] = time.process_time() - startCPU
+            measurement["PeakMemoryBytes"] = (
+                tracemalloc.get_traced_memory()[1] - startMemory
+                if self.TraceMemory else None
+            )
+
+            # Stop profiler and keep it under the index of the stage
+            if self.ProfileStages:
+                profile.disable()
+                self.Profiles[len(self.Stages)] = profile
+
+            self.Stages.append(measurement)
+
+        return None
+
+    @contextmanager
+    def measureItem(self, stage: str, **labels: str):
+
+        # Init measurement with provided labels, it is returned to the caller to add more labels
+        measurement = {"Stage": stage, **labels}
+
+        # Nothing to measure if timer is disabled
+        if not self.Enabled:
+            yield measurement
+            return None
+
+        # Remember start time of the item, CPU time is measured only for current thread,
+        # as items can be measured concurrently
+        startWall = time.perf_counter()
+        startCPU = time.thread_time()
+
+        try:
+            yield measurement
+        finally:
+
+            # Collect item measurements, appending to the list is thread safe
+            measurement["WallSeconds"] = time.perf_counter() - startWall
+            measurement["CPUSeconds"] = time.thread_time() - startCPU
+            self.Items.append(measurement)
+
+        return None
+
+    def stop(self) -> None:
+
+        # Stop memory tracing started by this instance
+        if self.TraceMemory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+        return None
+
+    def isEnabled(self) -> bool:
+        return self.Enabled
+
+    def getStages(self) -> list[dict[str, str | float | int | None]]:
+        return self.Stages
+
+    def getItems(self) -> list[dict[str, str | float | int | None]]:
+        return self.Items
+
+    def getSlowestStage(self) -> dict[str, str | float | int | None] | None:
+
+        # return stage with the longest elapsed time, None if nothing was measured
+        if not self.Stages:
+            return None
+        return max(self.Stages, key=lambda item: item["WallSeconds"])
+
+    def saveJSON(self, destinationFilePath: str, details: dict[str, any] | None = None) -> None:
+
+        # Open destination file and write measured stages with provided details dumped to JSON structure
+        with open(destinationFilePath, "w") as destinationFileJSON:
+            destinationFileJSON.write(
+                json.dumps(
+                    {
+                        **(details or {}),
+                        "Stages": self.Stages,
+                        "Items": self.Items
+                    },
+                    indent=4
+                )
+            )
+
+        return None
+
+    def saveSlowestStageProfile(self, destinationFilePath: str) -> str | None:
+
+        # Nothing to save if stages were not profiled
+        if not self.Profiles:
+            return None
+
+        # Find index of the slowest profiled stage and save its profile in pstats format
+        slowestStageIndex = max(
+            self.Profiles,
+            key=lambda index: self.Stages[index]["WallSeconds"]
+        )
+        self.Profiles[slowestStageIndex].dump_stats(destinationFilePath)
+
+        # return name of the saved stage
+        return self.Stages[slowestStageIndex]["Stage"]
+
+
+# Timer used by default, when measurements were not requested
+disabledStageTimer = StageTimer(Enabled=False)
@@ -0,0 +1,297 @@
+"""
+.DESCRIPTION
+    Definition file of WalletEvaluation class.
+    Class is batch engine to calculate DayByDay results of multiple investments at once.
+    Order books of all investments are stacked into one matrix:
+        - rows <- each fund of each investment (segment), in the same order as funds in investment
+        - columns <- each calendar day of date axis shared by all investments,
+            from the first date to calculate of any investment until the last one
+    Participation units and invested money are placed on the shared axis and summed up cumulatively
+    for all segments at once, prices of each fund are read out from PriceMatrix for the whole axis.
+    Then the axis is swept once to calculate for each investment and each day:
+        - Value <- sum of units * price of each fund
+        - Invested Money <- sum of money invested in each fund
+        - <Fund_ID> Refund <- rounded fund value / invested money - 1
+    Rows are included with the same rules as in NumPy engine of Investment class
+    (any fund has exact quotation and all funds have price within days limit), values are summed up
+    in the same order and rounded with numpy, so results are the same as with NumPy engine.
+    Half cents can be rounded in different direction than with built-in round used by day after day engine,
+    values can differ by 0.01 (0.0001 of refund) and invested money by floating point summation error.
+
+.INITIALIZATION
+    Class construction requires PriceMatrix with all funds of added investments.
+    Investments (created with "Batch" DayByDayEngine) are added with .addInvestment()
+    and calculated all at once with .calculate():
+        evaluation = WalletEvaluation(FundsPriceMatrix=<PriceMatrix>)
+        evaluation.addInvestment(<Investment>)
+        for name, table in evaluation.calculate().items(): ...
+    Optional keywords:
+        - DaysLimit <- max number of days between processed date and the nearest quotation
+
+    Investments can be split into parts with similar number of calculated cells with .split(),
+    each part can be calculated in separate process with .calculateShared(), which reads out
+    the price matrix from shared memory (SharedPriceMatrix) instead of receiving it with the part.
+    Investment data is kept without fund objects, so the part can be sent to other process.
+
+.NOTES
+
+    Version:            1.1
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+    2026-10-17      Stanisław Horna         Investments kept without fund objects, only dates with orders are kept.
+                                            Investments can be split into parts calculated in separate processes
+                                            with price matrix read out from shared memory.
+                                            Values rounded with numpy and summed up without compensation,
+                                            the same as in NumPy engine.
+
+"""
+# Official and 3-rd party imports
+import numpy as np
+from dataclasses import dataclass, field
+
+# Custom created class modules
+from Dependencies.Class_Investment import Investment
+from Dependencies.Class_DayByDayTable import DayByDayTable
+from Dependencies.Class_PriceMatrix import PriceMatrix
+from Dependencies.Class_SharedPriceMatrix import SharedPriceMatrix
+
+
+@dataclass
+class WalletEvaluation:
+
+    # Initialization Variables
+    FundsPriceMatrix: PriceMatrix | None = field(repr=False)
+    DaysLimit: int = 7
+
+    # Calculated Variables
+    Investments: dict[str, int | None] = field(default_factory=dict, init=False)
+    WalletNames: list[str] = field(default_factory=list, init=False)
+    FirstOrdinals: list[int] = field(default_factory=list, init=False)
+    LastOrdinals: list[int] = field(default_factory=list, init=False)
+    WalletFunds: list[dict[str, str]] = field(default_factory=list, init=False)
+    WalletOrders: list[list[tuple[np.ndarray, np.ndarray, np.ndarray]]] = field(
+        default_factory=list, init=False, repr=False
+    )
+
+    def addInvestment(self, investment: Investment) -> None:
+
+        # get orders and date axis of the investment, from the first date which was not resumed
+        fundsOperationsByDate = investment.initFundsOperationsByDate()
+        dateAxis = investment.getDateAxis(fundsOperationsByDate, investment.getPendingFirstDate())
+
+        # Nothing to calculate if investment ended before first fund was bought
+        # or there are no new days after resumed results
+        if len(dateAxis) == 0:
+            self.Investments[investment.InvestmentName] = None
+            return None
+
+        # Each fund of the investment is a separate segment, only dates with bought units or money are kept
+        orders = []
+        for fund in investment.InvestmentDetails:
+            units, money = investment.getFundOrderDeltasOnAxis(fund, dateAxis, fundsOperationsByDate)
+            positions = np.flatnonzero((units != 0) | (money != 0))
+            orders.append((positions, units[positions], money[positions]))
+
+        self.appendWallet(
+            investment.InvestmentName,
+            int(dateAxis[0]),
+            int(dateAxis[-1]),
+            {fund: investment.FundsQuotations[fund].getCurrency() for fund in investment.InvestmentDetails},
+            orders
+        )
+
+        return None
+
+    def appendWallet(
+        self,
+        investmentName: str,
+        firstOrdinal: int,
+        lastOrdinal: int,
+        fundsCurrency: dict[str, str],
+        orders: list[tuple[np.ndarray, np.ndarray, np.ndarray]]
+    ) -> None:
+
+        # Add investment with its date range, funds and orders of each fund
+        self.Investments[investmentName] = len(self.WalletNames)
+        self.WalletNames.append(investmentName)
+        self.FirstOrdinals.append(firstOrdinal)
+        self.LastOrdinals.append(lastOrdinal)
+        self.WalletFunds.append(fundsCurrency)
+        self.WalletOrders.append(orders)
+
+        return None
+
+    def split(self, count: int) -> list["WalletEvaluation"]:
+
+        # Init parts with the same price matrix, investments without days to calculate are kept by the first one
+        parts = [WalletEvaluation(self.FundsPriceMatrix, DaysLimit=self.DaysLimit) for _ in range(count)]
+        cells = [0] * count
+        for investmentName, wallet in self.Investments.items():
+            if wallet == None:
+                parts[0].Investments[investmentName] = None
+
+        # Assign investments to the part with the lowest number of calculated cells (funds * days),
+        # starting from the biggest investments
+        for wallet in sorted(
+            range(len(self.WalletNames)),
+            key=lambda wallet: -len(self.WalletFunds[wallet]) * (self.LastOrdinals[wallet] - self.FirstOrdinals[wallet] + 1)
+        ):
+            part = cells.index(min(cells))
+            parts[part].appendWallet(
+                self.WalletNames[wallet],
+                self.FirstOrdinals[wallet],
+                self.LastOrdinals[wallet],
+                self.WalletFunds[wallet],
+                self.WalletOrders[wallet]
+            )
+            cells[part] += len(self.WalletFunds[wallet]) * (self.LastOrdinals[wallet] - self.FirstOrdinals[wallet] + 1)
+
+        # return only parts with any investment
+        return [part for part in parts if part.Investments]
+
+    def getWalletsCount(self) -> int:
+        return len(self.WalletNames)
+
+    def __getstate__(self) -> dict[str, any]:
+
+        # Price matrix is not sent to other processes, they read it out from shared memory
+        state = dict(self.__dict__)
+        state["FundsPriceMatrix"] = None
+        return state
+
+    @staticmethod
+    def calculateShared(
+        evaluation: "WalletEvaluation",
+        handle: dict[str, any]
+    ) -> dict[str, DayByDayTable | None]:
+
+        # Calculate investments with price matrix read out from shared memory created by other process,
+        # matrix has to be released before shared memory is closed
+        with SharedPriceMatrix.attach(handle) as sharedMatrix:
+            evaluation.FundsPriceMatrix = sharedMatrix.getPriceMatrix()
+            try:
+                return evaluation.calculate()
+            finally:
+                evaluation.FundsPriceMatrix = None
+
+    def calculate(self) -> dict[str, DayByDayTable | None]:
+
+        # Nothing to calculate if there are no investments with days to calculate
+        if not self.WalletNames:
+            return {investmentName: None for investmentName in self.Investments}
+
+        # Init date axis shared by all investments and range of dates of each investment on it
+        firstOrdinals = np.asarray(self.FirstOrdinals, dtype=np.int64)
+        lastOrdinals = np.asarray(self.LastOrdinals, dtype=np.int64)
+        dateAxis = np.arange(firstOrdinals.min(), lastOrdinals.max() + 1, dtype=np.int64)
+        isInRange = (dateAxis >= firstOrdinals[:, None]) & (dateAxis <= lastOrdinals[:, None])
+
+        # Each fund of each investment is a segment, placed in the same order as funds in investment
+        segmentWallets = np.asarray(
+            [wallet for wallet, funds in enumerate(self.WalletFunds) for fund in funds],
+            dtype=np.int64
+        )
+        segmentPositions = np.asarray(
+            [position for funds in self.WalletFunds for position in range(len(funds))],
+            dtype=np.int64
+        )
+        segmentFundIDs = [fund for funds in self.WalletFunds for fund in funds]
+        walletSegments = np.concatenate(([0], np.cumsum([len(funds) for funds in self.WalletFunds]))).tolist()
+
+        # Stack order books of all segments on the shared axis and sum them up cumulatively at once,
+        # dates before the range of investment stay zero, so they do not change the cumulative sums
+        units = np.zeros((len(segmentWallets), len(dateAxis)))
+        money = np.zeros((len(segmentWallets), len(dateAxis)))
+        for wallet, orders in enumerate(self.WalletOrders):
+            start = self.FirstOrdinals[wallet] - int(dateAxis[0])
+            for segment, (positions, fundUnits, fundMoney) in enumerate(orders, walletSegments[wallet]):
+                units[segment, start + positions] = fundUnits
+                money[segment, start + positions] = fundMoney
+        np.cumsum(units, axis=1, out=units)
+        np.cumsum(money, axis=1, out=money)
+
+        # Read out prices of each fund once for the whole axis and assign them to segments
+        fundColumns, segmentFunds = np.unique(
+            np.asarray(
+                [self.FundsPriceMatrix.getColumn(fund) for fund in segmentFundIDs],
+                dtype=np.int64
+            ),
+            return_inverse=True
+        )
+        fundPrices, fundIsExact = self.FundsPriceMatrix.getNearestPrices(
+            fundColumns[:, None], dateAxis[None, :], self.DaysLimit
+        )
+        prices = fundPrices[segmentFunds]
+        isExact = fundIsExact[segmentFunds]
+        values = units * prices
+
+        # Sweep the axis once for all investments, funds are added one position at a time
+        # to sum them up in the same order as funds in investment
+        value = np.zeros(isInRange.shape)
+        investedMoney = np.zeros(isInRange.shape)
+        isAnyExact = np.zeros(isInRange.shape, dtype=bool)
+        isAllPriced = np.ones(isInRange.shape, dtype=bool)
+        for position in range(int(segmentPositions.max()) + 1):
+            segments = np.flatnonzero(segmentPositions == position)
+            wallets = segmentWallets[segments]
+
+            isAnyExact[wallets] |= isExact[segments]
+            isAllPriced[wallets] &= ~np.isnan(prices[segments])
+            value[wallets] += values[segments]
+            investedMoney[wallets] += money[segments]
+
+        # Dates are included only if any fund has quotation established for that day
+        # and all funds have price found within days limit
+        isIncluded = isInRange & isAnyExact & isAllPriced
+        isSegmentIncluded = isIncluded[segmentWallets]
+
+        # Round values of all investments at once with numpy, included values are placed
+        # investment after investment (segment after segment) in date order
+        walletValue = np.round(value[isIncluded], 2)
+        walletInvestedMoney = investedMoney[isIncluded]
+        walletDates = np.broadcast_to(dateAxis, isIncluded.shape)[isIncluded].tolist()
+        segmentUnits = units[isSegmentIncluded]
+        segmentMoney = money[isSegmentIncluded]
+        segmentValue = np.round(values[isSegmentIncluded], 2)
+
+        # Refund is 0 if there is no money invested in the fund yet
+        with np.errstate(divide="ignore", invalid="ignore"):
+            segmentRefund = np.round(np.where(segmentMoney != 0, (segmentValue / segmentMoney) - 1, 0.0), 4)
+        segmentMoney = np.round(segmentMoney, 2)
+
+        # get position of the first included value of each investment and each segment
+        walletOffsets = np.concatenate(([0], np.cumsum(isIncluded.sum(axis=1)))).tolist()
+        segmentOffsets = np.concatenate(([0], np.cumsum(isSegmentIncluded.sum(axis=1)))).tolist()
+
+        # Split calculated values into DayByDay table of each investment
+        results = {}
+        for investmentName, wallet in self.Investments.items():
+            if wallet == None:
+                results[investmentName] = None
+                continue
+
+            fundsSegments = {
+                fund: slice(segmentOffsets[segment], segmentOffsets[segment + 1])
+                for segment, fund in enumerate(self.WalletFunds[wallet], walletSegments[wallet])
+            }
+            rows = slice(walletOffsets[wallet], walletOffsets[wallet + 1])
+
+            results[investmentName] = DayByDayTable.fromColumns(
+                walletDates[rows],
+                Investment.buildDayByDayColumns(
+                    self.WalletFunds[wallet],
+                    value=walletValue[rows],
+                    investedMoney=walletInvestedMoney[rows],
+                    fundsUnits={fund: segmentUnits[segmentRows] for fund, segmentRows in fundsSegments.items()},
+                    fundsValue={fund: segmentValue[segmentRows] for fund, segmentRows in fundsSegments.items()},
+                    fundsMoney={fund: segmentMoney[segmentRows] for fund, segmentRows in fundsSegments.items()},
+                    fundsRefund={fund: segmentRefund[segmentRows] for fund, segmentRows in fundsSegments.items()}
+                )
+            )
+
+        return results
@@ -0,0 +1,162 @@
+"""
+.DESCRIPTION
+    generateSyntheticFundURL
+        Function to create URL in the same format as www.analizy.pl fund page for synthetic fund ID.
+
+    generateSyntheticQuotation
+        Function to generate fund quotation in the same structure as AnalizyFund.getQuotationJSON(),
+        prices are random walk established on working days until today, with random missing days.
+
+    generateSyntheticInvestments
+        Function to generate investments definition in the same structure as Investments.json,
+        each fund order is placed on the date when fund has quotation established.
+
+    generateSyntheticLookups
+        Function to generate random price lookups (fund ID and date) within quotation range of each fund.
+
+    All functions are deterministic for provided seed, so generated data can be compared between runs.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import random
+import datetime
+
+# Custom created variables modules
+from Dependencies.Variables_API import *
+
+
+# Function to create URL in the same format as www.analizy.pl fund page for synthetic fund ID
+def generateSyntheticFundURL(fundID: str) -> str:
+    return f"https://www.analizy.pl/fundusze-inwestycyjne-otwarte/{fundID}/synthetic-fund-{fundID.lower()}"
+
+
+# Function to generate fund quotation in the same structure as AnalizyFund.getQuotationJSON()
+def generateSyntheticQuotation(
+    fundID: str,
+    years: int,
+    seed: int,
+    currency: str = "PLN",
+    missingDayRatio: float = 0.02
+) -> dict[str, str | list[dict[str, str | float]]]:
+
+    # Init random generator dedicated for the fund, so each fund has different and repeatable prices
+    generator = random.Random(f"{seed}_{fundID}")
+
+    # Init local variables, quotation ends today to have results for each day of investment
+    prices = []
+    price = generator.uniform(10, 500)
+    currentDate = datetime.date.today() - datetime.timedelta(days=365 * years)
+
+    # Loop through each day until today
+    while currentDate <= datetime.date.today():
+
+        # Quotations are established only on working days,
+        # some of them are missing to simulate bank holidays and delayed quotations
+        if currentDate.weekday() < 5 and generator.random() >= missingDayRatio:
+
+            # Change price by random percentage, price is rounded the same as in API response
+            price = max(0.01, price * (1 + generator.gauss(0.0002, 0.01)))
+            prices.append(
+                {
+                    analizyplAPIresponse_QuotationDate: currentDate.strftime("%Y-%m-%d"),
+                    analizyplAPIresponse_QuotationValue: round(price, 2)
+                }
+            )
+
+        # Increment date with +1 day
+        currentDate += datetime.timedelta(days=1)
+
+    # return quotation in the same structure as AnalizyFund.getQuotationJSON()
+    return {
+        "FundID": fundID,
+        "Currency": currency,
+        "Price": prices
+    }
+
+
+# Function to generate investments definition in the same structure as Investments.json
+def generateSyntheticInvestments(
+    quotations: dict[str, dict[str, str | list[dict[str, str | float]]]],
+    investmentsCount: int,
+    fundsPerInvestment: int,
+    ordersPerFund: int,
+    seed: int
+) -> dict[str, dict[str, str | dict[str, list[dict[str, str | float]]]]]:
+
+    # Init random generator and local variable to return
+    generator = random.Random(seed)
+    fundIDs = list(quotations.keys())
+    investments = {}
+
+    # Loop through each investment to create
+    for i in range(0, investmentsCount):
+
+        # Select funds for current investment, it cannot be more than generated funds
+        selectedFunds = generator.sample(fundIDs, min(fundsPerInvestment, len(fundIDs)))
+        funds = {}
+
+        for fund in selectedFunds:
+
+            # Orders are placed on dates when fund has quotation established,
+            # otherwise participation units cannot be calculated
+            quotationDates = [
+                item[analizyplAPIresponse_QuotationDate]
+                for item in quotations[fund]["Price"]
+            ]
+            orderDates = sorted(
+                generator.sample(quotationDates, min(ordersPerFund, len(quotationDates)))
+            )
+
+            funds[fund] = [
+                {
+                    "BuyDate": date,
+                    "Money": generator.randrange(100, 10000, 100)
+                }
+                for date in orderDates
+            ]
+
+        # Investment starts with the first order of any fund
+        investments[f"Synthetic_Investment_{i + 1:04d}"] = {
+            "StartDate": min(order["BuyDate"] for orders in funds.values() for order in orders),
+            "EndDate": "",
+            "Funds": funds
+        }
+
+    # return investments definition
+    return investments
+
+
+# Function to generate random price lookups within quotation range of each fund
+def generateSyntheticLookups(
+    quotations: dict[str, dict[str, str | list[dict[str, str | float]]]],
+    lookupsCount: int,
+    seed: int
+) -> list[tuple[str, datetime.date]]:
+
+    # Init random generator and range of dates for each fund
+    generator = random.Random(seed)
+    fundIDs = list(quotations.keys())
+    dateRanges = {
+        fund: (
+            datetime.date.fromisoformat(quotations[fund]["Price"][0][analizyplAPIresponse_QuotationDate]).toordinal(),
+            datetime.date.fromisoformat(quotations[fund]["Price"][-1][analizyplAPIresponse_QuotationDate]).toordinal()
+        )
+        for fund in fundIDs
+    }
+
+    # return list of random fund and random date within its quotation range
+    return [
+        (fund, datetime.date.fromordinal(generator.randint(*dateRanges[fund])))
+        for fund in (generator.choice(fundIDs) for i in range(0, lookupsCount))
+    ]
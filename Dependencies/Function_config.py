@@ -11,7 +11,7 @@
 
 .NOTES
 
-    Version:            1.1
+    Version:            1.2
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
@@ -20,6 +20,7 @@
 
     Date            Who                     What
     2024-02-21      Stanisław Horna         Not used getConfiguration() input argument deleted.
+    2026-10-17      Stanisław Horna         Folder for optional local quotation store created.
 
 """
 
@@ -49,6 +50,9 @@ def getConfiguration():
     if configuration[InvestmentHistoryDayByDayDirectory]:
         createFolderIfNotExists(configuration[InvestmentHistoryDayByDayDirectory])
 
+    if configuration.get(QuotationStoreDirectoryKey):
+        createFolderIfNotExists(configuration[QuotationStoreDirectoryKey])
+
     return configuration
 
 
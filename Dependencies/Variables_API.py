@@ -4,7 +4,7 @@
 
 .NOTES
 
-    Version:            1.0
+    Version:            1.1
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
@@ -12,6 +12,7 @@
     ChangeLog:
 
     Date            Who                     What
+    2026-10-17      Stanisław Horna         Default timeout for web requests
 
 """
 global analizyplQuotationAPI
@@ -21,6 +22,7 @@ global analizyplAPIresponse_QuotationDetails
 global analizyplAPIresponse_QuotationList
 global analizyplAPIresponse_QuotationDate
 global analizyplAPIresponse_QuotationValue
+global analizyplRequestTimeout
 
 analizyplQuotationAPI = "https://www.analizy.pl/api/quotation"
 analizyplAPIresponse_ID = "id"
@@ -28,4 +30,7 @@ analizyplAPIresponse_Currency = "currency"
 analizyplAPIresponse_QuotationDetails = "series"
 analizyplAPIresponse_QuotationList = "price"
 analizyplAPIresponse_QuotationDate = "date"
-analizyplAPIresponse_QuotationValue = "value"
\ No newline at end of file
+analizyplAPIresponse_QuotationValue = "value"
+
+# time in seconds to wait for the server response for single request
+analizyplRequestTimeout = 30
\ No newline at end of file
@@ -4,7 +4,7 @@
 
 .NOTES
 
-    Version:            1.0
+    Version:            1.1
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
@@ -12,6 +12,13 @@
     ChangeLog:
 
     Date            Who                     What
+    2026-10-17      Stanisław Horna         Optional keys for concurrent downloads and request timeout.
+                                            Optional key for local quotation store directory.
+                                            Optional key for source of latest fund details.
+                                            Optional key for DayByDay calculation engine.
+                                            Optional key for metrics file path.
+                                            Optional key for SQLite database file path
+                                            Optional key for number of DayByDay worker processes
 
 """
 
@@ -24,9 +31,25 @@ global HistoricalQuotationDirectoryNameKey
 global InvestmentsFilePathKey
 global DailyReportDirectoryName
 global InvestmentHistoryDayByDayDirectory
+global DownloadConcurrencyKey
+global RequestTimeoutKey
+global QuotationStoreDirectoryKey
+global LatestDetailsSourceKey
+global DayByDayEngineKey
+global MetricsFilePathKey
+global DatabaseFilePathKey
+global DayByDayProcessesKey
 
 FundsToCheckURLsKey = "FundsToCheckURLs"
 HistoricalQuotationDirectoryNameKey = "HistoricalQuotationDirectoryName"
 InvestmentsFilePathKey = "InvestmentsFilePath"
 DailyReportDirectoryName = "DailyReportDirectoryName"
-InvestmentHistoryDayByDayDirectory = "InvestmentHistoryDayByDayDirectory"
\ No newline at end of file
+InvestmentHistoryDayByDayDirectory = "InvestmentHistoryDayByDayDirectory"
+DownloadConcurrencyKey = "DownloadConcurrency"
+RequestTimeoutKey = "RequestTimeoutSeconds"
+QuotationStoreDirectoryKey = "QuotationStoreDirectory"
+LatestDetailsSourceKey = "LatestDetailsSource"
+DayByDayEngineKey = "DayByDayEngine"
+MetricsFilePathKey = "MetricsFilePath"
+DatabaseFilePathKey = "DatabaseFilePath"
+DayByDayProcessesKey = "DayByDayProcesses"
\ No newline at end of file
@@ -0,0 +1,50 @@
+"""
+.DESCRIPTION
+    File with names, types and descriptions of metrics collected in MetricsRegistry
+    and exported in Prometheus text format
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+global metricFundPriceLookups
+global metricHTTPRequests
+global metricHTTPResponseBytes
+global metricHTTPRequestErrors
+global metricFailedFunds
+global metricQuotationRowsParsed
+global metricDayByDayRows
+global metricStageDuration
+global metricLastRunTimestamp
+global metricsDefinitions
+
+metricFundPriceLookups = "fund_quotations_price_lookups_total"
+metricHTTPRequests = "fund_quotations_http_requests_total"
+metricHTTPResponseBytes = "fund_quotations_http_response_bytes_total"
+metricHTTPRequestErrors = "fund_quotations_http_request_errors_total"
+metricFailedFunds = "fund_quotations_failed_funds_total"
+metricQuotationRowsParsed = "fund_quotations_quotation_rows_parsed_total"
+metricDayByDayRows = "fund_quotations_daybyday_rows_total"
+metricStageDuration = "fund_quotations_stage_duration_seconds"
+metricLastRunTimestamp = "fund_quotations_last_run_timestamp_seconds"
+
+# metric name: (metric type, description)
+metricsDefinitions = {
+    metricFundPriceLookups: ("counter", "Fund price lookups by lookup type (exact date or nearest price)."),
+    metricHTTPRequests: ("counter", "Web requests by host and response status code."),
+    metricHTTPResponseBytes: ("counter", "Size of web responses content in bytes by host."),
+    metricHTTPRequestErrors: ("counter", "Web requests which failed without response by host."),
+    metricFailedFunds: ("counter", "Funds which could not be downloaded."),
+    metricQuotationRowsParsed: ("counter", "Quotation rows parsed by source (API response or local store)."),
+    metricDayByDayRows: ("counter", "DayByDay rows by investment and mode (calculated or resumed from file)."),
+    metricStageDuration: ("gauge", "Elapsed time of program stage in seconds."),
+    metricLastRunTimestamp: ("gauge", "Unix timestamp of the last program run."),
+}
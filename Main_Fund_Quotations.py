@@ -13,6 +13,14 @@
         "DailyReportDirectoryName": "Output_DailyChanges",
         "InvestmentHistoryDayByDayDirectory": "Output_InvestmentsDayByDay",
         "InvestmentsFilePath":"Investments.json",
+        "DownloadConcurrency": 8,
+        "RequestTimeoutSeconds": 30,
+        "QuotationStoreDirectory": "Output_QuotationStore",
+        "LatestDetailsSource": "Page",
+        "DayByDayEngine": "NumPy",
+        "DayByDayProcesses": 1,
+        "MetricsFilePath": "",
+        "DatabaseFilePath": "",
         "FundsToCheckURLs": [
             "<URL_To_Fund_1>",
             "<URL_To_Fund_2>",
@@ -24,13 +32,52 @@
     HistoricalQuotationDirectoryName <- path to the folder where historical quotations will be saved
         It can be relative or absolute path
     
-    DailyReportDirectoryName <- path to the folder where todays fund's stats will be saved
+    DailyReportDirectoryName <- path to the folder where todays fund's stats will be saved,
+        each fund is reported with "Statistics" section: 1M / 3M / 6M / 1Y / 3Y / 5Y returns,
+        1Y volatility, max drawdown and 1Y Sharpe ratio calculated from historical quotation
     
     InvestmentHistoryDayByDayDirectory <- path to the folder where DayByDay investments results will be saved
     
     InvestmentsFilePath <- file path to the JSON with investments definition. 
         It can be relative or absolute path
     
+    DownloadConcurrency <- (optional) number of funds downloaded at the same time, 8 by default
+    
+    RequestTimeoutSeconds <- (optional) time in seconds to wait for the server response, 30 by default
+    
+    QuotationStoreDirectory <- (optional) path to the folder where already downloaded quotations are stored,
+        each run appends only quotations newer than the stored ones. Store is not used if it is not provided
+    
+    LatestDetailsSource <- (optional) "Quotation" to calculate todays funds' stats from downloaded quotation,
+        fund page is downloaded only if there are less than 2 quotations.
+        Price and its change are written with the same number of decimal digits as the quotation (at least 2),
+        update date in "dd.MM.yyyy" format.
+        "Page" (default) to read out todays funds' stats from fund page
+    
+    DayByDayEngine <- (optional) "NumPy" (default) to calculate investment results for all days at once,
+        "Python" to calculate them day after day. Both engines calculate the same days, values rounded with numpy
+        can differ by 1 in the last rounded digit (0.01 of value, 0.0001 of refund) for halves
+        and invested money by floating point summation error.
+        "Stream" to calculate them day after day and write each row to DayByDay file as soon as it is calculated,
+        only the last row of each investment is kept in memory. Results are the same as with "Python" engine.
+        "Batch" to calculate results of all investments together, over one date axis shared by all of them.
+        Results are the same as with "NumPy" engine.
+    
+    DayByDayProcesses <- (optional) number of processes calculating investment results with "Batch" engine,
+        investments are split between them and funds' prices are shared through shared memory.
+        1 (default) calculates them in the main process
+    
+    MetricsFilePath <- (optional) path to the file where metrics of the run will be saved in Prometheus text format,
+        e.g. number of web requests and received bytes per host, price lookups, parsed quotation rows,
+        DayByDay rows per investment and elapsed time of each program stage.
+        File can be read out by node exporter textfile collector. Metrics are not collected if it is not provided
+    
+    DatabaseFilePath <- (optional) path to SQLite database file, where quotations, todays funds' stats
+        and DayByDay investments results are saved as well, in indexed tables.
+        Database is used as local quotation store instead of QuotationStoreDirectory,
+        archived investments are read out from it if their DayByDay file does not exist.
+        All writes of the run are committed at once at the end of the program. Database is not used if it is not provided
+    
     FundsToCheckURLs <- list of URL to funds which will be checked
     
     
@@ -76,8 +123,22 @@
             based on the amount of money invested. Percentage values are sum of all invested money
             divided by investment value for latest quotation. 
         
-        --Quotations_Output_Format {CSV,JSON} <- accepts only CSV or JSON as an input.
+        --Skip_Daily_Report <- todays funds' stats are not saved in DailyReportDirectoryName.
+            Only funds referenced by active investments in Investments.json are downloaded,
+            unless other selected params require all of them.
+        
+        --Quotations_Output_Format {CSV,JSON,BIN} <- accepts only CSV, JSON or BIN as an input.
             According to provided format Historical quotations will be saved.
+            BIN is compact binary format (QuotationArchive), which can be read with mmap
+            and loaded directly by AnalizyFund.loadQuotationArchive().
+        
+        --Profile <- elapsed time, CPU time and peak memory of each program stage are measured,
+            as well as download of each fund, each web request and DayByDay calculation of each investment.
+            Measurements are saved as "<yyyy-MM-dd>_Profile.json" in DailyReportDirectoryName.
+        
+        --Profile_Dump <- same as --Profile, additionally each stage is profiled with cProfile
+            and profile of the slowest stage is saved as "<yyyy-MM-dd>_Profile.pstats" in DailyReportDirectoryName.
+            Profiler slows down the program, so measured times are longer than without it.
             
         --Print_Refund_Analysis <- Prints calculated refund analysis,
             based on the payments, timing and invested money. Represents the weighted average,
@@ -91,7 +152,7 @@
 
 .NOTES
 
-    Version:            1.4
+    Version:            1.5
     Author:             Stanisław Horna
     Mail:               stanislawhorna@outlook.com
     GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
@@ -109,13 +170,35 @@
     2024-02-21      Stanisław Horna         Investments which are ended can be pulled from InvestmentDayByDay CSV file.
                                             Dedicated result presenting method for investments consisted of only 1 fund
     2024-03-12      Stanisław Horna         Analysis based on the payments, timing and invested money implemented
+    2026-10-17      Stanisław Horna         Funds downloaded concurrently, failed downloads are reported
+                                            instead of stopping the program.
+                                            Optional local store of downloaded quotations.
+                                            Todays funds' stats can be calculated from quotation.
+                                            Only funds required by selected outputs are downloaded,
+                                            daily report can be skipped with --Skip_Daily_Report.
+                                            Configurable DayByDay calculation engine.
+                                            Program stages can be measured with --Profile and --Profile_Dump.
+                                            Optional metrics file in Prometheus text format.
+                                            Historical quotations can be saved in binary format.
+                                            Optional SQLite database for quotations, daily reports and DayByDay results
+                                            Funds' performance statistics in daily report and latest funds' stats.
+                                            "Batch" DayByDay engine calculating all investments at once,
+                                            optionally in multiple processes (DayByDayProcesses).
 
 """
 
+import time
 import argparse
-from Dependencies.Class_ListOfFund import ListOfFunds
+import datetime
+from Dependencies.Class_ListOfFund import ListOfFunds, defaultMaxConcurrentDownloads
 from Dependencies.Class_InvestmentWallet import InvestmentWallet
+from Dependencies.Class_AnalizyFund import AnalizyFund
+from Dependencies.Class_Investment import Investment
 from Dependencies.Function_config import *
+from Dependencies.Class_StageTimer import StageTimer, disabledStageTimer
+from Dependencies.Class_MetricsRegistry import metrics
+from Dependencies.Variables_Metrics import metricStageDuration, metricLastRunTimestamp
+from Dependencies.Variables_API import analizyplRequestTimeout
 
 programSynopsis = """
 Program to download funds quotations and calculate profits of investments.
@@ -123,6 +206,8 @@ Without params program is creating report about todays funds' stats in JSON
 and calculating investment refund day by day which is saved as CSV file.
 """
 
+profileReportFileSuffix = "Profile"
+
 parser = argparse.ArgumentParser(description=programSynopsis)
 parser.add_argument(
     "-l",
@@ -153,11 +238,37 @@ parser.add_argument(
     Owned participation units are cumulative sum of all units including those from previous buckets.
     """,
 )
+parser.add_argument(
+    "--Skip_Daily_Report",
+    action="store_true",
+    help="""
+    Do not save todays funds' stats report.
+    Only funds referenced by active investments are downloaded,
+    unless other selected params require all of them.
+    """,
+)
 parser.add_argument(
     "--Quotations_Output_Format",
-    choices=["CSV", "JSON"],
+    choices=["CSV", "JSON", "BIN"],
     help="Define file type in which historical fund quotations will be saved.",
 )
+parser.add_argument(
+    "-p",
+    "--Profile",
+    action="store_true",
+    help="""
+    Measure elapsed time, CPU time and peak memory of each program stage,
+    download of each fund and DayByDay calculation of each investment.
+    Measurements are saved as JSON file next to the daily report.
+    """,
+)
+parser.add_argument(
+    "--Profile_Dump",
+    action="store_true",
+    help="""
+    Same as --Profile, additionally profile of the slowest stage is saved as pstats file next to the daily report.
+    """,
+)
 
 
 def main(options):
@@ -166,29 +277,66 @@ def main(options):
 
     config = getConfiguration()
 
-    Funds = ListOfFunds(config[FundsToCheckURLsKey])
-    Funds.saveTodaysResults(config[DailyReportDirectoryName])
+    enableMetrics(config)
+
+    timer = getStageTimer(config, options)
+
+    with timer.measure("Download"):
+        Funds = ListOfFunds(
+            config[FundsToCheckURLsKey],
+            MaxConcurrentDownloads=config.get(
+                DownloadConcurrencyKey, defaultMaxConcurrentDownloads
+            ),
+            RequestTimeout=config.get(RequestTimeoutKey, analizyplRequestTimeout),
+            QuotationStoreDirectory=config.get(QuotationStoreDirectoryKey),
+            LatestDetailsSource=config.get(
+                LatestDetailsSourceKey, AnalizyFund.LatestDetailsFromPage
+            ),
+            Timer=timer,
+            DatabaseFilePath=config.get(DatabaseFilePathKey)
+        )
+        Funds.prefetch(getRequiredFundIDs(config, options))
+        Funds.printFailedFunds()
 
-    printLatestFundData(Funds, options)
-    saveHistoricalQuotations(
-        Funds,
-        config["HistoricalQuotationDirectoryName"],
-        options
-    )
+    with timer.measure("DailyReport"):
+        saveTodaysResults(Funds, config[DailyReportDirectoryName], options)
 
-    if os.path.isfile(config[InvestmentsFilePathKey]):
-        investments: InvestmentWallet = InvestmentWallet(
-            InvestmentsFilePath=config[InvestmentsFilePathKey],
-            FundsList=Funds
-        )
+    with timer.measure("LatestFundData"):
+        printLatestFundData(Funds, options)
 
-        investments.saveInvestmentHistoryDayByDay(
-            config[InvestmentHistoryDayByDayDirectory]
+    with timer.measure("QuotationExport"):
+        saveHistoricalQuotations(
+            Funds,
+            config["HistoricalQuotationDirectoryName"],
+            options
         )
 
-        printInvestmentRefundCalculation(investments, options)
+    if os.path.isfile(config[InvestmentsFilePathKey]):
+        with timer.measure("WalletBuild"):
+            investments: InvestmentWallet = InvestmentWallet(
+                InvestmentsFilePath=config[InvestmentsFilePathKey],
+                FundsList=Funds,
+                DayByDayEngine=config.get(DayByDayEngineKey, Investment.EngineNumPy),
+                Timer=timer,
+                MaxWorkerProcesses=config.get(DayByDayProcessesKey, 1)
+            )
+
+        with timer.measure("DayByDaySave"):
+            investments.saveInvestmentHistoryDayByDay(
+                config[InvestmentHistoryDayByDayDirectory]
+            )
+
+        with timer.measure("InvestmentResults"):
+            printInvestmentRefundCalculation(investments, options)
+
+        with timer.measure("RefundAnalysis"):
+            printRefundAnalysis(investments, options)
 
-        printRefundAnalysis(investments, options)
+    Funds.close()
+
+    saveProfileReport(timer, config[DailyReportDirectoryName], options)
+
+    saveMetrics(timer, config)
 
     exit(0)
 
@@ -202,6 +350,103 @@ def setCorrectPath() -> None:
     return None
 
 
+def enableMetrics(config: dict) -> None:
+
+    # Metrics are collected only if file path for them is provided
+    if config.get(MetricsFilePathKey):
+        metrics.enable()
+
+    return None
+
+
+def getStageTimer(config: dict, options: argparse.Namespace) -> StageTimer:
+
+    # Measurements are collected only if appropriate param was used or metrics are collected,
+    # otherwise disabled timer is returned, which does not measure anything
+    if not (options.Profile or options.Profile_Dump or config.get(MetricsFilePathKey)):
+        return disabledStageTimer
+
+    # Memory is traced and stages are profiled only if appropriate param was used,
+    # as it slows down the program
+    return StageTimer(
+        TraceMemory=options.Profile or options.Profile_Dump,
+        ProfileStages=options.Profile_Dump
+    )
+
+
+def saveProfileReport(timer: StageTimer, destinationDir: str, options: argparse.Namespace) -> None:
+
+    # Nothing to save if appropriate param was not used
+    if not (options.Profile or options.Profile_Dump):
+        return None
+
+    # Check if destination Path was provided and create appropriate file path without extension
+    destinationFilePath = f"{datetime.datetime.now().strftime("%Y-%m-%d")}_{profileReportFileSuffix}"
+    if destinationDir:
+        destinationFilePath = f"{destinationDir}/{destinationFilePath}"
+
+    # Save profile of the slowest stage if it was requested
+    profiledStage = None
+    if options.Profile_Dump:
+        profiledStage = timer.saveSlowestStageProfile(f"{destinationFilePath}.pstats")
+
+    # Save measurements of each stage and item
+    timer.saveJSON(
+        f"{destinationFilePath}.json",
+        {
+            "Date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "ProfiledStage": profiledStage
+        }
+    )
+    timer.stop()
+
+    return None
+
+
+def saveMetrics(timer: StageTimer, config: dict) -> None:
+
+    # Nothing to save if metrics are not collected
+    if not metrics.Enabled:
+        return None
+
+    # Add elapsed time of each stage and time of this run
+    for stage in timer.getStages():
+        metrics.setGauge(metricStageDuration, stage["WallSeconds"], stage=stage["Stage"])
+    metrics.setGauge(metricLastRunTimestamp, time.time())
+
+    metrics.savePrometheus(config[MetricsFilePathKey])
+
+    return None
+
+
+def getRequiredFundIDs(config: dict, options: argparse.Namespace) -> list[str] | None:
+
+    # Daily report, latest stats and historical quotations require all configured funds,
+    # None means that all funds will be downloaded
+    if (
+        not options.Skip_Daily_Report or
+        options.Print_Latest_Fund_Data or
+        options.Quotations_Output_Format
+    ):
+        return None
+
+    # Otherwise only funds of active investments are needed
+    if os.path.isfile(config[InvestmentsFilePathKey]):
+        return InvestmentWallet.getActiveFundIDs(config[InvestmentsFilePathKey])
+
+    return []
+
+
+def saveTodaysResults(Funds: ListOfFunds, destinationDir: str, options: argparse.Namespace) -> None:
+
+    # Check if appropriate param was used
+    if not options.Skip_Daily_Report:
+
+        Funds.saveTodaysResults(destinationDir)
+
+    return None
+
+
 def printLatestFundData(Funds: ListOfFunds, options: argparse.Namespace) -> None:
     
     # Check if appropriate param was used
@@ -224,6 +469,11 @@ def saveHistoricalQuotations(Funds: ListOfFunds, destinationDir: str, options: a
         
         Funds.saveQuotationCSV(destinationDir)
 
+    # Check if appropriate param was used
+    if options.Quotations_Output_Format == "BIN":
+        
+        Funds.saveQuotationBIN(destinationDir)
+
     return None
 
 
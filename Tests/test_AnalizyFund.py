@@ -0,0 +1,144 @@
+"""
+.DESCRIPTION
+    Tests of AnalizyFund class.
+    Latest fund details calculated from quotation (LatestDetailsSource = "Quotation") are compared
+    with details read out from fund page served by LocalQuotationServer,
+    fund page is downloaded only if details cannot be calculated from quotation.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import unittest
+
+# Custom created class modules
+from Dependencies.Class_AnalizyFund import AnalizyFund
+from Dependencies.Class_HTTPTransport import HTTPTransport
+from Dependencies.Class_LocalQuotationServer import LocalQuotationServer
+
+# Custom created function modules
+from Dependencies.Function_SyntheticData import generateSyntheticQuotation, generateSyntheticFundURL
+
+# Custom created variables modules
+from Dependencies.Variables_API import *
+
+
+class TestLatestDetailsSource(unittest.TestCase):
+
+    def setUp(self):
+
+        # Second fund has only one quotation, so change comparing to previous day cannot be calculated
+        self.Quotations = {
+            "ABC12": generateSyntheticQuotation("ABC12", 1, 0),
+            "XYZ34": generateSyntheticQuotation("XYZ34", 1, 0)
+        }
+        self.Quotations["XYZ34"]["Price"] = self.Quotations["XYZ34"]["Price"][-1:]
+        self.Server = LocalQuotationServer(self.Quotations, Latency=0)
+        self.Server.start()
+        self.QuotationsAPI = AnalizyFund.QuotationsAPI
+        AnalizyFund.QuotationsAPI = self.Server.getQuotationAPI()
+        return None
+
+    def tearDown(self):
+        AnalizyFund.QuotationsAPI = self.QuotationsAPI
+        self.Server.stop()
+        return None
+
+    def createFund(self, fundID: str, latestDetailsSource: str) -> AnalizyFund:
+        return AnalizyFund(
+            self.Server.getFundURL(fundID),
+            Transport=HTTPTransport(),
+            LatestDetailsSource=latestDetailsSource
+        )
+
+    def testDetailsFromQuotationMatchFundPage(self):
+
+        fromPage = self.createFund("ABC12", AnalizyFund.LatestDetailsFromPage)
+        fromPage.loadLatestDetails()
+        self.Server.resetStatuses()
+
+        # Only quotation API is requested, fund page is not downloaded
+        fromQuotation = self.createFund("ABC12", AnalizyFund.LatestDetailsFromQuotation)
+        fromQuotation.loadLatestDetails()
+        self.assertEqual(self.Server.getStatuses(), {200: 1})
+        self.assertTrue(fromQuotation.IsHistoricalQuotationLoaded)
+
+        # Details have the same values, page writes numbers with different precision and signs
+        pageDetails = fromPage.getLatestDetails()
+        quotationDetails = fromQuotation.getLatestDetails()
+        self.assertEqual(quotationDetails["Currency"], pageDetails["Currency"])
+        self.assertEqual(quotationDetails["UpdateDate"], pageDetails["UpdateDate"])
+        self.assertEqual(float(quotationDetails["Price"]), float(pageDetails["Price"]))
+        for key in ["ChangeValue1D", "ChangePercentage1D"]:
+            self.assertAlmostEqual(float(quotationDetails[key]), float(pageDetails[key]), places=2)
+
+    def testFundPageIsFallback(self):
+
+        # Single quotation is not enough to calculate details, so fund page is downloaded as well
+        fund = self.createFund("XYZ34", AnalizyFund.LatestDetailsFromQuotation)
+        fund.loadLatestDetails()
+
+        self.assertEqual(self.Server.getStatuses(), {200: 2})
+        self.assertEqual(
+            float(fund.getLatestDetails()["Price"]),
+            self.Quotations["XYZ34"]["Price"][-1][analizyplAPIresponse_QuotationValue]
+        )
+
+
+class TestDetailsCalculatedFromQuotation(unittest.TestCase):
+
+    def getDetails(self, prices: list[float]) -> dict[str, str]:
+
+        # Fund with quotation provided directly, no web request is invoked
+        fund = AnalizyFund(
+            generateSyntheticFundURL("ABC12"),
+            LatestDetailsSource=AnalizyFund.LatestDetailsFromQuotation
+        )
+        fund.setHistoricalQuotation(
+            {
+                "FundID": "ABC12",
+                "Currency": "EUR",
+                "Price": [
+                    {analizyplAPIresponse_QuotationDate: f"2024-01-{day:02d}", analizyplAPIresponse_QuotationValue: price}
+                    for day, price in enumerate(prices, start=2)
+                ]
+            }
+        )
+        fund.loadLatestDetails()
+
+        return fund.getLatestDetails()
+
+    def testPriceWithTwoDecimalDigits(self):
+
+        self.assertEqual(
+            self.getDetails([12.0, 12.5]),
+            {
+                "Price": "12.50",
+                "Currency": "EUR",
+                "UpdateDate": "03.01.2024",
+                "ChangePercentage1D": "4.17",
+                "ChangeValue1D": "0.50"
+            }
+        )
+
+    def testPriceKeepsQuotationPrecision(self):
+
+        details = self.getDetails([10.0, 10.2, 10.1234])
+
+        self.assertEqual(details["Price"], "10.1234")
+        self.assertEqual(details["ChangeValue1D"], "-0.0766")
+        self.assertEqual(details["ChangePercentage1D"], "-0.75")
+        self.assertEqual(details["UpdateDate"], "04.01.2024")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+.DESCRIPTION
+    Tests of FundStatistics class.
+    Returns, volatility, Sharpe ratio and max drawdown calculated from prefix arrays
+    are compared with values calculated directly from prices of each window.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import datetime
+import unittest
+import numpy as np
+from dateutil.relativedelta import relativedelta
+
+# Custom created class modules
+from Dependencies.Class_QuotationIndex import QuotationIndex
+from Dependencies.Class_FundStatistics import FundStatistics
+
+
+class TestFundStatistics(unittest.TestCase):
+
+    def setUp(self):
+
+        # Quotations on working days of 4 years with random daily changes
+        random = np.random.default_rng(0)
+        lastDate = datetime.date(2024, 6, 28)
+        dates = [
+            date for date in (
+                lastDate - datetime.timedelta(days=day) for day in range(4 * 365, -1, -1)
+            )
+            if date.weekday() < 5
+        ]
+        self.Ordinals = np.asarray([date.toordinal() for date in dates])
+        self.Prices = 100 * np.exp(np.cumsum(random.normal(0.0002, 0.01, len(dates))))
+        self.Statistics = FundStatistics().update(QuotationIndex.fromArrays(self.Ordinals, self.Prices))
+        return None
+
+    def getWindowStart(self, window: relativedelta) -> int:
+
+        # Position of the last quotation on or before the window start date
+        startOrdinal = (datetime.date.fromordinal(int(self.Ordinals[-1])) - window).toordinal()
+        return int(np.flatnonzero(self.Ordinals <= startOrdinal)[-1])
+
+    def testReturns(self):
+
+        for name, window in FundStatistics.ReturnWindows.items():
+            with self.subTest(window=name):
+                value = self.Statistics[f"Return{name}_%"]
+
+                # History of 4 years is too short for 5 years return
+                if name == "5Y":
+                    self.assertEqual(value, None)
+                    continue
+
+                start = self.getWindowStart(window)
+                self.assertAlmostEqual(value, (self.Prices[-1] / self.Prices[start] - 1) * 100, places=9)
+
+    def testReturnWindowStartsOnLastQuotationBeforeIt(self):
+
+        # 2024-03-30 is Saturday, so 1M return is calculated from Friday price
+        statistics = FundStatistics().update(
+            QuotationIndex.fromArrays(
+                [datetime.date(2024, 3, 29).toordinal(), datetime.date(2024, 4, 30).toordinal()],
+                [100.0, 105.0]
+            )
+        )
+
+        self.assertAlmostEqual(statistics["Return1M_%"], 5.0, places=9)
+        self.assertEqual(statistics["Return3M_%"], None)
+
+    def testVolatilityAndSharpeRatio(self):
+
+        # Standard deviation of log returns of the last year annualized with the number of returns
+        start = self.getWindowStart(FundStatistics.VolatilityWindow)
+        logReturns = np.diff(np.log(self.Prices[start:]))
+        volatility = np.std(logReturns, ddof=1) * np.sqrt(len(logReturns))
+
+        self.assertAlmostEqual(self.Statistics["Volatility1Y_%"], volatility * 100, places=7)
+        self.assertAlmostEqual(self.Statistics["SharpeRatio1Y"], logReturns.sum() / volatility, places=7)
+
+    def testMaxDrawdown(self):
+
+        # The biggest drop is from 120 to 60, not from the last maximum 130 to 100
+        statistics = FundStatistics().update(
+            QuotationIndex.fromArrays(
+                [datetime.date(2024, 1, day).toordinal() for day in range(1, 8)],
+                [100.0, 120.0, 90.0, 110.0, 60.0, 130.0, 100.0]
+            )
+        )
+        expected = np.min(self.Prices / np.maximum.accumulate(self.Prices) - 1) * 100
+
+        self.assertAlmostEqual(statistics["MaxDrawdown_%"], -50.0, places=9)
+        self.assertAlmostEqual(self.Statistics["MaxDrawdown_%"], expected, places=9)
+
+    def testStatisticsWhichCannotBeCalculated(self):
+
+        # Empty quotation, single quotation and constant price
+        quotations = {
+            "Empty": ([], []),
+            "Single": ([datetime.date(2024, 1, 2).toordinal()], [10.0]),
+            "Constant": ([datetime.date(2024, 1, day).toordinal() for day in range(1, 11)], [10.0] * 10)
+        }
+        for case, (ordinals, prices) in quotations.items():
+            with self.subTest(case=case):
+                statistics = FundStatistics().update(QuotationIndex.fromArrays(ordinals, prices))
+
+                self.assertEqual(list(statistics), list(FundStatistics.getEmptyStatistics()))
+                self.assertEqual(statistics["Volatility1Y_%"], None)
+                self.assertEqual(statistics["SharpeRatio1Y"], None)
+                if case == "Empty":
+                    self.assertEqual(statistics, FundStatistics.getEmptyStatistics())
+                else:
+                    self.assertEqual(statistics["MaxDrawdown_%"], 0.0)
+
+    def testStatisticsOfReplacedQuotation(self):
+
+        # Statistics are calculated again only when quotation index is replaced
+        statistics = FundStatistics()
+        index = QuotationIndex.fromArrays(self.Ordinals[:-100], self.Prices[:-100])
+        first = statistics.update(index)
+        self.assertIs(statistics.update(index), first)
+
+        self.assertEqual(
+            statistics.update(QuotationIndex.fromArrays(self.Ordinals, self.Prices)),
+            self.Statistics
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
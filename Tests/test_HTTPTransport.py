@@ -0,0 +1,122 @@
+"""
+.DESCRIPTION
+    Tests of HTTPTransport class.
+    Requests are invoked against LocalQuotationServer, which returns ETag validators,
+    status 304 for conditional request with the same validator and gzip compressed body.
+    Fund quotation downloaded again with local QuotationStore is read out from the store if it has not changed.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import json
+import tempfile
+import unittest
+from array import array
+from unittest import mock
+
+# Custom created class modules
+from Dependencies.Class_AnalizyFund import AnalizyFund
+from Dependencies.Class_HTTPTransport import HTTPTransport
+from Dependencies.Class_QuotationStore import QuotationStore
+from Dependencies.Class_LocalQuotationServer import LocalQuotationServer
+
+# Custom created function modules
+from Dependencies.Function_SyntheticData import generateSyntheticQuotation
+
+
+class TestHTTPTransport(unittest.TestCase):
+
+    def setUp(self):
+        self.Directory = tempfile.TemporaryDirectory()
+        self.Quotation = generateSyntheticQuotation("ABC12", 1, 0)
+        self.Server = LocalQuotationServer({"ABC12": self.Quotation}, Latency=0)
+        self.Server.start()
+        self.URL = f"{self.Server.getQuotationAPI()}/fio/ABC12"
+        return None
+
+    def tearDown(self):
+        self.Server.stop()
+        self.Directory.cleanup()
+        return None
+
+    def testConditionalRequest(self):
+
+        transport = HTTPTransport()
+
+        # Validators are sent only if they were remembered for the URL and caller can handle status 304
+        response = transport.get(self.URL, conditional=True)
+        self.assertEqual(response.status_code, 200)
+        transport.rememberValidators(self.URL, response)
+
+        self.assertTrue(transport.isNotModified(transport.get(self.URL, conditional=True)))
+        self.assertEqual(transport.get(self.URL).status_code, 200)
+        self.assertEqual(self.Server.getStatuses(), {200: 2, 304: 1})
+
+    def testValidatorCacheIsReusedByNextRun(self):
+
+        cacheFilePath = f"{self.Directory.name}/{QuotationStore.ValidatorCacheFileName}"
+        transport = HTTPTransport(ValidatorCacheFilePath=cacheFilePath)
+        transport.rememberValidators(self.URL, transport.get(self.URL))
+        transport.saveValidatorCache()
+
+        nextTransport = HTTPTransport(ValidatorCacheFilePath=cacheFilePath)
+        self.assertEqual(nextTransport.Validators, transport.Validators)
+        self.assertTrue(nextTransport.isNotModified(nextTransport.get(self.URL, conditional=True)))
+
+    def testCompressedStreamedResponse(self):
+
+        # Body compressed by the server is decoded while it is read out chunk by chunk
+        transport = HTTPTransport()
+        response = transport.get(self.URL, stream=True)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+
+        body = b"".join(transport.iterContent(self.URL, response, chunkSize=128))
+        self.assertEqual(
+            json.loads(body),
+            LocalQuotationServer.getAPIResponse("ABC12", self.Quotation)
+        )
+
+    def testDefaultTransportCreatedOnFirstUse(self):
+
+        with mock.patch.object(HTTPTransport, "DefaultTransport", None):
+            transport = HTTPTransport.getDefault()
+            self.assertIsInstance(transport, HTTPTransport)
+            self.assertIs(HTTPTransport.getDefault(), transport)
+
+    def testNotModifiedQuotationReadFromStore(self):
+
+        store = QuotationStore(self.Directory.name)
+        transport = HTTPTransport()
+        quotationsAPI = AnalizyFund.QuotationsAPI
+        AnalizyFund.QuotationsAPI = self.Server.getQuotationAPI()
+        try:
+            # The first download is stored, the next one receives status 304 and quotation is read from the store
+            downloadedFund = AnalizyFund(self.Server.getFundURL("ABC12"), LocalQuotationStore=store, Transport=transport)
+            downloadedFund.loadHistoricalQuotation()
+            storedFund = AnalizyFund(self.Server.getFundURL("ABC12"), LocalQuotationStore=store, Transport=transport)
+            storedFund.loadHistoricalQuotation()
+        finally:
+            AnalizyFund.QuotationsAPI = quotationsAPI
+
+        self.assertEqual(self.Server.getStatuses(), {200: 1, 304: 1})
+        self.assertEqual(downloadedFund.getQuotationJSON(), self.Quotation)
+        self.assertEqual(storedFund.getQuotationJSON(), self.Quotation)
+
+        # Both funds keep only compact arrays, quotation entries are not kept
+        for fund in [downloadedFund, storedFund]:
+            self.assertIsInstance(fund.PriceIndex.Ordinals, array)
+            self.assertIsInstance(fund.PriceIndex.Prices, array)
+
+
+if __name__ == "__main__":
+    unittest.main()
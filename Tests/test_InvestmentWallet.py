@@ -0,0 +1,372 @@
+"""
+.DESCRIPTION
+    Tests of InvestmentWallet class with each DayByDay engine.
+    Wallet of synthetic investments is calculated with each engine, saved DayByDay files and investment results
+    are compared with "Python" engine. Day after day engines have to return identical files,
+    engines rounding values with numpy can differ by 1 in the last rounded digit (0.01 of value, 0.0001 of refund)
+    and invested money by floating point summation error, "Batch" engine has to be identical as "NumPy" engine.
+    Results resumed from files saved by previous run have to be identical as calculated from scratch,
+    files which cannot be parsed are not resumed.
+    Files of ended investments are imported only if their last row, read out from the end of the file,
+    is dated on investment end date.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import os
+import csv
+import json
+import datetime
+import tempfile
+import unittest
+
+# Custom created class modules
+from Dependencies.Class_AnalizyFund import AnalizyFund
+from Dependencies.Class_ListOfFund import ListOfFunds
+from Dependencies.Class_Investment import Investment
+from Dependencies.Class_InvestmentWallet import InvestmentWallet
+
+# Custom created function modules
+from Dependencies.Function_SyntheticData import (
+    generateSyntheticFundURL,
+    generateSyntheticQuotation,
+    generateSyntheticInvestments
+)
+
+# Custom created variables modules
+from Dependencies.Variables_API import *
+
+
+class TestInvestmentWallet(unittest.TestCase):
+
+    # Engine, number of worker processes and if results have to be identical for each compared calculation,
+    # the first one is the reference
+    Engines = [
+        (Investment.EnginePython, 1, True),
+        (Investment.EngineStream, 1, True),
+        (Investment.EngineNumPy, 1, False),
+        (Investment.EngineBatch, 1, False),
+        (Investment.EngineBatch, 2, False)
+    ]
+
+    # Max difference of values rounded to 2 and 4 decimal digits and relative difference of not rounded values
+    ValueTolerance = 0.01
+    RefundTolerance = 0.0001
+    RelativeTolerance = 1e-9
+
+    # Number of days cut from the end of quotation for the first run of resumed calculation
+    CutDays = 20
+
+    # Number of days which quotations of delayed fund were missing in the first run
+    DelayedDays = 4
+
+    @classmethod
+    def setUpClass(cls):
+
+        # Synthetic quotations and quotations without the latest days, as they were downloaded by previous run,
+        # quotations of the last fund were published later than others, so the latest rows were not final
+        cls.Quotations = {
+            fundID: generateSyntheticQuotation(fundID, 2, 0)
+            for fundID in ["SYN00001", "SYN00002", "SYN00003", "SYN00004", "SYN00005"]
+        }
+        cutDate = datetime.date.today() - datetime.timedelta(days=TestInvestmentWallet.CutDays)
+        cutDates = dict.fromkeys(cls.Quotations, cutDate) | {
+            "SYN00005": cutDate - datetime.timedelta(days=TestInvestmentWallet.DelayedDays)
+        }
+        cls.CutQuotations = {
+            fundID: quotation | {
+                "Price": [
+                    item for item in quotation["Price"]
+                    if item[analizyplAPIresponse_QuotationDate] <= cutDates[fundID].isoformat()
+                ]
+            }
+            for fundID, quotation in cls.Quotations.items()
+        }
+
+        # Orders are placed before the cut, so they are valid for both runs, one of investments is already ended
+        cls.Investments = generateSyntheticInvestments(cls.CutQuotations, 8, 3, 4, 1)
+        endedInvestment = cls.Investments["Synthetic_Investment_0001"]
+        endedInvestment["EndDate"] = min(
+            datetime.date.fromisoformat(endedInvestment["StartDate"]) + datetime.timedelta(days=200),
+            cutDate
+        ).isoformat()
+
+        return None
+
+    def setUp(self):
+        self.Directory = tempfile.TemporaryDirectory()
+        return None
+
+    def tearDown(self):
+        self.Directory.cleanup()
+        return None
+
+    def createWallet(
+        self,
+        directoryPath: str,
+        engine: str,
+        processes: int,
+        quotations: dict[str, dict[str, str | list[dict[str, str | float]]]]
+    ) -> InvestmentWallet:
+
+        # Save investments in the same structure as Investments.json
+        investmentsFilePath = f"{self.Directory.name}/Investments.json"
+        with open(investmentsFilePath, "w") as investmentsFile:
+            investmentsFile.write(json.dumps(self.Investments, indent=4))
+
+        # Create list of funds without downloading any data
+        Funds = ListOfFunds(
+            [generateSyntheticFundURL(fundID) for fundID in quotations],
+            LatestDetailsSource=AnalizyFund.LatestDetailsFromQuotation
+        )
+        for fundID in quotations:
+            Funds.getFundByID(fundID).setHistoricalQuotation(quotations[fundID])
+
+        return InvestmentWallet(
+            InvestmentsFilePath=investmentsFilePath,
+            FundsList=Funds,
+            DayByDayEngine=engine,
+            MaxWorkerProcesses=processes,
+            DayByDayDirectory=directoryPath
+        )
+
+    def runWallet(
+        self,
+        directoryPath: str,
+        engine: str,
+        processes: int,
+        quotations: dict[str, dict[str, str | list[dict[str, str | float]]]]
+    ) -> tuple[dict[str, bytes], dict[str, list[dict[str, str | float]]]]:
+
+        # Calculate wallet and save DayByDay files in provided directory
+        wallet = self.createWallet(directoryPath, engine, processes, quotations)
+        wallet.saveInvestmentHistoryDayByDay(directoryPath)
+
+        # return content of each saved file and investment results
+        files = {}
+        for fileName in sorted(os.listdir(directoryPath)):
+            with open(f"{directoryPath}/{fileName}", "rb") as savedFile:
+                files[fileName] = savedFile.read()
+
+        return files, wallet.WalletsResults
+
+    def getTolerance(self, header: str, expected: float) -> float:
+
+        # Refund is rounded to 4 decimal digits, units are not rounded, other values are rounded to 2 digits
+        relativeTolerance = TestInvestmentWallet.RelativeTolerance * max(1.0, abs(expected))
+        if header.endswith("Refund"):
+            return TestInvestmentWallet.RefundTolerance + relativeTolerance
+        if header.endswith("P.U.") or header == "Invested Money":
+            return relativeTolerance
+
+        return TestInvestmentWallet.ValueTolerance + relativeTolerance
+
+    def assertDayByDayAlmostEqual(self, content: bytes, expectedContent: bytes, fileName: str):
+
+        # Both files have the same headers, dates and text values, numbers are compared with tolerance
+        rows = list(csv.reader(content.decode().splitlines(), delimiter="\t"))
+        expectedRows = list(csv.reader(expectedContent.decode().splitlines(), delimiter="\t"))
+        self.assertEqual(rows[0], expectedRows[0], fileName)
+        self.assertEqual([row[0] for row in rows], [row[0] for row in expectedRows], fileName)
+
+        for row, expectedRow in zip(rows[1:], expectedRows[1:]):
+            for header, value, expectedValue in zip(expectedRows[0][1:], row[1:], expectedRow[1:]):
+                if header.endswith("Currency"):
+                    self.assertEqual(value, expectedValue, fileName)
+                    continue
+                self.assertLessEqual(
+                    abs(float(value) - float(expectedValue)),
+                    self.getTolerance(header, float(expectedValue)),
+                    f"{fileName} {row[0]} {header}"
+                )
+
+    def assertResultsAlmostEqual(self, results, expectedResults):
+
+        # Results are calculated from the last DayByDay row, so numbers are compared with value tolerance
+        self.assertEqual(list(results), list(expectedResults))
+        for investmentName in expectedResults:
+            for result, expectedResult in zip(results[investmentName], expectedResults[investmentName]):
+                self.assertEqual(list(result), list(expectedResult))
+                for key, expectedValue in expectedResult.items():
+                    if isinstance(expectedValue, float):
+                        self.assertAlmostEqual(
+                            result[key], expectedValue, delta=TestInvestmentWallet.ValueTolerance, msg=key
+                        )
+                    else:
+                        self.assertEqual(result[key], expectedValue, key)
+
+    def testEnginesAreEquivalent(self):
+
+        # Results of each engine are compared with "Python" engine
+        expected = None
+        for engine, processes, isExact in TestInvestmentWallet.Engines:
+            with self.subTest(engine=engine, processes=processes):
+                directoryPath = f"{self.Directory.name}/{engine}_{processes}"
+                os.makedirs(directoryPath)
+                result = self.runWallet(directoryPath, engine, processes, self.Quotations)
+
+                if expected == None:
+                    expected = result
+                    self.assertEqual(len(expected[0]), 2 * len(self.Investments))
+                    continue
+
+                self.assertEqual(list(result[0]), list(expected[0]))
+                for fileName in expected[0]:
+                    if isExact or not fileName.endswith(".csv"):
+                        self.assertEqual(result[0][fileName], expected[0][fileName], fileName)
+                    else:
+                        self.assertDayByDayAlmostEqual(result[0][fileName], expected[0][fileName], fileName)
+
+                if isExact:
+                    self.assertEqual(result[1], expected[1])
+                else:
+                    self.assertResultsAlmostEqual(result[1], expected[1])
+
+    def testBatchIsIdenticalToNumPy(self):
+
+        # Both engines sum up and round values with numpy in the same order
+        results = []
+        for engine in [Investment.EngineNumPy, Investment.EngineBatch]:
+            directoryPath = f"{self.Directory.name}/{engine}"
+            os.makedirs(directoryPath)
+            results.append(self.runWallet(directoryPath, engine, 1, self.Quotations))
+
+        self.assertEqual(results[0], results[1])
+
+    def testResumeIsIdenticalToFreshRun(self):
+
+        for engine, processes, isExact in TestInvestmentWallet.Engines:
+            with self.subTest(engine=engine, processes=processes):
+                freshDirectoryPath = f"{self.Directory.name}/{engine}_{processes}_Fresh"
+                resumedDirectoryPath = f"{self.Directory.name}/{engine}_{processes}_Resumed"
+                os.makedirs(freshDirectoryPath)
+                os.makedirs(resumedDirectoryPath)
+
+                # Previous run saved results calculated with quotations available at that time
+                self.runWallet(resumedDirectoryPath, engine, processes, self.CutQuotations)
+
+                # Results of the next run are resumed from saved files
+                wallet = self.createWallet(resumedDirectoryPath, engine, processes, self.Quotations)
+                self.assertTrue(
+                    all(investment.PersistedFilePath != None for investment in wallet.Wallets.values())
+                )
+                resumed = self.runWallet(resumedDirectoryPath, engine, processes, self.Quotations)
+
+                fresh = self.runWallet(freshDirectoryPath, engine, processes, self.Quotations)
+                self.assertEqual(list(resumed[0]), list(fresh[0]))
+                for fileName in fresh[0]:
+                    self.assertEqual(resumed[0][fileName], fresh[0][fileName], fileName)
+                self.assertEqual(resumed[1], fresh[1])
+
+    def testChangedOrderBookIsNotResumed(self):
+
+        directoryPath = f"{self.Directory.name}/Wallet"
+        os.makedirs(directoryPath)
+        self.runWallet(directoryPath, Investment.EngineNumPy, 1, self.CutQuotations)
+
+        # Order placed in the past changes all results after it, so saved results cannot be resumed
+        investments = self.Investments
+        self.Investments = json.loads(json.dumps(investments))
+        try:
+            orders = next(iter(self.Investments["Synthetic_Investment_0002"]["Funds"].values()))
+            orders[0]["Money"] += 100
+            resumed = self.runWallet(directoryPath, Investment.EngineNumPy, 1, self.Quotations)
+
+            freshDirectoryPath = f"{self.Directory.name}/Fresh"
+            os.makedirs(freshDirectoryPath)
+            fresh = self.runWallet(freshDirectoryPath, Investment.EngineNumPy, 1, self.Quotations)
+        finally:
+            self.Investments = investments
+
+        self.assertEqual(resumed, fresh)
+
+    def testMalformedFileIsNotResumed(self):
+
+        for engine, processes, isExact in TestInvestmentWallet.Engines:
+            with self.subTest(engine=engine, processes=processes):
+                freshDirectoryPath = f"{self.Directory.name}/{engine}_{processes}_Fresh"
+                resumedDirectoryPath = f"{self.Directory.name}/{engine}_{processes}_Resumed"
+                os.makedirs(freshDirectoryPath)
+                os.makedirs(resumedDirectoryPath)
+                self.runWallet(resumedDirectoryPath, engine, processes, self.CutQuotations)
+
+                # Value which is not a number in the first row of one file, partially written last row
+                # of another one and the last row of already ended investment
+                # Stream engine does not parse rows before the last final one, they are kept as they are
+                malformedFiles = {
+                    "Synthetic_Investment_0001.csv": lambda lines: lines[:-1] + [lines[-1][:15]],
+                    "Synthetic_Investment_0002.csv": lambda lines: [lines[0], lines[1].replace("\t", "\tx", 1)] + lines[2:],
+                    "Synthetic_Investment_0003.csv": lambda lines: lines[:-1] + [lines[-1][:-10]]
+                }
+                if engine == Investment.EngineStream:
+                    del malformedFiles["Synthetic_Investment_0002.csv"]
+                for fileName, malform in malformedFiles.items():
+                    with open(f"{resumedDirectoryPath}/{fileName}", "r") as savedFile:
+                        lines = savedFile.read().splitlines()
+                    with open(f"{resumedDirectoryPath}/{fileName}", "w") as savedFile:
+                        savedFile.write("\n".join(malform(lines)) + "\n")
+
+                # Malformed files are calculated again and replaced, remaining ones are resumed,
+                # streamed results are always written to the file during calculation
+                wallet = self.createWallet(resumedDirectoryPath, engine, processes, self.Quotations)
+                if engine != Investment.EngineStream:
+                    self.assertEqual(
+                        [name for name, investment in wallet.Wallets.items() if investment.PersistedFilePath == None],
+                        [fileName.removesuffix(".csv") for fileName in malformedFiles]
+                    )
+                resumed = self.runWallet(resumedDirectoryPath, engine, processes, self.Quotations)
+
+                fresh = self.runWallet(freshDirectoryPath, engine, processes, self.Quotations)
+                self.assertEqual(resumed, fresh)
+
+    def testArchivedInvestmentIsValidatedFromTail(self):
+
+        directoryPath = f"{self.Directory.name}/Wallet"
+        os.makedirs(directoryPath)
+        expected = self.runWallet(directoryPath, Investment.EnginePython, 1, self.Quotations)
+
+        # The last row is read out also with block smaller than a single row
+        investmentName = "Synthetic_Investment_0001"
+        filePath = f"{directoryPath}/{investmentName}.csv"
+        lines = expected[0][f"{investmentName}.csv"].decode().splitlines()
+        investment = self.createWallet(directoryPath, Investment.EnginePython, 1, self.Quotations).Wallets[investmentName]
+        for blockSize in [4, 16, 4096]:
+            with self.subTest(blockSize=blockSize):
+                self.assertEqual(
+                    investment.readInvestmentHistoryFileTail(filePath, blockSize),
+                    (lines[0].split("\t"), lines[-1].split("\t"))
+                )
+
+        # Ended investment is imported from its file, funds quotations are not used
+        self.assertEqual(investment.FundsQuotations, {})
+        self.assertEqual(investment.PersistedFilePath, filePath)
+
+        # File which does not end with investment end date or with partially written last row is not imported,
+        # results are calculated again and the file is replaced
+        malformedFiles = {
+            "Missing last row": lines[:-1],
+            "Only headers": lines[:1],
+            "Partially written last row": lines[:-1] + [lines[-1][:15]]
+        }
+        for case, malformedLines in malformedFiles.items():
+            with self.subTest(case=case):
+                with open(filePath, "w") as savedFile:
+                    savedFile.write("\n".join(malformedLines) + "\n")
+
+                wallet = self.createWallet(directoryPath, Investment.EnginePython, 1, self.Quotations)
+                self.assertNotEqual(wallet.Wallets[investmentName].FundsQuotations, {})
+                self.assertEqual(self.runWallet(directoryPath, Investment.EnginePython, 1, self.Quotations), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+.DESCRIPTION
+    Tests of ListOfFunds class.
+    Funds are served by LocalQuotationServer and responses are counted by their status:
+    constructor does not download any data, .prefetch() downloads only selected funds which are not loaded yet,
+    remaining funds are loaded on first access and funds which could not be downloaded are moved to FailedFunds.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import unittest
+import requests
+
+# Custom created class modules
+from Dependencies.Class_AnalizyFund import AnalizyFund
+from Dependencies.Class_ListOfFund import ListOfFunds
+from Dependencies.Class_LocalQuotationServer import LocalQuotationServer
+
+# Custom created function modules
+from Dependencies.Function_SyntheticData import generateSyntheticQuotation
+
+
+class TestListOfFundsLoading(unittest.TestCase):
+
+    def setUp(self):
+        self.FundIDs = ["ABC12", "DEF34", "GHI56"]
+        self.Quotations = {
+            fundID: generateSyntheticQuotation(fundID, 1, 0)
+            for fundID in self.FundIDs
+        }
+        self.Server = LocalQuotationServer(self.Quotations, Latency=0)
+        self.Server.start()
+        self.QuotationsAPI = AnalizyFund.QuotationsAPI
+        AnalizyFund.QuotationsAPI = self.Server.getQuotationAPI()
+        return None
+
+    def tearDown(self):
+        AnalizyFund.QuotationsAPI = self.QuotationsAPI
+        self.Server.stop()
+        return None
+
+    def createListOfFunds(self, fundIDs: list[str]) -> ListOfFunds:
+
+        # Latest details are calculated from quotation, so each fund is a single request
+        return ListOfFunds(
+            [self.Server.getFundURL(fundID) for fundID in fundIDs],
+            LatestDetailsSource=AnalizyFund.LatestDetailsFromQuotation
+        )
+
+    def testConstructorDoesNotDownload(self):
+
+        funds = self.createListOfFunds(self.FundIDs)
+
+        self.assertEqual(self.Server.getStatuses(), {})
+        self.assertEqual(list(funds.ListOfFunds), self.FundIDs)
+        self.assertFalse(any(fund.isLoaded() for fund in funds.ListOfFunds.values()))
+
+    def testPrefetchSelectedFunds(self):
+
+        funds = self.createListOfFunds(self.FundIDs)
+        funds.prefetch(["ABC12", "GHI56"])
+
+        self.assertEqual(self.Server.getStatuses(), {200: 2})
+        self.assertTrue(funds.getFundByID("ABC12").isLoaded())
+        self.assertFalse(funds.getFundByID("DEF34").isLoaded())
+        self.assertTrue(funds.getFundByID("GHI56").isLoaded())
+
+        # Funds already loaded are not downloaded again
+        funds.prefetch()
+        self.assertEqual(self.Server.getStatuses(), {200: 3})
+        self.assertTrue(funds.getFundByID("DEF34").isLoaded())
+
+    def testFundLoadedOnFirstAccess(self):
+
+        funds = self.createListOfFunds(self.FundIDs)
+        fund = funds.getFundByID("DEF34")
+
+        self.assertEqual(fund.getQuotationJSON(), self.Quotations["DEF34"])
+        self.assertEqual(self.Server.getStatuses(), {200: 1})
+        self.assertFalse(funds.getFundByID("ABC12").isLoaded())
+
+    def testFailedFundsAreCollected(self):
+
+        # Server does not know the fund, so download of it fails and remaining funds are loaded
+        funds = self.createListOfFunds(["ABC12", "XXX99", "GHI56"])
+        failedURL = funds.getFundByID("XXX99").URL
+        funds.prefetch()
+
+        self.assertEqual(list(funds.getFailedFunds()), [failedURL])
+        self.assertIsInstance(funds.getFailedFunds()[failedURL], requests.HTTPError)
+        self.assertEqual(list(funds.ListOfFunds), ["ABC12", "GHI56"])
+        self.assertTrue(all(fund.isLoaded() for fund in funds.ListOfFunds.values()))
+        self.assertEqual(self.Server.getStatuses(), {200: 2, 404: 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+.DESCRIPTION
+    Tests of MetricsRegistry class.
+    Counters and gauges are updated per set of labels only when registry is enabled,
+    metrics are exported in Prometheus text format and saved by replacing the destination file.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import os
+import tempfile
+import unittest
+import threading
+
+# Custom created class modules
+from Dependencies.Class_MetricsRegistry import MetricsRegistry
+
+# Custom created variables modules
+from Dependencies.Variables_Metrics import *
+
+
+class TestMetricsRegistry(unittest.TestCase):
+
+    def testDisabledRegistryIgnoresUpdates(self):
+
+        registry = MetricsRegistry()
+        registry.increment(metricFailedFunds)
+        registry.setGauge(metricLastRunTimestamp, 1.0)
+
+        self.assertEqual(registry.Values, {})
+        self.assertEqual(registry.exportPrometheus(), "\n")
+
+    def testCountersAndGaugesPerLabels(self):
+
+        registry = MetricsRegistry(Enabled=True)
+        registry.increment(metricHTTPRequests, host="analizy.pl", status="200")
+        registry.increment(metricHTTPRequests, status="200", host="analizy.pl")
+        registry.increment(metricHTTPRequests, host="analizy.pl", status="304")
+        registry.increment(metricHTTPResponseBytes, 1024, host="analizy.pl")
+        registry.setGauge(metricLastRunTimestamp, 10.0)
+        registry.setGauge(metricLastRunTimestamp, 20.0)
+
+        # Order of labels does not matter, counters are summed up, gauge keeps the last value
+        self.assertEqual(registry.getValue(metricHTTPRequests, status="200", host="analizy.pl"), 2)
+        self.assertEqual(registry.getValue(metricHTTPRequests, host="analizy.pl", status="304"), 1)
+        self.assertEqual(registry.getValue(metricHTTPRequests, host="analizy.pl", status="404"), None)
+        self.assertEqual(registry.getValue(metricHTTPResponseBytes, host="analizy.pl"), 1024)
+        self.assertEqual(registry.getValue(metricLastRunTimestamp), 20.0)
+
+    def testConcurrentIncrements(self):
+
+        registry = MetricsRegistry(Enabled=True)
+
+        def incrementLookups():
+            for i in range(1000):
+                registry.increment(metricFundPriceLookups, type="exact")
+            return None
+
+        threads = [threading.Thread(target=incrementLookups) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(registry.getValue(metricFundPriceLookups, type="exact"), 8000)
+
+    def testExportPrometheus(self):
+
+        registry = MetricsRegistry(Enabled=True)
+        registry.increment(metricDayByDayRows, 5, investment='Wallet "A"\\Japan', mode="resumed")
+        registry.increment(metricDayByDayRows, 2, investment="Savings", mode="calculated")
+        registry.increment("custom_metric", 3)
+
+        self.assertEqual(
+            registry.exportPrometheus(),
+            "# TYPE custom_metric untyped\n"
+            "custom_metric 3\n"
+            f"# HELP {metricDayByDayRows} {metricsDefinitions[metricDayByDayRows][1]}\n"
+            f"# TYPE {metricDayByDayRows} {metricsDefinitions[metricDayByDayRows][0]}\n"
+            f'{metricDayByDayRows}{{investment="Savings",mode="calculated"}} 2\n'
+            f'{metricDayByDayRows}{{investment="Wallet \\"A\\"\\\\Japan",mode="resumed"}} 5\n'
+        )
+
+    def testSavePrometheus(self):
+
+        registry = MetricsRegistry(Enabled=True)
+        registry.increment(metricFailedFunds)
+
+        with tempfile.TemporaryDirectory() as directoryPath:
+            destinationFilePath = f"{directoryPath}/fund_quotations.prom"
+            with open(destinationFilePath, "w") as metricsFile:
+                metricsFile.write("previous run")
+            registry.savePrometheus(destinationFilePath)
+
+            with open(destinationFilePath, "r") as metricsFile:
+                self.assertEqual(metricsFile.read(), registry.exportPrometheus())
+            self.assertEqual(os.listdir(directoryPath), ["fund_quotations.prom"])
+
+
+if __name__ == "__main__":
+    unittest.main()
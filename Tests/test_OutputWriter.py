@@ -0,0 +1,193 @@
+"""
+.DESCRIPTION
+    Tests of OutputWriter class.
+    Files with unchanged content are kept without creating temporary file,
+    changed or modified files are replaced, hashes are kept in manifest between runs.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import os
+import json
+import hashlib
+import tempfile
+import unittest
+from typing import Callable
+from unittest import mock
+
+# Custom created class modules
+import Dependencies.Class_OutputWriter as Class_OutputWriter
+from Dependencies.Class_OutputWriter import OutputWriter, HashingFile
+
+
+class TestOutputWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.Directory = tempfile.TemporaryDirectory()
+        return None
+
+    def tearDown(self):
+        self.Directory.cleanup()
+        return None
+
+    @staticmethod
+    def getContent(lines: int, text: str = "line") -> Callable[[HashingFile], None]:
+
+        # Content is written in many small pieces, the same as CSV and JSON files
+        def writeContent(file: HashingFile) -> None:
+            for i in range(lines):
+                file.write(f"{text};{i}\n")
+            return None
+
+        return writeContent
+
+    def readFile(self, fileName: str) -> str:
+        with open(f"{self.Directory.name}/{fileName}", "r") as file:
+            return file.read()
+
+    def testWriteNewFile(self):
+
+        writer = OutputWriter(self.Directory.name)
+
+        self.assertTrue(writer.write("A.csv", TestOutputWriter.getContent(3)))
+        self.assertEqual(self.readFile("A.csv"), "line;0\nline;1\nline;2\n")
+        self.assertEqual(
+            writer.Hashes["A.csv"]["Hash"],
+            hashlib.sha256(b"line;0\nline;1\nline;2\n").hexdigest()
+        )
+
+    def testUnchangedFileIsKept(self):
+
+        writer = OutputWriter(self.Directory.name)
+        writer.writeAll({"A.csv": TestOutputWriter.getContent(1000)})
+        modifiedTime = os.stat(f"{self.Directory.name}/A.csv").st_mtime_ns
+
+        # The next run with the same content does not create temporary file nor replace the file
+        writer = OutputWriter(self.Directory.name)
+        with mock.patch.object(
+            Class_OutputWriter.tempfile, "NamedTemporaryFile", side_effect=AssertionError
+        ):
+            self.assertFalse(writer.write("A.csv", TestOutputWriter.getContent(1000)))
+
+        self.assertEqual(os.stat(f"{self.Directory.name}/A.csv").st_mtime_ns, modifiedTime)
+        self.assertEqual(
+            sorted(os.listdir(self.Directory.name)),
+            sorted(["A.csv", OutputWriter.ManifestFileName])
+        )
+
+    def testChangedFileIsReplaced(self):
+
+        writer = OutputWriter(self.Directory.name)
+        writer.writeAll({"A.csv": TestOutputWriter.getContent(3), "B.csv": TestOutputWriter.getContent(3)})
+
+        # Content has changed
+        writer = OutputWriter(self.Directory.name)
+        self.assertEqual(
+            writer.writeAll({"A.csv": TestOutputWriter.getContent(4), "B.csv": TestOutputWriter.getContent(3)}),
+            1
+        )
+        self.assertEqual(self.readFile("A.csv"), "line;0\nline;1\nline;2\nline;3\n")
+
+        # File was modified outside of the program
+        with open(f"{self.Directory.name}/B.csv", "a") as file:
+            file.write("extra\n")
+        writer = OutputWriter(self.Directory.name)
+        self.assertTrue(writer.write("B.csv", TestOutputWriter.getContent(3)))
+        self.assertEqual(self.readFile("B.csv"), "line;0\nline;1\nline;2\n")
+
+        # File was removed
+        os.remove(f"{self.Directory.name}/B.csv")
+        writer = OutputWriter(self.Directory.name)
+        self.assertTrue(writer.write("B.csv", TestOutputWriter.getContent(3)))
+
+    def testContentBiggerThanBuffer(self):
+
+        # Content which is not kept in memory is written again directly to the file
+        writer = OutputWriter(self.Directory.name)
+        with mock.patch.object(OutputWriter, "MaxBufferedSize", 1024):
+            self.assertTrue(writer.write("A.csv", TestOutputWriter.getContent(20000)))
+            self.assertFalse(writer.write("A.csv", TestOutputWriter.getContent(20000)))
+
+        expected = "".join(f"line;{i}\n" for i in range(20000))
+        self.assertEqual(self.readFile("A.csv"), expected)
+        self.assertEqual(writer.Hashes["A.csv"]["Hash"], hashlib.sha256(expected.encode()).hexdigest())
+
+    def testFailedWriteLeavesNoTemporaryFile(self):
+
+        writer = OutputWriter(self.Directory.name)
+        writer.writeAll({"A.csv": TestOutputWriter.getContent(3)})
+
+        # Content cannot be written the second time, when it is streamed to temporary file
+        calls = []
+        def writeContent(file: HashingFile) -> None:
+            calls.append(file)
+            if len(calls) > 1:
+                raise OSError("disk full")
+            TestOutputWriter.getContent(20000)(file)
+            return None
+
+        with mock.patch.object(OutputWriter, "MaxBufferedSize", 1024):
+            with self.assertRaises(OSError):
+                writer.write("A.csv", writeContent)
+
+        # Previous file is kept without temporary files left in the directory
+        self.assertEqual(self.readFile("A.csv"), "line;0\nline;1\nline;2\n")
+        self.assertEqual(
+            sorted(os.listdir(self.Directory.name)),
+            sorted(["A.csv", OutputWriter.ManifestFileName])
+        )
+
+    def testManifest(self):
+
+        writer = OutputWriter(self.Directory.name)
+        writer.writeAll({"A.csv": TestOutputWriter.getContent(3)})
+
+        # Manifest contains hash, size and modification time of each written file
+        with open(f"{self.Directory.name}/{OutputWriter.ManifestFileName}", "r") as manifestFile:
+            manifest = json.loads(manifestFile.read())
+        fileStat = os.stat(f"{self.Directory.name}/A.csv")
+        self.assertEqual(
+            manifest,
+            {
+                "A.csv": {
+                    "Hash": hashlib.sha256(self.readFile("A.csv").encode()).hexdigest(),
+                    "Size": fileStat.st_size,
+                    "ModifiedTime": fileStat.st_mtime_ns
+                }
+            }
+        )
+
+        # Damaged manifest is ignored, so all files are written again
+        with open(f"{self.Directory.name}/{OutputWriter.ManifestFileName}", "w") as manifestFile:
+            manifestFile.write("{")
+        writer = OutputWriter(self.Directory.name)
+        self.assertEqual(writer.Hashes, {})
+        self.assertTrue(writer.write("A.csv", TestOutputWriter.getContent(3)))
+
+    def testWritersOfTheSameDirectory(self):
+
+        # Each writer saves its own files, manifest is never left incomplete
+        writers = [OutputWriter(self.Directory.name) for i in range(3)]
+        for i, writer in enumerate(writers):
+            writer.writeAll({f"{i}.csv": TestOutputWriter.getContent(i + 1)})
+
+        with open(f"{self.Directory.name}/{OutputWriter.ManifestFileName}", "r") as manifestFile:
+            self.assertIn("2.csv", json.loads(manifestFile.read()))
+        self.assertEqual(
+            sorted(os.listdir(self.Directory.name)),
+            sorted(["0.csv", "1.csv", "2.csv", OutputWriter.ManifestFileName])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
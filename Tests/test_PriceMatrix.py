@@ -0,0 +1,161 @@
+"""
+.DESCRIPTION
+    Tests of PriceMatrix class.
+    Prices read out from the matrix have to be the same as nearest prices of each fund quotation.
+    Matrix restricted to the first needed date covers only dates from its first row,
+    extended matrix has to be the same as matrix built from scratch for the same funds and dates.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import datetime
+import unittest
+import numpy as np
+
+# Custom created class modules
+from Dependencies.Class_AnalizyFund import AnalizyFund
+from Dependencies.Class_ListOfFund import ListOfFunds
+from Dependencies.Class_PriceMatrix import PriceMatrix
+from Dependencies.Class_QuotationIndex import QuotationIndex
+
+# Custom created function modules
+from Dependencies.Function_SyntheticData import generateSyntheticQuotation, generateSyntheticFundURL
+
+
+class TestPriceMatrix(unittest.TestCase):
+
+    # Max number of days between date and the nearest quotation
+    DaysLimit = 7
+
+    def setUp(self):
+
+        # Funds with quotation of different length
+        self.Quotations = {
+            fundID: QuotationIndex(generateSyntheticQuotation(fundID, years, seed)["Price"])
+            for fundID, years, seed in [("SYN00001", 3, 0), ("SYN00002", 1, 1), ("SYN00003", 2, 2)]
+        }
+        self.LastDate = datetime.date.today()
+        return None
+
+    def getDateAxis(self, firstDate: datetime.date) -> np.ndarray:
+        return np.arange(firstDate.toordinal(), self.LastDate.toordinal() + 1, dtype=np.int64)
+
+    def assertSameAsQuotation(self, matrix: PriceMatrix, dateAxis: np.ndarray):
+
+        # Price of each fund on each date is the nearest price of its quotation
+        for fund in matrix.getFundIDs():
+            prices, isExact = matrix.getFundPricesOnAxis(fund, dateAxis, TestPriceMatrix.DaysLimit)
+            expected = self.Quotations[fund].getNearestPrices(
+                [datetime.date.fromordinal(int(ordinal)) for ordinal in dateAxis], TestPriceMatrix.DaysLimit
+            )
+            self.assertEqual(
+                [None if np.isnan(price) else float(price) for price in prices], expected, fund
+            )
+            self.assertEqual(
+                isExact.tolist(),
+                [self.Quotations[fund].getPriceOnDate(datetime.date.fromordinal(int(ordinal))) != None for ordinal in dateAxis],
+                fund
+            )
+
+    def assertSameMatrix(self, matrix: PriceMatrix, expected: PriceMatrix):
+        self.assertEqual(matrix.getFundIDs(), expected.getFundIDs())
+        self.assertEqual((matrix.FirstOrdinal, matrix.LastOrdinal), (expected.FirstOrdinal, expected.LastOrdinal))
+        self.assertEqual(matrix.ValidFromOrdinal, expected.ValidFromOrdinal)
+        self.assertTrue(np.array_equal(matrix.Prices, expected.Prices, equal_nan=True))
+        self.assertTrue(np.array_equal(matrix.QuotedOrdinals, expected.QuotedOrdinals))
+
+    def testPricesOfWholeHistory(self):
+
+        matrix = PriceMatrix(self.Quotations, LastDate=self.LastDate)
+        firstDate = datetime.date.fromordinal(self.Quotations["SYN00001"].Ordinals[0]) - datetime.timedelta(days=10)
+
+        self.assertEqual(matrix.FirstOrdinal, self.Quotations["SYN00001"].Ordinals[0])
+        self.assertTrue(matrix.covers(firstDate.toordinal()))
+        self.assertSameAsQuotation(matrix, self.getDateAxis(firstDate))
+
+    def testRowsStartAtFirstDate(self):
+
+        # Rows start at the first needed date, prices before it are forward-filled from earlier quotations
+        firstDate = self.LastDate - datetime.timedelta(days=200)
+        matrix = PriceMatrix(self.Quotations, FirstDate=firstDate, LastDate=self.LastDate)
+
+        self.assertEqual(matrix.FirstOrdinal, firstDate.toordinal())
+        self.assertEqual(len(matrix.Prices), 201)
+        self.assertTrue(matrix.covers(firstDate.toordinal()))
+        self.assertFalse(matrix.covers(firstDate.toordinal() - 1))
+        self.assertSameAsQuotation(matrix, self.getDateAxis(firstDate))
+
+        # Rows start at the first quotation if first date is earlier
+        matrix = PriceMatrix(
+            {"SYN00002": self.Quotations["SYN00002"]},
+            FirstDate=self.LastDate - datetime.timedelta(days=5 * 365),
+            LastDate=self.LastDate
+        )
+        self.assertEqual(matrix.FirstOrdinal, self.Quotations["SYN00002"].Ordinals[0])
+        self.assertTrue(matrix.covers(0))
+
+    def testExtendIsSameAsBuild(self):
+
+        firstDate = self.LastDate - datetime.timedelta(days=100)
+        earlierDate = self.LastDate - datetime.timedelta(days=500)
+        matrix = PriceMatrix({"SYN00001": self.Quotations["SYN00001"]}, FirstDate=firstDate, LastDate=self.LastDate)
+        prices = matrix.Prices.copy()
+
+        # New fund and earlier dates are added, matrix already read out is not changed
+        extended = matrix.extend(
+            {"SYN00002": self.Quotations["SYN00002"], "SYN00003": self.Quotations["SYN00003"]},
+            earlierDate
+        )
+        self.assertIsNot(extended, matrix)
+        self.assertTrue(np.array_equal(matrix.Prices, prices, equal_nan=True))
+        self.assertSameMatrix(extended, PriceMatrix(self.Quotations, FirstDate=earlierDate, LastDate=self.LastDate))
+        self.assertSameAsQuotation(extended, self.getDateAxis(earlierDate))
+
+        # Matrix which already contains funds and dates is not extended
+        self.assertIs(extended.extend({"SYN00002": self.Quotations["SYN00002"]}, firstDate), extended)
+
+        # Without first date matrix is extended to the first quotation of provided funds
+        whole = extended.extend({"SYN00001": self.Quotations["SYN00001"]})
+        self.assertSameMatrix(whole, PriceMatrix(self.Quotations, LastDate=self.LastDate))
+
+    def testExtendWithReplacedQuotation(self):
+
+        matrix = PriceMatrix(self.Quotations, LastDate=self.LastDate)
+
+        # Column of fund with replaced quotation is filled again, other columns are kept
+        self.Quotations["SYN00002"] = QuotationIndex(generateSyntheticQuotation("SYN00002", 1, 7)["Price"])
+        extended = matrix.extend({"SYN00002": self.Quotations["SYN00002"]})
+
+        self.assertSameMatrix(extended, PriceMatrix(self.Quotations, LastDate=self.LastDate))
+
+    def testFundsListMatrix(self):
+
+        # Only funds which quotation is loaded are placed in the matrix without fund IDs, so nothing is downloaded
+        funds = ListOfFunds(
+            [generateSyntheticFundURL(fundID) for fundID in self.Quotations],
+            LatestDetailsSource=AnalizyFund.LatestDetailsFromQuotation
+        )
+        for fundID in ["SYN00001", "SYN00003"]:
+            funds.getFundByID(fundID).setHistoricalQuotation(generateSyntheticQuotation(fundID, 1, 0))
+        self.assertEqual(funds.getPriceMatrix().getFundIDs(), ["SYN00001", "SYN00003"])
+
+        # Matrix requested from the first date is extended with earlier dates, placed funds are kept
+        firstDate = self.LastDate - datetime.timedelta(days=30)
+        matrix = funds.getPriceMatrix(["SYN00003"], firstDate)
+        self.assertEqual(matrix.getFundIDs(), ["SYN00001", "SYN00003"])
+        self.assertIs(funds.getPriceMatrix(["SYN00001"], firstDate), matrix)
+        self.assertFalse(funds.getFundByID("SYN00002").IsHistoricalQuotationLoaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
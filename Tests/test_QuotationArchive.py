@@ -0,0 +1,139 @@
+"""
+.DESCRIPTION
+    Tests of QuotationArchive class.
+    Quotation written to binary archive has to be read out with the same dates, prices and header,
+    date ranges are sliced from mapped file and fund quotation saved to archive is loaded back identical.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import datetime
+import tempfile
+import unittest
+import numpy as np
+
+# Custom created class modules
+from Dependencies.Class_AnalizyFund import AnalizyFund
+from Dependencies.Class_QuotationIndex import QuotationIndex
+from Dependencies.Class_QuotationArchive import QuotationArchive
+
+# Custom created function modules
+from Dependencies.Function_SyntheticData import generateSyntheticQuotation, generateSyntheticFundURL
+
+
+class TestQuotationArchive(unittest.TestCase):
+
+    def setUp(self):
+
+        # Sorted dates and prices of synthetic quotation
+        self.Directory = tempfile.TemporaryDirectory()
+        self.FilePath = f"{self.Directory.name}/FQ_fio_ABC12.bin"
+        self.Quotation = generateSyntheticQuotation("ABC12", 2, 0)
+        index = QuotationIndex(self.Quotation["Price"])
+        self.Ordinals = list(index.Ordinals)
+        self.Prices = list(index.Prices)
+        return None
+
+    def tearDown(self):
+        self.Directory.cleanup()
+        return None
+
+    def testWriteAndRead(self):
+
+        QuotationArchive.write(self.FilePath, "ABC12", "PLN", self.Ordinals, self.Prices)
+
+        with QuotationArchive(self.FilePath) as archive:
+            self.assertEqual(archive.getFundID(), "ABC12")
+            self.assertEqual(archive.getCurrency(), "PLN")
+            self.assertEqual(len(archive), len(self.Ordinals))
+            self.assertEqual(archive.getDates().tolist(), self.Ordinals)
+            self.assertEqual(archive.getPrices().tolist(), self.Prices)
+
+        # Arrays pointing to mapped file are released when archive is closed
+        self.assertEqual(archive.Map, None)
+        self.assertEqual(archive.getDates(), None)
+
+    def testOddNumberOfQuotationsIsAligned(self):
+
+        # Prices have to start at 8 bytes boundary also when number of 4 bytes dates is odd
+        QuotationArchive.write(self.FilePath, "ABC12", "PLN", self.Ordinals[:3], self.Prices[:3])
+
+        with QuotationArchive(self.FilePath) as archive:
+            self.assertEqual(archive.getDates().tolist(), self.Ordinals[:3])
+            self.assertEqual(archive.getPrices().tolist(), self.Prices[:3])
+
+    def testEmptyQuotation(self):
+
+        QuotationArchive.write(self.FilePath, "ABC12", "PLN", [], [])
+
+        with QuotationArchive(self.FilePath) as archive:
+            self.assertEqual(len(archive), 0)
+            self.assertEqual(archive.getDateRange()[0].tolist(), [])
+
+    def testGetDateRange(self):
+
+        QuotationArchive.write(self.FilePath, "ABC12", "PLN", self.Ordinals, self.Prices)
+        startDate = datetime.date.fromordinal(self.Ordinals[10])
+        endDate = datetime.date.fromordinal(self.Ordinals[20])
+
+        with QuotationArchive(self.FilePath) as archive:
+
+            # Limits are inclusive, missing limit means the beginning or the end of the archive
+            dates, prices = archive.getDateRange(startDate, endDate)
+            self.assertEqual(dates.tolist(), self.Ordinals[10:21])
+            self.assertEqual(prices.tolist(), self.Prices[10:21])
+            self.assertEqual(archive.getDateRange(None, endDate)[0].tolist(), self.Ordinals[:21])
+            self.assertEqual(archive.getDateRange(startDate)[0].tolist(), self.Ordinals[10:])
+
+            # Limits between quotations are moved to the nearest quotation inside the range
+            dates, prices = archive.getDateRange(
+                startDate - datetime.timedelta(days=self.Ordinals[10] - self.Ordinals[9] - 1),
+                endDate + datetime.timedelta(days=self.Ordinals[21] - self.Ordinals[20] - 1)
+            )
+            self.assertEqual(dates.tolist(), self.Ordinals[10:21])
+
+            # Slices point to mapped file, data is not copied
+            self.assertFalse(dates.flags.owndata)
+
+    def testNotArchiveFile(self):
+
+        for content in [b"", b"FQAR", b"NOPE" + bytes(QuotationArchive.HeaderSize)]:
+            with self.subTest(content=content):
+                with open(self.FilePath, "wb") as archiveFile:
+                    archiveFile.write(content)
+                with self.assertRaises(ValueError):
+                    QuotationArchive(self.FilePath)
+
+    def testInvalidValuesAreNotWritten(self):
+
+        with self.assertRaises(ValueError):
+            QuotationArchive.write(self.FilePath, "ABC12", "PLN", self.Ordinals, self.Prices[:-1])
+        with self.assertRaises(ValueError):
+            QuotationArchive.write(self.FilePath, "ABC12" * 5, "PLN", self.Ordinals, self.Prices)
+
+    def testFundQuotationRoundTrip(self):
+
+        # Quotation saved by one fund is loaded by another one without any web request
+        fund = AnalizyFund(generateSyntheticFundURL("ABC12"))
+        fund.setHistoricalQuotation(self.Quotation)
+        fund.saveQuotationBIN(self.Directory.name)
+
+        loadedFund = AnalizyFund(generateSyntheticFundURL("ABC12"))
+        loadedFund.loadQuotationArchive(fund.getQuotationArchiveFilePath(self.Directory.name))
+
+        self.assertEqual(loadedFund.getQuotationJSON(), fund.getQuotationJSON())
+        self.assertTrue(np.array_equal(loadedFund.PriceIndex.Positions, fund.PriceIndex.Positions))
+
+
+if __name__ == "__main__":
+    unittest.main()
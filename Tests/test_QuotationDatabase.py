@@ -0,0 +1,91 @@
+"""
+.DESCRIPTION
+    Tests of QuotationDatabase class.
+    Database is tested with the same QuotationStoreTests as file store,
+    additionally committed data has to be available after reopening the database
+    and wallet DayByDay rows saved incrementally have to be the same as saved from scratch.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import unittest
+
+# Custom created class modules
+from Dependencies.Class_QuotationDatabase import QuotationDatabase
+from Tests.test_QuotationStore import QuotationStoreTests
+
+
+class TestQuotationDatabase(QuotationStoreTests, unittest.TestCase):
+
+    def createStore(self, directoryPath: str) -> QuotationDatabase:
+        return QuotationDatabase(f"{directoryPath}/Quotations.db")
+
+    def tearDown(self):
+        self.Store.close()
+        return super().tearDown()
+
+    def testReopenDatabase(self):
+
+        # Committed quotations are available after the database is opened again
+        self.Store.update("ABC12", "PLN", self.Ordinals, self.Prices)
+        self.Store.close()
+        self.Store = self.createStore(self.Directory.name)
+
+        self.assertStored("PLN", self.Ordinals, self.Prices)
+
+    def getWalletRows(self, days: int, valueShift: float = 0) -> list[list[str | float]]:
+        return [
+            [f"2024-01-{day:02d}", 1000.0 + day + valueShift, 1000.0]
+            for day in range(1, days + 1)
+        ]
+
+    def testWalletDaysIncrementalSave(self):
+
+        headers = ["Date", "Value", "Invested Money"]
+
+        # The first run saves all rows, rows until 2024-01-10 will not change anymore
+        self.Store.saveWalletDays("Wallet", headers, self.getWalletRows(12), "hash", "2024-01-10")
+        self.assertEqual(self.Store.getWalletLastFinalDate("Wallet", headers, "hash"), "2024-01-10")
+
+        # Rows are kept only for the same order book and columns
+        self.assertEqual(self.Store.getWalletLastFinalDate("Wallet", headers, "other"), None)
+        self.assertEqual(self.Store.getWalletLastFinalDate("Wallet", headers[:2], "hash"), None)
+        self.assertEqual(self.Store.getWalletLastFinalDate("Other", headers, "hash"), None)
+
+        # The next run saves only rows after the last final date,
+        # rows after it saved by previous run are replaced
+        rows = self.getWalletRows(10) + self.getWalletRows(15, valueShift=0.5)[10:]
+        keptUntilDate = self.Store.getWalletLastFinalDate("Wallet", headers, "hash")
+        self.Store.saveWalletDays(
+            "Wallet", headers, [row for row in rows if row[0] > keptUntilDate],
+            "hash", "2024-01-15", keptUntilDate
+        )
+
+        # Result is the same as saved from scratch
+        self.assertEqual(
+            [self.Store.loadWalletDays("Wallet").getRowValues(i) for i in range(15)],
+            rows
+        )
+        self.assertEqual(
+            self.Store.getWalletValues("Wallet"),
+            [tuple(row) for row in rows]
+        )
+
+        # Without kept date all rows are replaced, e.g. when order book has changed
+        self.Store.saveWalletDays("Wallet", headers, self.getWalletRows(3), "other", "2024-01-03")
+        self.assertEqual(len(self.Store.loadWalletDays("Wallet")), 3)
+        self.assertEqual(self.Store.getWalletLastFinalDate("Wallet", headers, "other"), "2024-01-03")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+.DESCRIPTION
+    Tests of QuotationIndex class.
+    Exact date lookups are compared with lookups done in dictionary of the same quotation,
+    as-of lookups read out from dense array of positions are compared
+    with lookups done by binary search over the same quotation.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import bisect
+import random
+import datetime
+import unittest
+import numpy as np
+from array import array
+
+# Custom created class modules
+from Dependencies.Class_QuotationIndex import QuotationIndex
+
+# Custom created variables modules
+from Dependencies.Variables_API import *
+
+
+class TestQuotationIndex(unittest.TestCase):
+
+    def setUp(self):
+
+        # Quotation with gaps of different length, including gaps longer than default days limit
+        generator = random.Random(0)
+        currentDate = datetime.date(2023, 1, 2)
+        self.Quotations = []
+        for i in range(400):
+            self.Quotations.append(
+                {
+                    analizyplAPIresponse_QuotationDate: currentDate.isoformat(),
+                    analizyplAPIresponse_QuotationValue: round(generator.uniform(10, 500), 2)
+                }
+            )
+            currentDate += datetime.timedelta(days=generator.choice([1, 1, 1, 3, 4, 12]))
+
+        self.Ordinals = [
+            datetime.date.fromisoformat(item[analizyplAPIresponse_QuotationDate]).toordinal()
+            for item in self.Quotations
+        ]
+        self.Prices = [item[analizyplAPIresponse_QuotationValue] for item in self.Quotations]
+
+        return None
+
+    def getExpectedNearestPrice(self, date: datetime.date, daysLimit: int) -> float | None:
+
+        # Last quotation on or before the date found with binary search
+        position = bisect.bisect_right(self.Ordinals, date.toordinal()) - 1
+        if position < 0 or date.toordinal() - self.Ordinals[position] > daysLimit:
+            return None
+
+        return self.Prices[position]
+
+    def getLookupDates(self) -> list[datetime.date]:
+
+        # Each day of the quotation and some days before and after it
+        return [
+            datetime.date.fromordinal(ordinal)
+            for ordinal in range(self.Ordinals[0] - 10, self.Ordinals[-1] + 20)
+        ]
+
+    def testExactLookup(self):
+
+        index = QuotationIndex(self.Quotations)
+        prices = dict(zip(self.Ordinals, self.Prices))
+
+        for date in self.getLookupDates():
+            self.assertEqual(index.getPriceOnDate(date), prices.get(date.toordinal()))
+            self.assertEqual(index.getPriceOnDate(date.isoformat()), prices.get(date.toordinal()))
+
+    def testNearestLookup(self):
+
+        index = QuotationIndex(self.Quotations)
+
+        for daysLimit in [0, 3, QuotationIndex.DefaultDaysLimit, 30]:
+            dates = self.getLookupDates()
+            self.assertEqual(
+                index.getNearestPrices(dates, daysLimit),
+                [self.getExpectedNearestPrice(date, daysLimit) for date in dates]
+            )
+
+    def testUnsortedQuotation(self):
+
+        # Entries received in random order are indexed the same as sorted ones
+        shuffled = list(self.Quotations)
+        random.Random(1).shuffle(shuffled)
+        index = QuotationIndex(shuffled)
+
+        self.assertEqual(list(index.Ordinals), self.Ordinals)
+        self.assertEqual(list(index.Prices), self.Prices)
+        for date in self.getLookupDates():
+            self.assertEqual(
+                index.getNearestPrice(date),
+                self.getExpectedNearestPrice(date, QuotationIndex.DefaultDaysLimit)
+            )
+
+    def testDuplicatedAndInvalidEntries(self):
+
+        # The first price of the date returned more than once is kept, invalid entries are skipped
+        quotations = [
+            {analizyplAPIresponse_QuotationDate: "2024-01-02", analizyplAPIresponse_QuotationValue: 10.5},
+            {analizyplAPIresponse_QuotationDate: "2024-01-03", analizyplAPIresponse_QuotationValue: 11.0},
+            {analizyplAPIresponse_QuotationDate: "2024-01-03", analizyplAPIresponse_QuotationValue: 99.0},
+            {analizyplAPIresponse_QuotationDate: "2024-01-04", analizyplAPIresponse_QuotationValue: None},
+            {analizyplAPIresponse_QuotationDate: "not a date", analizyplAPIresponse_QuotationValue: 1.0},
+            {analizyplAPIresponse_QuotationValue: 1.0},
+            {analizyplAPIresponse_QuotationDate: "2024-01-08", analizyplAPIresponse_QuotationValue: "12.25"}
+        ]
+        index = QuotationIndex(quotations)
+
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.getPriceOnDate("2024-01-03"), 11.0)
+        self.assertEqual(index.getPriceOnDate("2024-01-04"), None)
+        self.assertEqual(index.getNearestPrice(datetime.date(2024, 1, 7)), 11.0)
+        self.assertEqual(index.getPriceOnDate("2024-01-08"), 12.25)
+        self.assertEqual(index.getLastDate(), datetime.date(2024, 1, 8))
+
+    def testInvalidDateFormat(self):
+
+        # Date in format other than "yyyy-MM-dd" has no quotation
+        index = QuotationIndex(self.Quotations)
+
+        self.assertEqual(index.getPriceOnDate("02.01.2023"), None)
+        self.assertEqual(index.getPriceOnDate("2023-13-45"), None)
+        self.assertEqual(index.getPriceOnDate(""), None)
+        self.assertEqual(index.getPriceOnDate(None), None)
+
+    def testFromArrays(self):
+
+        # Index created from lists, stored arrays or archive numpy arrays answers the same
+        # as index created from entries and keeps prices in compact arrays
+        expected = QuotationIndex(self.Quotations)
+        sources = {
+            "list": (self.Ordinals, self.Prices),
+            "array": (array("l", self.Ordinals), array("d", self.Prices)),
+            "numpy": (np.asarray(self.Ordinals, dtype="<i4"), np.asarray(self.Prices, dtype="<f8"))
+        }
+        for source, (ordinals, prices) in sources.items():
+            with self.subTest(source=source):
+                index = QuotationIndex.fromArrays(ordinals, prices)
+
+                self.assertIsInstance(index.Ordinals, array)
+                self.assertIsInstance(index.Prices, array)
+                self.assertEqual(index.getQuotations(), expected.getQuotations())
+                for date in self.getLookupDates():
+                    self.assertEqual(index.getNearestPrice(date), expected.getNearestPrice(date))
+
+    def testSingleQuotation(self):
+
+        index = QuotationIndex.fromArrays([datetime.date(2024, 1, 2).toordinal()], [10.5])
+
+        self.assertEqual(list(index.Positions), [0])
+        self.assertEqual(index.getPriceOnDate("2024-01-02"), 10.5)
+        self.assertEqual(index.getNearestPrice(datetime.date(2024, 1, 9)), 10.5)
+        self.assertEqual(index.getNearestPrice(datetime.date(2024, 1, 10)), None)
+        self.assertEqual(index.getNearestPrice(datetime.date(2024, 1, 1)), None)
+
+    def testEmptyIndex(self):
+
+        index = QuotationIndex([])
+
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.getPriceOnDate("2024-01-02"), None)
+        self.assertEqual(index.getNearestPrice(datetime.date(2024, 1, 2)), None)
+
+
+if __name__ == "__main__":
+    unittest.main()
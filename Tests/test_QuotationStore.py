@@ -0,0 +1,175 @@
+"""
+.DESCRIPTION
+    Tests of QuotationStore class.
+    Store is updated with downloaded quotations and has to return the same history:
+    new quotations are appended, changed history is replaced.
+    Tests are defined in QuotationStoreTests mixin, so they can be run for each local store class.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+# Custom created class modules
+from Dependencies.Class_QuotationStore import QuotationStore
+from Dependencies.Class_QuotationIndex import QuotationIndex
+
+# Custom created function modules
+from Dependencies.Function_SyntheticData import generateSyntheticQuotation
+
+
+class QuotationStoreTests:
+
+    # Tests shared by all stores, each subclass creates its own store in temporary directory
+    def createStore(self, directoryPath: str):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.Directory = tempfile.TemporaryDirectory()
+        self.Store = self.createStore(self.Directory.name)
+        index = QuotationIndex(generateSyntheticQuotation("ABC12", 1, 0)["Price"])
+        self.Ordinals = index.Ordinals
+        self.Prices = index.Prices
+        return None
+
+    def tearDown(self):
+        self.Directory.cleanup()
+        return None
+
+    def assertStored(self, currency: str, ordinals, prices):
+        self.assertEqual(
+            self.Store.load("ABC12"),
+            {"FundID": "ABC12", "Currency": currency, "Ordinals": ordinals, "Prices": prices}
+        )
+
+    def testUpdateNewFund(self):
+
+        self.assertFalse(self.Store.hasQuotation("ABC12"))
+        self.assertEqual(self.Store.load("ABC12"), None)
+        self.assertEqual(self.Store.loadTail("ABC12"), None)
+
+        self.assertEqual(self.Store.update("ABC12", "PLN", self.Ordinals, self.Prices), (self.Ordinals, self.Prices))
+        self.assertTrue(self.Store.hasQuotation("ABC12"))
+        self.assertStored("PLN", self.Ordinals, self.Prices)
+        self.assertEqual(
+            self.Store.loadTail("ABC12"),
+            {
+                "FundID": "ABC12",
+                "Currency": "PLN",
+                "FirstDate": self.Ordinals[0],
+                "LastDate": self.Ordinals[-1],
+                "LastPrice": self.Prices[-1]
+            }
+        )
+
+    def testAppendNewQuotations(self):
+
+        # Stored history is extended with quotations newer than the last stored one,
+        # even if downloaded list does not contain the oldest stored quotations
+        self.Store.update("ABC12", "PLN", self.Ordinals[:-10], self.Prices[:-10])
+        self.assertEqual(
+            QuotationStore.countNewQuotations(
+                self.Store.loadTail("ABC12"), "PLN", self.Ordinals[50:], self.Prices[50:]
+            ),
+            10
+        )
+        self.assertEqual(
+            self.Store.update("ABC12", "PLN", self.Ordinals[50:], self.Prices[50:]),
+            (self.Ordinals, self.Prices)
+        )
+        self.assertStored("PLN", self.Ordinals, self.Prices)
+
+        # Nothing is changed if there are no new quotations
+        self.assertEqual(
+            self.Store.update("ABC12", "PLN", self.Ordinals[-5:], self.Prices[-5:]),
+            (self.Ordinals, self.Prices)
+        )
+        self.assertStored("PLN", self.Ordinals, self.Prices)
+
+    def testDownloadedHistoryIsNotReadFromStore(self):
+
+        # Downloaded list covering whole stored history is returned without reading out stored quotations
+        self.Store.update("ABC12", "PLN", self.Ordinals[:-10], self.Prices[:-10])
+        with mock.patch.object(self.Store, "load", side_effect=AssertionError("load called")):
+            ordinals, prices = self.Store.update("ABC12", "PLN", self.Ordinals, self.Prices)
+
+        self.assertIs(ordinals, self.Ordinals)
+        self.assertIs(prices, self.Prices)
+        self.assertStored("PLN", self.Ordinals, self.Prices)
+
+    def testReplaceChangedHistory(self):
+
+        self.Store.update("ABC12", "PLN", self.Ordinals, self.Prices)
+
+        # Price of the last stored date has changed
+        changed = self.Prices[:]
+        changed[-1] += 1
+        self.assertEqual(self.Store.update("ABC12", "PLN", self.Ordinals, changed), (self.Ordinals, changed))
+        self.assertStored("PLN", self.Ordinals, changed)
+
+        # Currency has changed
+        self.assertEqual(self.Store.update("ABC12", "EUR", self.Ordinals, self.Prices), (self.Ordinals, self.Prices))
+        self.assertStored("EUR", self.Ordinals, self.Prices)
+
+        # The last stored date is missing in downloaded list
+        self.Store.update("ABC12", "EUR", self.Ordinals[:-3], self.Prices[:-3])
+        self.assertStored("EUR", self.Ordinals[:-3], self.Prices[:-3])
+
+    def testLatestDetails(self):
+
+        details = {"Price": "101,25", "Currency": "PLN", "UpdateDate": "2024-01-02"}
+        self.Store.update("ABC12", "PLN", self.Ordinals, self.Prices)
+        self.Store.saveLatestDetails("ABC12", details)
+
+        self.assertTrue(self.Store.hasLatestDetails("ABC12"))
+        self.assertEqual(self.Store.loadLatestDetails("ABC12"), details)
+
+
+class TestQuotationStore(QuotationStoreTests, unittest.TestCase):
+
+    def createStore(self, directoryPath: str) -> QuotationStore:
+        return QuotationStore(directoryPath)
+
+    def testPartiallyWrittenLastLine(self):
+
+        # Append interrupted in the middle of the line
+        self.Store.update("ABC12", "PLN", self.Ordinals[:-10], self.Prices[:-10])
+        with open(self.Store.getFilePath("ABC12"), "a") as storeFile:
+            storeFile.write('["2024-')
+
+        # Partial line is skipped when file is loaded and file cannot be continued, so it is rewritten
+        self.assertStored("PLN", self.Ordinals[:-10], self.Prices[:-10])
+        self.assertEqual(self.Store.loadTail("ABC12"), None)
+        self.Store.update("ABC12", "PLN", self.Ordinals[50:], self.Prices[50:])
+        self.assertStored("PLN", self.Ordinals[50:], self.Prices[50:])
+
+    def testFailedRewriteKeepsStoredFile(self):
+
+        self.Store.update("ABC12", "PLN", self.Ordinals, self.Prices)
+        changed = self.Prices[:]
+        changed[-1] += 1
+
+        # Stored file is replaced only when the new one was written completely
+        with mock.patch.object(QuotationStore, "writeQuotations", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.Store.update("ABC12", "PLN", self.Ordinals, changed)
+
+        self.assertStored("PLN", self.Ordinals, self.Prices)
+        self.assertEqual(os.listdir(self.Directory.name), ["ABC12.jsonl"])
+
+
+if __name__ == "__main__":
+    unittest.main()
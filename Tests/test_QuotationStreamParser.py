@@ -0,0 +1,153 @@
+"""
+.DESCRIPTION
+    Tests of QuotationStreamParser class.
+    Response is split into chunks at different positions (including single bytes and positions
+    inside multi-byte characters, numbers, literals and strings) and parsed entries are compared
+    with the response decoded at once with json module.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import json
+import random
+import unittest
+
+# Custom created class modules
+from Dependencies.Class_QuotationIndex import QuotationIndex
+from Dependencies.Class_QuotationStreamParser import QuotationStreamParser
+
+# Custom created variables modules
+from Dependencies.Variables_API import *
+
+
+class TestQuotationStreamParser(unittest.TestCase):
+
+    def setUp(self):
+
+        # Response with values which are skipped before and after quotation entries,
+        # nested containers, escaped and multi-byte characters, literals and numbers in different notation
+        self.Response = {
+            "name": "Fundusz Żółty \"Akcji\" \\ €",
+            "flags": [True, False, None, [], {}],
+            analizyplAPIresponse_ID: "ABC12",
+            "limits": {"min": -1.5e-3, "max": 12345678901234567890, "price": [{"date": "2000-01-01"}]},
+            analizyplAPIresponse_Currency: "PLN",
+            analizyplAPIresponse_QuotationDetails: [
+                {
+                    "type": "price",
+                    analizyplAPIresponse_QuotationList: [
+                        {analizyplAPIresponse_QuotationDate: "2024-01-02", analizyplAPIresponse_QuotationValue: 101.25},
+                        {analizyplAPIresponse_QuotationDate: "2024-01-03", analizyplAPIresponse_QuotationValue: 1e2},
+                        {analizyplAPIresponse_QuotationDate: "2024-01-04", analizyplAPIresponse_QuotationValue: -0.5},
+                        {analizyplAPIresponse_QuotationDate: "2024-01-05", analizyplAPIresponse_QuotationValue: None},
+                        {analizyplAPIresponse_QuotationDate: "2024-01-08", analizyplAPIresponse_QuotationValue: 7},
+                        {analizyplAPIresponse_QuotationDate: "2024-01-09", analizyplAPIresponse_QuotationValue: 99.123456789}
+                    ],
+                    "comment": "ąęść"
+                },
+                {
+                    analizyplAPIresponse_QuotationList: [
+                        {analizyplAPIresponse_QuotationDate: "1999-01-01", analizyplAPIresponse_QuotationValue: 1.0}
+                    ]
+                }
+            ],
+            "tail": "end"
+        }
+
+        return None
+
+    def getBodies(self) -> list[bytes]:
+
+        # The same response without whitespaces, with default separators and pretty-printed
+        return [
+            json.dumps(self.Response, separators=(",", ":"), ensure_ascii=False).encode(),
+            json.dumps(self.Response, ensure_ascii=False).encode(),
+            json.dumps(self.Response, indent="\t").encode()
+        ]
+
+    def assertParsed(self, body: bytes, chunks: list[bytes]) -> None:
+
+        parser = QuotationStreamParser()
+        entries = list(parser.parse(chunks))
+        expected = json.loads(body)
+
+        self.assertEqual(b"".join(chunks), body)
+        self.assertEqual(entries, expected[analizyplAPIresponse_QuotationDetails][0][analizyplAPIresponse_QuotationList])
+        self.assertEqual(parser.getFundID(), expected[analizyplAPIresponse_ID])
+        self.assertEqual(parser.getCurrency(), expected[analizyplAPIresponse_Currency])
+        self.assertEqual(parser.getCount(), len(entries))
+
+        return None
+
+    def testSingleChunk(self):
+
+        for body in self.getBodies():
+            self.assertParsed(body, [body])
+
+    def testSingleByteChunks(self):
+
+        for body in self.getBodies():
+            self.assertParsed(body, [body[i:i + 1] for i in range(len(body))])
+
+    def testEachSplitPosition(self):
+
+        # Response split into 2 chunks at each possible position
+        for body in self.getBodies():
+            for position in range(len(body) + 1):
+                self.assertParsed(body, [body[:position], body[position:]])
+
+    def testRandomSplits(self):
+
+        generator = random.Random(0)
+        for body in self.getBodies():
+            for i in range(200):
+                positions = sorted(generator.sample(range(1, len(body)), generator.randint(1, 30)))
+                self.assertParsed(
+                    body,
+                    [body[start:end] for start, end in zip([0] + positions, positions + [len(body)])]
+                )
+
+    def testLazyIndexing(self):
+
+        # Index built from parsed entries is the same as built from decoded response
+        body = self.getBodies()[0]
+        index = QuotationIndex(QuotationStreamParser().parse([body[i:i + 7] for i in range(0, len(body), 7)]))
+        expected = QuotationIndex(
+            json.loads(body)[analizyplAPIresponse_QuotationDetails][0][analizyplAPIresponse_QuotationList]
+        )
+
+        self.assertEqual(index.getQuotations(), expected.getQuotations())
+
+    def testIncompleteResponse(self):
+
+        # Response cut at any position is not accepted
+        body = self.getBodies()[0]
+        for position in range(len(body)):
+            with self.assertRaises(ValueError):
+                list(QuotationStreamParser().parse([body[:position]]))
+
+    def testInvalidResponse(self):
+
+        for body in [
+            b'{"id": "ABC12", "currency": "PLN"} {}',
+            b'{"id": "ABC12" "currency": "PLN"}',
+            b'{"id": "ABC12", "currency": "PLN", "series": [{"price": [{"date": "2024-01-02"} {}]}]}',
+            b'{"id": "ABC12"}',
+            b'{"id": "ABC12", "currency": "PLN", 1: 2}'
+        ]:
+            with self.assertRaises(ValueError):
+                list(QuotationStreamParser().parse([body]))
+
+
+if __name__ == "__main__":
+    unittest.main()
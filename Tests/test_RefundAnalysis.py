@@ -0,0 +1,198 @@
+"""
+.DESCRIPTION
+    Tests of RefundAnalysis class.
+    Prices read out from PriceMatrix and from concatenated quotations of all funds have to give
+    the same analysis, which has to be identical as AnalizyFund.getRefundAnalysis calculated for each fund.
+    Refund of payment periods is compared with values calculated by hand.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import datetime
+import unittest
+
+# Custom created class modules
+from Dependencies.Class_AnalizyFund import AnalizyFund
+from Dependencies.Class_ListOfFund import ListOfFunds
+from Dependencies.Class_RefundAnalysis import RefundAnalysis
+
+# Custom created function modules
+from Dependencies.Function_SyntheticData import (
+    generateSyntheticFundURL,
+    generateSyntheticQuotation,
+    generateSyntheticInvestments
+)
+
+# Custom created variables modules
+from Dependencies.Variables_API import *
+
+
+class TestRefundAnalysis(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        # Create list of funds from synthetic quotations without downloading any data
+        quotations = {
+            fundID: generateSyntheticQuotation(fundID, 3, 0)
+            for fundID in ["SYN00001", "SYN00002", "SYN00003", "SYN00004"]
+        }
+        cls.Funds = ListOfFunds(
+            [generateSyntheticFundURL(fundID) for fundID in quotations],
+            LatestDetailsSource=AnalizyFund.LatestDetailsFromQuotation
+        )
+        for fundID in quotations:
+            cls.Funds.getFundByID(fundID).setHistoricalQuotation(quotations[fundID])
+
+        # Investments with orders on quotation dates and with orders on any day of the week
+        cls.Investments = {
+            name: investment["Funds"]
+            for name, investment in generateSyntheticInvestments(quotations, 40, 3, 4, 1).items()
+        }
+        firstDate = datetime.date.fromisoformat(quotations["SYN00001"]["Price"][0][analizyplAPIresponse_QuotationDate])
+        for i in range(20):
+            cls.Investments[f"Weekend_{i}"] = {
+                "SYN00002": [
+                    {"BuyDate": (firstDate + datetime.timedelta(days=30 + i * 37 + day)).isoformat(), "Money": 1000}
+                    for day in [0, 5, 6]
+                ]
+            }
+
+        # Order before the first quotation of the fund cannot be analysed
+        cls.Investments["BeforeFirstQuotation"] = {
+            "SYN00003": [{"BuyDate": (firstDate - datetime.timedelta(days=30)).isoformat(), "Money": 1000}]
+        }
+
+        return None
+
+    def getAnalysis(self, fundsPriceMatrix=None) -> dict[str, dict[str, dict[str, float | str]] | None]:
+
+        analysis = RefundAnalysis(FundsPriceMatrix=fundsPriceMatrix)
+        for name, details in self.Investments.items():
+            analysis.addInvestment(
+                name, details, {fund: self.Funds.getFundByID(fund) for fund in details}
+            )
+
+        # Fund which is not loaded makes analysis of the investment invalid
+        analysis.addInvestment("MissingFund", {"SYN00009": [{"BuyDate": "2024-01-02", "Money": 1}]}, {})
+
+        return analysis.calculate()
+
+    def getExpectedAnalysis(self, details: dict[str, list[dict[str, float | str]]]) -> dict[str, dict[str, float | str]] | None:
+
+        # Analysis of each fund calculated separately from its payment periods
+        results = {}
+        for fund, orders in details.items():
+            fundQuotation = self.Funds.getFundByID(fund)
+            paymentPeriods = [
+                {
+                    "startDate": datetime.date.fromisoformat(order["BuyDate"]),
+                    "endDate": (
+                        datetime.date.fromisoformat(orders[i + 1]["BuyDate"])
+                        if i + 1 < len(orders) else fundQuotation.getLastQuotationDate()
+                    ),
+                    "InvestedMoney": order["Money"]
+                }
+                for i, order in enumerate(orders)
+            ]
+            results[fund] = fundQuotation.getRefundAnalysis(paymentPeriods)
+            if results[fund] == None:
+                return None
+
+        return results
+
+    def testPriceMatrixAndQuotationLookupAreEqual(self):
+
+        withMatrix = self.getAnalysis(self.Funds.getPriceMatrix())
+        withoutMatrix = self.getAnalysis()
+
+        self.assertEqual(withMatrix, withoutMatrix)
+
+    def testPriceMatrixOfOtherQuotationIsNotUsed(self):
+
+        # Matrix built from different quotation index of the fund is not valid for the analysis
+        fund = AnalizyFund(generateSyntheticFundURL("SYN00001"))
+        fund.setHistoricalQuotation(generateSyntheticQuotation("SYN00001", 3, 5))
+        details = {"SYN00001": self.Investments["Weekend_0"]["SYN00002"]}
+
+        withMatrix = RefundAnalysis(FundsPriceMatrix=self.Funds.getPriceMatrix())
+        withMatrix.addInvestment("Other", details, {"SYN00001": fund})
+        withoutMatrix = RefundAnalysis()
+        withoutMatrix.addInvestment("Other", details, {"SYN00001": fund})
+
+        self.assertFalse(withMatrix.isPriceMatrixValid())
+        self.assertEqual(withMatrix.calculate(), withoutMatrix.calculate())
+
+    def testSameAsAnalysisOfEachFund(self):
+
+        results = self.getAnalysis(self.Funds.getPriceMatrix())
+
+        self.assertEqual(results["BeforeFirstQuotation"], None)
+        self.assertEqual(results["MissingFund"], None)
+
+        for name, details in self.Investments.items():
+            expected = self.getExpectedAnalysis(details)
+            if expected == None:
+                self.assertEqual(results[name], None, name)
+                continue
+
+            self.assertEqual(results[name], expected, name)
+
+    def testPaymentPeriodsRefund(self):
+
+        # Price grows from 10 to 11 in the first period and from 11 to 13.2 in the second one
+        fund = AnalizyFund(generateSyntheticFundURL("ABC12"))
+        fund.setHistoricalQuotation(
+            {
+                "FundID": "ABC12",
+                "Currency": "PLN",
+                "Price": [
+                    {analizyplAPIresponse_QuotationDate: "2024-01-01", analizyplAPIresponse_QuotationValue: 10.0},
+                    {analizyplAPIresponse_QuotationDate: "2024-01-11", analizyplAPIresponse_QuotationValue: 11.0},
+                    {analizyplAPIresponse_QuotationDate: "2024-01-31", analizyplAPIresponse_QuotationValue: 13.2}
+                ]
+            }
+        )
+        analysis = fund.getRefundAnalysis(
+            [
+                {"startDate": datetime.date(2024, 1, 1), "endDate": datetime.date(2024, 1, 11), "InvestedMoney": 100},
+                {"startDate": datetime.date(2024, 1, 11), "endDate": datetime.date(2024, 1, 31), "InvestedMoney": 110}
+            ]
+        )
+
+        # 10 units for 9 days with 10% refund, 20 units for 19 days with 20% refund
+        refund = (9 * 10 * 10 + 19 * 20 * 20) / (9 * 10 + 19 * 20)
+        self.assertEqual(analysis["FundID"], "ABC12")
+        self.assertAlmostEqual(analysis["Refund_%"], refund, places=9)
+        self.assertAlmostEqual(analysis["RefundPerDay_%"], refund / 28, places=9)
+        self.assertAlmostEqual(analysis["RefundYearly_%"], refund / 28 * 365, places=9)
+
+        # Period without price and fund without quotation are not analysed
+        emptyFund = AnalizyFund(generateSyntheticFundURL("XYZ34"))
+        emptyFund.setHistoricalQuotation({"FundID": "XYZ34", "Currency": "PLN", "Price": []})
+        self.assertEqual(
+            emptyFund.getRefundAnalysis(
+                [{"startDate": datetime.date(2024, 1, 1), "endDate": datetime.date(2024, 1, 11), "InvestedMoney": 100}]
+            ),
+            None
+        )
+        self.assertEqual(
+            fund.getRefundAnalysis(
+                [{"startDate": datetime.date(2023, 12, 1), "endDate": datetime.date(2024, 1, 11), "InvestedMoney": 100}]
+            ),
+            None
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+.DESCRIPTION
+    Tests of SharedPriceMatrix class.
+    Matrix placed in shared memory and attached by other process has to return the same prices
+    as the matrix it was created from, attached matrix can be only read out.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import unittest
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+# Custom created class modules
+from Dependencies.Class_PriceMatrix import PriceMatrix
+from Dependencies.Class_QuotationIndex import QuotationIndex
+from Dependencies.Class_SharedPriceMatrix import SharedPriceMatrix
+from Dependencies.Class_InvestmentWallet import InvestmentWallet
+
+# Custom created function modules
+from Dependencies.Function_SyntheticData import generateSyntheticQuotation
+
+
+# Function invoked in worker process to read out prices from attached matrix
+def getSharedNearestPrices(handle: dict[str, any], fundID: str, ordinals: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    with SharedPriceMatrix.attach(handle) as sharedMatrix:
+        prices, isExact = sharedMatrix.getPriceMatrix().getFundPricesOnAxis(fundID, ordinals, 7)
+        return prices.copy(), isExact.copy()
+
+
+class TestSharedPriceMatrix(unittest.TestCase):
+
+    def setUp(self):
+
+        # Matrix of funds with quotations of different length
+        self.Matrix = PriceMatrix(
+            {
+                fundID: QuotationIndex(generateSyntheticQuotation(fundID, years, 0)["Price"])
+                for fundID, years in [("SYN00001", 3), ("SYN00002", 1), ("SYN00003", 2)]
+            }
+        )
+        self.Ordinals = np.arange(self.Matrix.FirstOrdinal - 10, self.Matrix.LastOrdinal + 10, dtype=np.int64)
+
+        return None
+
+    def testRoundTrip(self):
+
+        with SharedPriceMatrix.create(self.Matrix) as sharedMatrix:
+            with SharedPriceMatrix.attach(sharedMatrix.getHandle()) as attachedMatrix:
+                matrix = attachedMatrix.getPriceMatrix()
+
+                self.assertEqual(matrix.getFundIDs(), self.Matrix.getFundIDs())
+                self.assertEqual(matrix.FirstOrdinal, self.Matrix.FirstOrdinal)
+                self.assertEqual(matrix.LastOrdinal, self.Matrix.LastOrdinal)
+                np.testing.assert_array_equal(matrix.Prices, self.Matrix.Prices)
+                np.testing.assert_array_equal(matrix.QuotedOrdinals, self.Matrix.QuotedOrdinals)
+
+                # Attached matrix can be only read out
+                with self.assertRaises(ValueError):
+                    matrix.Prices[0, 0] = 1.0
+
+    def testWorkerProcess(self):
+
+        # Worker processes are started in the same way as by InvestmentWallet
+        with SharedPriceMatrix.create(self.Matrix) as sharedMatrix:
+            with ProcessPoolExecutor(max_workers=1, mp_context=InvestmentWallet.getWorkerContext()) as executor:
+                for fundID in self.Matrix.getFundIDs():
+                    prices, isExact = executor.submit(
+                        getSharedNearestPrices, sharedMatrix.getHandle(), fundID, self.Ordinals
+                    ).result()
+                    expectedPrices, expectedIsExact = self.Matrix.getFundPricesOnAxis(fundID, self.Ordinals, 7)
+
+                    np.testing.assert_array_equal(prices, expectedPrices)
+                    np.testing.assert_array_equal(isExact, expectedIsExact)
+
+            # Memory blocks are not removed when worker process ends, only by the owner
+            with SharedPriceMatrix.attach(sharedMatrix.getHandle()) as attachedMatrix:
+                np.testing.assert_array_equal(attachedMatrix.getPriceMatrix().Prices, self.Matrix.Prices)
+
+        with self.assertRaises(FileNotFoundError):
+            SharedPriceMatrix.attach(sharedMatrix.getHandle())
+
+    def testWorkerContext(self):
+
+        # Worker processes are not forked from the main process
+        self.assertIn(InvestmentWallet.getWorkerContext().get_start_method(), InvestmentWallet.WorkerStartMethods)
+
+    def testMemoryIsRemovedByOwner(self):
+
+        sharedMatrix = SharedPriceMatrix.create(self.Matrix)
+        handle = sharedMatrix.getHandle()
+        sharedMatrix.close()
+
+        with self.assertRaises(FileNotFoundError):
+            SharedPriceMatrix.attach(handle)
+
+
+if __name__ == "__main__":
+    unittest.main()
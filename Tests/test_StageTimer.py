@@ -0,0 +1,144 @@
+"""
+.DESCRIPTION
+    Tests of StageTimer class.
+    Stages and items are measured with labels provided at the beginning and added during the stage,
+    disabled timer does not collect anything, slowest stage is saved with its profile and report in JSON file.
+
+.NOTES
+
+    Version:            1.0
+    Author:             Stanisław Horna
+    Mail:               stanislawhorna@outlook.com
+    GitHub Repository:  https://github.com/StanislawHornaGitHub/Investment_fund_quotations
+    Creation Date:      17-Oct-2026
+    ChangeLog:
+
+    Date            Who                     What
+
+"""
+# Official and 3-rd party imports
+import json
+import time
+import pstats
+import tempfile
+import unittest
+import threading
+
+# Custom created class modules
+from Dependencies.Class_StageTimer import StageTimer
+
+
+class TestStageTimer(unittest.TestCase):
+
+    def testStagesAreMeasuredWithLabels(self):
+
+        timer = StageTimer()
+        with timer.measure("Download", Funds="2") as measurement:
+            time.sleep(0.02)
+            measurement["Failed"] = 0
+        with timer.measure("DayByDay"):
+            pass
+
+        stages = timer.getStages()
+        self.assertEqual([stage["Stage"] for stage in stages], ["Download", "DayByDay"])
+        self.assertEqual(stages[0]["Funds"], "2")
+        self.assertEqual(stages[0]["Failed"], 0)
+        self.assertGreaterEqual(stages[0]["WallSeconds"], 0.02)
+        self.assertGreaterEqual(stages[0]["CPUSeconds"], 0)
+        self.assertEqual(stages[0]["PeakMemoryBytes"], None)
+        self.assertIs(timer.getSlowestStage(), stages[0])
+
+    def testStageIsMeasuredWhenItFails(self):
+
+        timer = StageTimer()
+        with self.assertRaises(ValueError):
+            with timer.measure("Failing"):
+                raise ValueError("stage failed")
+
+        self.assertEqual(len(timer.getStages()), 1)
+        self.assertIn("WallSeconds", timer.getStages()[0])
+
+    def testPeakMemoryIsTraced(self):
+
+        timer = StageTimer(TraceMemory=True)
+        try:
+            with timer.measure("Allocation"):
+                data = bytearray(4 * 1024 * 1024)
+                del data
+            with timer.measure("Nothing"):
+                pass
+        finally:
+            timer.stop()
+
+        allocation, nothing = timer.getStages()
+        self.assertGreaterEqual(allocation["PeakMemoryBytes"], 4 * 1024 * 1024)
+        self.assertLess(nothing["PeakMemoryBytes"], 1024 * 1024)
+
+    def testItemsAreMeasuredConcurrently(self):
+
+        timer = StageTimer()
+
+        def measureRequest(URL: str):
+            with timer.measureItem("HTTPRequest", URL=URL) as measurement:
+                time.sleep(0.01)
+                measurement["Status"] = 200
+            return None
+
+        threads = [threading.Thread(target=measureRequest, args=(f"URL{i}",)) for i in range(8)]
+        with timer.measure("Download"):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(sorted(item["URL"] for item in timer.getItems()), [f"URL{i}" for i in range(8)])
+        self.assertTrue(all(item["Status"] == 200 for item in timer.getItems()))
+        self.assertTrue(all(item["WallSeconds"] >= 0.01 for item in timer.getItems()))
+        self.assertEqual(len(timer.getStages()), 1)
+
+    def testDisabledTimer(self):
+
+        timer = StageTimer(Enabled=False)
+        with timer.measure("Download", Funds="2") as measurement:
+            self.assertEqual(measurement, {"Stage": "Download", "Funds": "2"})
+        with timer.measureItem("HTTPRequest"):
+            pass
+
+        self.assertFalse(timer.isEnabled())
+        self.assertEqual(timer.getStages(), [])
+        self.assertEqual(timer.getItems(), [])
+        self.assertEqual(timer.getSlowestStage(), None)
+
+    def testSaveReportAndSlowestStageProfile(self):
+
+        timer = StageTimer(ProfileStages=True)
+        with timer.measure("Fast"):
+            pass
+        with timer.measure("Slow"):
+            time.sleep(0.02)
+        with timer.measureItem("Item", Name="first"):
+            pass
+
+        with tempfile.TemporaryDirectory() as directoryPath:
+            self.assertEqual(timer.saveSlowestStageProfile(f"{directoryPath}/Slowest.pstats"), "Slow")
+            self.assertGreater(pstats.Stats(f"{directoryPath}/Slowest.pstats").total_calls, 0)
+
+            timer.saveJSON(f"{directoryPath}/Profile.json", {"Engine": "NumPy"})
+            with open(f"{directoryPath}/Profile.json", "r") as reportFile:
+                report = json.loads(reportFile.read())
+
+        self.assertEqual(report["Engine"], "NumPy")
+        self.assertEqual([stage["Stage"] for stage in report["Stages"]], ["Fast", "Slow"])
+        self.assertEqual(report["Items"][0]["Name"], "first")
+
+    def testProfileIsNotSavedIfStagesWereNotProfiled(self):
+
+        timer = StageTimer()
+        with timer.measure("Stage"):
+            pass
+
+        self.assertEqual(timer.saveSlowestStageProfile("not_saved.pstats"), None)
+
+
+if __name__ == "__main__":
+    unittest.main()